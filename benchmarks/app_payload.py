@@ -0,0 +1,153 @@
+"""
+Per-rerun payload and client CPU of the Streamlit app
+
+Runs the app headlessly with Streamlit's AppTest, reruns it, and reports the bytes of
+the element messages a rerun sends to the browser, by element type, plus the injected
+HTML/script assets among them, and the wall and CPU time of a rerun. --compare REV
+measures the whole tree as of a git revision (app and engine, in a separate process)
+alongside the working tree, e.g. the commit before a change.
+
+With --url, also loads a running app in headless Chromium (needs playwright) and
+reports the page's main-thread task and script time per second while it sits idle,
+which is where client-side polling shows up.
+
+Usage:
+    python benchmarks/app_payload.py [--compare HEAD~1] [--reruns 5]
+    python benchmarks/app_payload.py --url http://localhost:8501 --seconds 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = 'net_yield_simulator_app.py'
+
+# Element types that carry injected assets rather than app content
+ASSET_TYPES = ['markdown', 'html', 'iframe', 'unknown']
+
+def require_apptest():
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        raise ImportError("The payload benchmark needs streamlit (pip install -r requirements.txt)") from None
+    return AppTest
+
+def _nodes(node):
+    yield node
+    for child in getattr(node, 'children', {}).values():
+        yield from _nodes(child)
+
+def rerun_payload(app):
+    """Bytes of every element message of the last run, by element type"""
+    sizes = Counter()
+    for root in (app.main, app.sidebar):
+        for node in _nodes(root):
+            # Blocks only lay out their children; the elements carry the content
+            if not hasattr(node, 'children'):
+                sizes[node.type] += len(node.proto.SerializeToString())
+    return sizes
+
+def measure_app(tree, reruns):
+    """Median rerun payload by element type, rerun seconds and rerun CPU seconds of the app in a tree"""
+    AppTest = require_apptest()
+    if tree not in sys.path:
+        sys.path.insert(0, tree)
+    app = AppTest.from_file(os.path.join(tree, APP_SCRIPT), default_timeout=120)
+    app.run()
+    payloads = []
+    seconds = []
+    cpu = []
+    for _ in range(reruns):
+        start, start_cpu = time.perf_counter(), time.process_time()
+        app.run()
+        seconds.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - start_cpu)
+        if app.exception:
+            raise RuntimeError(f"the app in {tree} raised: {app.exception[0].value}")
+        payloads.append(rerun_payload(app))
+    types = sorted({name for payload in payloads for name in payload})
+    median = {name: statistics.median(payload[name] for payload in payloads) for name in types}
+    return median, statistics.median(seconds), statistics.median(cpu)
+
+def tree_at_revision(revision, directory):
+    """Extract the whole tree as of a git revision into directory"""
+    archive = subprocess.run(['git', 'archive', revision], cwd=REPO_ROOT, capture_output=True, check=True).stdout
+    subprocess.run(['tar', '-x', '-C', directory], input=archive, check=True)
+    return directory
+
+def measure_revision(revision, reruns):
+    """measure_app for the tree at a revision, in a fresh interpreter so its engine is the one imported"""
+    with tempfile.TemporaryDirectory() as directory:
+        tree_at_revision(revision, directory)
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--tree', directory, '--json',
+                                 '--reruns', str(reruns)], capture_output=True, text=True, check=True).stdout
+    payload, seconds, cpu = json.loads(output)
+    return payload, seconds, cpu
+
+def client_cpu(url, seconds):
+    """Main-thread task and script seconds per second of an idle page in headless Chromium"""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise ImportError("--url needs playwright (pip install playwright && playwright install chromium)") from None
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        page.goto(url, wait_until='networkidle')
+        page.wait_for_selector('[data-testid="stDataFrame"]', timeout=60000)
+        session = page.context.new_cdp_session(page)
+        session.send('Performance.enable')
+
+        def metrics():
+            return {metric['name']: metric['value'] for metric in session.send('Performance.getMetrics')['metrics']}
+
+        before = metrics()
+        page.wait_for_timeout(seconds * 1000)
+        after = metrics()
+        browser.close()
+    return {name: (after[name] - before[name]) / seconds for name in ('TaskDuration', 'ScriptDuration')}
+
+def report(label, payload, seconds, cpu):
+    total = sum(payload.values())
+    assets = sum(payload.get(name, 0) for name in ASSET_TYPES)
+    print(f"{label}: {total:,.0f} bytes per rerun ({assets:,.0f} in markdown/HTML assets), "
+          f"rerun {seconds * 1000:.0f} ms wall, {cpu * 1000:.0f} ms CPU")
+    for name, size in sorted(payload.items(), key=lambda item: -item[1]):
+        print(f"  {name:<20} {size:>10,.0f}")
+    return total
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--compare', metavar='REV', help="also measure the app as of this git revision")
+    parser.add_argument('--url', help="measure idle client CPU of a running app at this URL")
+    parser.add_argument('--seconds', type=float, default=10.0, help="idle window for --url")
+    parser.add_argument('--tree', default=REPO_ROOT, help=argparse.SUPPRESS)
+    parser.add_argument('--json', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(measure_app(args.tree, args.reruns)))
+        return 0
+
+    if args.url:
+        usage = client_cpu(args.url, args.seconds)
+        print(f"client CPU while idle: {usage['TaskDuration'] * 1000:.1f} ms/s of tasks, "
+              f"{usage['ScriptDuration'] * 1000:.1f} ms/s of script")
+        return 0
+
+    current = report('working tree', *measure_app(args.tree, args.reruns))
+    if args.compare:
+        before = report(args.compare, *measure_revision(args.compare, args.reruns))
+        print(f"change: {current - before:+,.0f} bytes per rerun ({(current - before) / before:+.1%})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
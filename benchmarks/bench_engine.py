@@ -0,0 +1,225 @@
+"""
+Benchmark suite for the pricing engine hot paths
+
+Measures single-note latency of each pricing stage, batch throughput (notes/sec) and
+peak traced memory across representative note configurations, and saves the results
+as a JSON baseline. Each metric is the median over --runs runs of the whole suite, so
+one noisy run does not move it. A later run can be compared against a baseline; metrics
+that got worse by more than the threshold (25% by default) are reported and make the
+run exit non-zero. benchmarks/baseline.json is a committed full run; compare like with
+like (a --quick run against a --quick baseline) and on the same machine.
+
+Usage:
+    python benchmarks/bench_engine.py --save benchmarks/baseline.json
+    python benchmarks/bench_engine.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from net_yield_engine import (  # noqa: E402
+    NoteParams,
+    build_cashflow_schedule,
+    calculate_days360,
+    calculate_workday,
+    default_rate_index,
+    price_columns,
+    price_note,
+    price_terms,
+    solve_xirr,
+    solve_xirr_batch,
+)
+
+BASE_PARAMS = NoteParams(trade_date=date(2025, 1, 6))
+
+# Representative notes: short tenor, the sidebar default, long quarterly and bullet coupons
+CONFIGURATIONS = {
+    'short_0.1y': dict(tenor_years=0.1, financing_tenor=1),
+    'default_3y': dict(),
+    'quarterly_10y': dict(tenor_years=10.0, interest_freq="Quarterly", coupon_freq="Quarterly", financing_tenor=60),
+    'at_maturity_3y': dict(coupon_freq="At Maturity"),
+}
+
+def time_call(function, repeat, number):
+    """Fastest seconds per call over repeat rounds of number calls
+
+    The fastest round is the one least disturbed by the rest of the machine (as timeit
+    advises), so it is the most repeatable figure to compare.
+    """
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        rounds.append((time.perf_counter() - start) / number)
+    return min(rounds)
+
+def peak_memory(function):
+    """Peak traced allocation in bytes while running function once (timed separately)"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def metric(value, unit, better):
+    return {'value': value, 'unit': unit, 'better': better}
+
+def latency_metrics(repeat, number):
+    """Single-note latency of each stage for every configuration"""
+    rate_index = default_rate_index()
+    results = {}
+    for name, overrides in CONFIGURATIONS.items():
+        params = replace(BASE_PARAMS, **overrides)
+        terms = price_terms(params)
+        schedule = terms['schedule']
+        periods = schedule.year_fractions()
+
+        stages = {
+            'calculate_workday': lambda: calculate_workday(params.trade_date, params.days_to_settle),
+            'calculate_days360': lambda: calculate_days360(terms['issue_date'], terms['maturity_date']),
+            'rate_lookup': lambda: rate_index.borrowing_components(
+                params.floating_ref, params.financing_tenor, params.lender, params.rate_interpolation),
+            'build_cashflow_schedule': lambda: build_cashflow_schedule(
+                params.equity, terms['loan_notional'], terms['total_invested'], terms['total_borrowing_cost'],
+                params.coupon_rate, terms['issue_date'], terms['maturity_date'],
+                params.interest_freq, params.coupon_freq),
+            'solve_xirr': lambda: solve_xirr(periods, schedule.total),
+            'price_note': lambda: price_note(params),
+        }
+        for stage, function in stages.items():
+            results[f'latency.{stage}.{name}'] = metric(time_call(function, repeat, number), 's', 'lower')
+    return results
+
+def batch_params(count, seed=0):
+    """Deterministic mix of notes across all configurations and typical sweep ranges"""
+    rng = np.random.default_rng(seed)
+    names = list(CONFIGURATIONS)
+    params = []
+    for i in range(count):
+        overrides = dict(CONFIGURATIONS[names[i % len(names)]])
+        overrides.update(ltv=float(rng.uniform(0.5, 0.9)), coupon_rate=float(rng.uniform(0.03, 0.12)),
+                         lender=str(rng.choice(["CAI", "DB", "SG", "Barc"])))
+        params.append(replace(BASE_PARAMS, **overrides))
+    return params
+
+def throughput_metrics(batch_size, xirr_rows):
+    """Batch pricing and batched XIRR throughput, plus peak traced memory of each"""
+    results = {}
+    params = batch_params(batch_size)
+
+    elapsed = time_call(lambda: price_columns(params), 3, 1)
+    results['throughput.price_columns'] = metric(batch_size / elapsed, 'notes/s', 'higher')
+    results['memory.price_columns'] = metric(peak_memory(lambda: price_columns(params)), 'bytes', 'lower')
+
+    # Batched XIRR on tiled copies of the sample schedules
+    schedules = [price_terms(p)['schedule'] for p in params[:len(CONFIGURATIONS)]]
+    width = max(len(schedule) for schedule in schedules)
+    periods = np.zeros((xirr_rows, width))
+    cashflows = np.zeros((xirr_rows, width))
+    for i in range(xirr_rows):
+        schedule = schedules[i % len(schedules)]
+        periods[i, :len(schedule)] = schedule.year_fractions()
+        cashflows[i, :len(schedule)] = schedule.total * (1 + 0.001 * (i % 97))
+
+    elapsed = time_call(lambda: solve_xirr_batch(periods, cashflows), 3, 1)
+    results['throughput.solve_xirr_batch'] = metric(xirr_rows / elapsed, 'schedules/s', 'higher')
+    results['memory.solve_xirr_batch'] = metric(peak_memory(lambda: solve_xirr_batch(periods, cashflows)), 'bytes', 'lower')
+    return results
+
+def run_suite(quick=False, runs=3):
+    """Results of the suite, each metric the median over runs runs"""
+    repeat, number = (3, 20) if quick else (7, 100)
+    batch_size, xirr_rows = (500, 10000) if quick else (5000, 100000)
+    samples = []
+    for _ in range(runs):
+        sample = latency_metrics(repeat, number)
+        sample.update(throughput_metrics(batch_size, xirr_rows))
+        samples.append(sample)
+    metrics = {
+        name: dict(entry, value=statistics.median(sample[name]['value'] for sample in samples))
+        for name, entry in samples[0].items()
+    }
+    return {
+        'metadata': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'quick': quick,
+            'runs': runs,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'metrics': metrics,
+    }
+
+def compare(current, baseline, threshold_pct):
+    """Rows of (name, baseline, current, change %, regressed) for metrics in both runs"""
+    rows = []
+    for name, old in baseline['metrics'].items():
+        new = current['metrics'].get(name)
+        if new is None or not old['value']:
+            continue
+        change = (new['value'] - old['value']) / old['value'] * 100
+        worse = change if old['better'] == 'lower' else -change
+        rows.append((name, old['value'], new['value'], change, worse > threshold_pct))
+    return rows
+
+def format_value(value, unit):
+    if unit == 's':
+        return f"{value * 1e6:10.1f} us"
+    if unit == 'bytes':
+        return f"{value / 2**20:10.2f} MB"
+    return f"{value:10.0f} {unit}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--save', metavar='PATH', help="write results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare against a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=25.0, help="regression threshold in percent")
+    parser.add_argument('--runs', type=int, default=3, help="runs of the suite to take each metric's median over")
+    parser.add_argument('--quick', action='store_true', help="fewer repetitions and smaller batches")
+    args = parser.parse_args()
+
+    current = run_suite(quick=args.quick, runs=args.runs)
+    for name, entry in current['metrics'].items():
+        print(f"{name:55s} {format_value(entry['value'], entry['unit'])}")
+
+    if args.save:
+        with open(args.save, 'w') as handle:
+            json.dump(current, handle, indent=2)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        if baseline['metadata'].get('quick') != args.quick:
+            print(f"\nWarning: {args.compare} was saved {'with' if baseline['metadata'].get('quick') else 'without'} "
+                  f"--quick; its batch sizes differ from this run")
+        rows = compare(current, baseline, args.threshold)
+        regressions = [row for row in rows if row[4]]
+        print(f"\nComparison with {args.compare} (threshold {args.threshold:.0f}%):")
+        for name, old, new, change, regressed in rows:
+            flag = 'REGRESSION' if regressed else ''
+            print(f"{name:55s} {change:+7.1f}% {flag}")
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed beyond {args.threshold:.0f}%")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Cold-import benchmark for the headless pricing engine
+
+Imports net_yield_engine in fresh interpreters, reports the median wall time next to
+the cost of its own dependencies (NumPy and dateutil), and checks that no UI or
+DataFrame packages are pulled in. The budget applies to the engine's overhead on top
+of those dependencies, which is the part this package controls; NumPy alone takes
+around 100 ms on a slow machine. Exits non-zero when the median overhead exceeds it.
+
+Usage: python benchmarks/import_time.py [--runs 15] [--budget-ms 60]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the engine must never import (asyncio and process pools only load with the
+# service, sweep and portfolio modules, which the package exports lazily)
+FORBIDDEN_MODULES = ['streamlit', 'pandas', 'plotly', 'xlsxwriter', 'asyncio', 'concurrent.futures',
+                     'multiprocessing']
+
+TIMER_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'modules': sorted(sys.modules)}}))
+"""
+
+def time_import(imports):
+    """Time one cold import in a fresh interpreter; returns (milliseconds, loaded modules)"""
+    output = subprocess.run(
+        [sys.executable, '-c', TIMER_SNIPPET.format(imports=imports)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    sample = json.loads(output)
+    return sample['ms'], sample['modules']
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=60.0, help="budget for the engine's own overhead")
+    args = parser.parse_args()
+
+    # Alternate the two imports so drift in machine load hits both alike
+    dependency_times = []
+    engine_samples = []
+    for _ in range(args.runs):
+        dependency_times.append(time_import('import numpy, dateutil.relativedelta')[0])
+        engine_samples.append(time_import('import net_yield_engine'))
+    engine_times = [ms for ms, _ in engine_samples]
+
+    engine_median = statistics.median(engine_times)
+    dependency_median = statistics.median(dependency_times)
+    overhead = statistics.median(engine - dependency for engine, dependency in zip(engine_times, dependency_times))
+    print(f"numpy + dateutil:  {dependency_median:7.1f} ms (median of {args.runs})")
+    print(f"net_yield_engine:  {engine_median:7.1f} ms (median of {args.runs})")
+    print(f"engine overhead:   {overhead:7.1f} ms (median of paired differences)")
+
+    loaded = set(engine_samples[0][1])
+    leaked = [name for name in FORBIDDEN_MODULES if name in loaded]
+    if leaked:
+        print(f"FAIL: engine import pulled in {', '.join(leaked)}")
+        return 1
+    if overhead > args.budget_ms:
+        print(f"FAIL: engine overhead exceeds the {args.budget_ms:.0f} ms budget")
+        return 1
+    print(f"OK: within the {args.budget_ms:.0f} ms budget")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
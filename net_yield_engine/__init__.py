@@ -0,0 +1,136 @@
+"""
+Net Yield Simulator pricing engine
+Headless calculation code shared by the Streamlit app and batch jobs
+"""
+
+import importlib
+
+from net_yield_engine.book import BOOK_FIELDS, BookResult, NoteBook, NoteSpec, price_book
+from net_yield_engine.cache import CacheStats, ScenarioCache, scenario_key
+from net_yield_engine.calendars import BUSINESS_DAY_CONVENTIONS, WEEKENDS_ONLY, BusinessCalendar, read_holiday_file
+from net_yield_engine.curve import INTERPOLATION_METHODS, RateCurve
+from net_yield_engine.dates import (
+    calculate_days360,
+    calculate_maturity_date,
+    calculate_term,
+    calculate_workday,
+    maturity_dates,
+    rounded_term_years,
+    settlement_dates,
+)
+from net_yield_engine.daycount import (
+    DAYCOUNT_CONVENTIONS,
+    accrued,
+    day_count,
+    days360,
+    period_year_fractions,
+    term_year_fraction,
+    year_fraction,
+)
+from net_yield_engine.export import (
+    CsvColumnWriter,
+    ParquetColumnWriter,
+    XlsxColumnWriter,
+    export_chunks,
+    open_writer,
+    write_note_workbook,
+)
+from net_yield_engine.graph import NodeTiming, StageGraph, pricing_graph, pricing_sources
+from net_yield_engine.greeks import BASIS_POINT, SENSITIVITY_INPUTS, Sensitivities, note_sensitivities
+from net_yield_engine.history import (
+    HISTORY_COLUMNS,
+    RateIndexHistory,
+    price_note_as_of,
+    read_rate_index_history,
+    reprice_history,
+)
+from net_yield_engine.instrumentation import (
+    HitRate,
+    Instrumentation,
+    StageStats,
+    XirrStats,
+    graph_collector,
+    lru_collector,
+)
+from net_yield_engine.montecarlo import (
+    RATE_MODELS,
+    MonteCarloResult,
+    forward_reference_rates,
+    simulate_note,
+    simulate_reference_rates,
+    simulation_percentiles,
+)
+from net_yield_engine.pricer import (
+    PRICE_COLUMNS,
+    NoteParams,
+    PricingResult,
+    price_columns,
+    price_note,
+    price_notes,
+    price_terms,
+    required_coupon_rate,
+)
+from net_yield_engine.rates import (
+    RATE_INDEX_PATH,
+    RateComponents,
+    RateIndex,
+    RateIndexLookupError,
+    RateIndexSource,
+    compile_rate_index_snapshot,
+    default_rate_index,
+    default_rate_source,
+    load_rate_index_snapshot,
+    read_rate_index_file,
+)
+from net_yield_engine.schedule import (
+    SCHEDULE_PERIODS,
+    CashflowSchedule,
+    ScheduleBuffer,
+    ScheduleSummary,
+    add_months,
+    aggregate_schedule,
+    build_cashflow_schedule,
+    build_schedule_buffer,
+    calculate_cashflow,
+    generate_xirr_cashflows,
+)
+from net_yield_engine.solve import SOLVE_FOR, SOLVE_TARGETS, solve_required
+from net_yield_engine.xirr import (
+    BatchXirrResult,
+    XirrResult,
+    calculate_xirr,
+    pad_ragged,
+    solve_xirr,
+    solve_xirr_batch,
+    solve_xirr_ragged,
+    xirr_year_fractions,
+)
+
+# Modules that pull in process pools or asyncio are imported on first use, so that
+# importing the engine stays cheap for callers that only price notes
+_LAZY_EXPORTS = {
+    'iter_priced_chunks': 'portfolio',
+    'price_portfolio': 'portfolio',
+    'PricingService': 'service',
+    'RequestBatcher': 'service',
+    'load_test': 'service',
+    'price_requests': 'service',
+    'xirr_requests': 'service',
+    'GRID_COLUMNS': 'sweep',
+    'GridResult': 'sweep',
+    'SweepGrid': 'sweep',
+    'iter_sweep': 'sweep',
+    'price_grid': 'sweep',
+    'run_sweep': 'sweep',
+}
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
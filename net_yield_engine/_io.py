@@ -0,0 +1,23 @@
+"""
+File helpers
+Format detection and optional-dependency checks shared by the data readers and writers
+"""
+
+import os
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet files need pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+def file_format(path):
+    """'csv', 'parquet' or 'xlsx' from a file extension"""
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension in ('.parquet', '.pq'):
+        return 'parquet'
+    if extension == '.xlsx':
+        return 'xlsx'
+    return 'csv'
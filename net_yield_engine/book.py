@@ -0,0 +1,299 @@
+"""
+Columnar note books
+Struct-of-arrays note storage and vectorized pricing into one flat cash flow buffer
+"""
+
+from collections import namedtuple
+from collections.abc import Mapping
+from dataclasses import fields
+
+import numpy as np
+
+from net_yield_engine.dates import maturity_dates, rounded_term_years, settlement_dates
+from net_yield_engine.daycount import term_year_fraction
+from net_yield_engine.pricer import NoteParams, borrowing_rates
+from net_yield_engine.rates import RateIndexLookupError, default_rate_index
+from net_yield_engine.schedule import ScheduleBuffer, build_schedule_buffer, payment_frequency_months
+from net_yield_engine.xirr import solve_xirr_ragged
+
+# Storage of each NoteParams field; text fields are stored as codes into per-book categories
+BOOK_DTYPES = {
+    'trade_date': 'datetime64[D]',
+    'days_to_settle': np.int32,
+    'tenor_years': np.float64,
+    'asset_daycount': object,
+    'financing_tenor': np.float64,
+    'liability_daycount': object,
+    'interest_freq': object,
+    'coupon_freq': object,
+    'coupon_rate': np.float64,
+    'equity': np.float64,
+    'ltv': np.float64,
+    'lender': object,
+    'floating_ref': object,
+    'rate_interpolation': object,
+}
+BOOK_FIELDS = [field.name for field in fields(NoteParams)]
+CATEGORICAL_FIELDS = [name for name in BOOK_FIELDS if BOOK_DTYPES[name] is object]
+
+_DEFAULTS = NoteParams()
+
+class NoteSpec:
+    """Inputs of one note as a __slots__ record, one slot per NoteParams field
+
+    A lighter stand-in for NoteParams when notes are built or read one at a time;
+    unset fields take the NoteParams defaults. NoteBook.from_specs packs a list of
+    them into columns and indexing a NoteBook gives one back.
+    """
+
+    __slots__ = tuple(BOOK_FIELDS)
+
+    def __init__(self, **values):
+        unknown = [name for name in values if name not in BOOK_DTYPES]
+        if unknown:
+            raise TypeError(f"Unknown NoteSpec fields {unknown}")
+        for name in BOOK_FIELDS:
+            setattr(self, name, values[name] if name in values else getattr(_DEFAULTS, name))
+
+    @classmethod
+    def from_params(cls, params):
+        return cls(**{name: getattr(params, name) for name in BOOK_FIELDS})
+
+    def __eq__(self, other):
+        if not isinstance(other, NoteSpec):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in BOOK_FIELDS)
+
+    def __repr__(self):
+        return f"NoteSpec({', '.join(f'{name}={getattr(self, name)!r}' for name in BOOK_FIELDS)})"
+
+    def to_params(self):
+        return NoteParams(**{name: getattr(self, name) for name in BOOK_FIELDS})
+
+class NoteBook:
+    """Struct-of-arrays storage for many notes
+
+    Numeric fields are NumPy columns; text fields (daycounts, frequencies, lender,
+    floating ref, interpolation) are small integer codes into per-field category
+    lists, so a note costs a few dozen bytes rather than a NoteParams object and its
+    values. Indexing gives the note's NoteSpec; slicing gives a NoteBook sharing
+    the columns.
+    """
+
+    def __init__(self, columns, categories):
+        self.columns = columns
+        self.categories = categories
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("NoteBook columns differ in length")
+
+    @classmethod
+    def from_columns(cls, values):
+        """Book from a mapping of NoteParams field name to a sequence of values
+
+        Missing fields take the NoteParams defaults.
+        """
+        count = len(next(iter(values.values()))) if values else 0
+        columns = {}
+        categories = {}
+        for name in BOOK_FIELDS:
+            column = values.get(name)
+            if column is None:
+                column = [getattr(_DEFAULTS, name)] * count
+            if BOOK_DTYPES[name] is object:
+                labels = list(column)
+                distinct = list(dict.fromkeys(labels))
+                lookup = {label: code for code, label in enumerate(distinct)}
+                codes = np.fromiter((lookup[label] for label in labels), dtype=_code_dtype(len(distinct)),
+                                    count=len(labels))
+                columns[name] = codes
+                categories[name] = distinct
+            else:
+                columns[name] = np.asarray(column, dtype=BOOK_DTYPES[name])
+        return cls(columns, categories)
+
+    @classmethod
+    def from_params(cls, params_list):
+        """Book from NoteParams (or mappings of their fields)"""
+        params_list = [NoteParams(**params) if isinstance(params, Mapping) else params for params in params_list]
+        return cls.from_columns({name: [getattr(params, name) for params in params_list] for name in BOOK_FIELDS})
+
+    @classmethod
+    def from_specs(cls, specs):
+        """Book from NoteSpec records"""
+        return cls.from_columns({name: [getattr(spec, name) for spec in specs] for name in BOOK_FIELDS})
+
+    def __len__(self):
+        return len(self.columns['trade_date'])
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            index = int(item) + len(self) if item < 0 else int(item)
+            if not 0 <= index < len(self):
+                raise IndexError("NoteBook index out of range")
+            return self.spec(index)
+        return NoteBook({name: column[item] for name, column in self.columns.items()}, self.categories)
+
+    def __iter__(self):
+        return (self.spec(index) for index in range(len(self)))
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    def value(self, name, index):
+        """Python value of one field of one note"""
+        value = self.columns[name][index]
+        if name in self.categories:
+            return self.categories[name][value]
+        return value.item()
+
+    def column(self, name):
+        """Decoded values of one field (an object array for text fields)"""
+        if name in self.categories:
+            return np.array(self.categories[name], dtype=object)[self.columns[name]]
+        return self.columns[name]
+
+    def spec(self, index):
+        """NoteSpec of one note"""
+        return NoteSpec(**{name: self.value(name, index) for name in BOOK_FIELDS})
+
+    def params(self, index):
+        """NoteParams of one note"""
+        return NoteParams(**{name: self.value(name, index) for name in BOOK_FIELDS})
+
+def _code_dtype(count):
+    return np.int8 if count <= 127 else np.int16 if count <= 32767 else np.int32
+
+BookResult = namedtuple('BookResult', ['columns', 'schedules'])
+
+def _groups(*codes):
+    """Group id of each row over combinations of code columns, and one row per group"""
+    key = np.zeros(len(codes[0]), dtype=np.int64)
+    for code in codes:
+        distinct, inverse = np.unique(code, return_inverse=True)
+        key = key * len(distinct) + inverse.reshape(-1)
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    return inverse.reshape(-1), first
+
+def _empty_schedules(count):
+    """ScheduleBuffer of count notes without any rows"""
+    empty = np.empty(0)
+    return ScheduleBuffer(np.empty(0, dtype='datetime64[D]'), empty, empty, empty, empty,
+                          np.zeros(count + 1, dtype=np.int64))
+
+def price_book(book, rate_index=None):
+    """Price a NoteBook into PRICE_COLUMNS and one ScheduleBuffer of every schedule
+
+    Dates, funding and net yield are computed across the whole book at once. The rate
+    lookup runs once per distinct (floating ref, tenor, lender, interpolation) and
+    every schedule is built by build_schedule_buffer in a few array passes, so the
+    Python-level work grows with the number of distinct terms rather than with the
+    number of notes.
+    Results match price_columns; notes that cannot be priced come back as NaN with
+    priced=False and the reason in error.
+    """
+    if rate_index is None:
+        rate_index = default_rate_index()
+    count = len(book)
+    columns = {
+        'issue_date': np.full(count, np.datetime64('NaT'), dtype='datetime64[D]'),
+        'maturity_date': np.full(count, np.datetime64('NaT'), dtype='datetime64[D]'),
+        'total_borrowing_cost': np.full(count, np.nan),
+        'net_yield_pa': np.full(count, np.nan),
+        'xirr': np.full(count, np.nan),
+        'xirr_converged': np.zeros(count, dtype=bool),
+        'priced': np.ones(count, dtype=bool),
+        'error': np.full(count, '', dtype=object),
+    }
+    data = book.columns
+    categories = book.categories
+    if count == 0:
+        return BookResult(columns, _empty_schedules(0))
+
+    def fail(rows, error):
+        # Keep the first error of each note, as price_terms raises at its first failing stage
+        rows = rows & columns['priced']
+        columns['priced'][rows] = False
+        columns['error'][rows] = f"{type(error).__name__}: {error}"
+
+    # Dates & tenor
+    issue = settlement_dates(data['trade_date'], data['days_to_settle'])
+    maturity = maturity_dates(issue, data['tenor_years'])
+    term_years = rounded_term_years((maturity - issue).astype(np.int64) + 1)
+
+    # Funding plan
+    equity = data['equity']
+    ltv = data['ltv']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        loan_ratio = np.where(ltv < 1, ltv / (1 - ltv), 0.0)
+    total_invested = equity * (1 + loan_ratio)
+    loan_notional = total_invested - equity
+
+    # Borrowing costs, looked up once per distinct combination
+    total_borrowing_cost = np.full(count, np.nan)
+    rate_group, rate_first = _groups(data['floating_ref'], data['financing_tenor'].view(np.int64),
+                                     data['lender'], data['rate_interpolation'])
+    for group, row in enumerate(rate_first.tolist()):
+        rows = rate_group == group
+        try:
+            rates = borrowing_rates(rate_index, book.value('floating_ref', row), book.value('financing_tenor', row),
+                                    book.value('lender', row), book.value('rate_interpolation', row))
+        except (RateIndexLookupError, ValueError) as error:
+            fail(rows, error)
+            continue
+        total_borrowing_cost[rows] = rates['total_borrowing_cost']
+
+    # Term daycount fractions, per convention
+    fractions = {}
+    for name in ('asset_daycount', 'liability_daycount'):
+        fractions[name] = np.full(count, np.nan)
+        for code, convention in enumerate(categories[name]):
+            rows = data[name] == code
+            if not rows.any():
+                continue
+            try:
+                fractions[name][rows] = term_year_fraction(convention, issue[rows], maturity[rows])
+            except ValueError as error:
+                fail(rows, error)
+
+    coupon_cashflow = total_invested * data['coupon_rate'] * fractions['asset_daycount']
+    borrowing_cost = loan_notional * total_borrowing_cost * fractions['liability_daycount']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        net_yield_pa = np.where(term_years > 0, (coupon_cashflow - borrowing_cost) / (equity * term_years), 0.0)
+
+    # Payment frequencies as months between payments (0 for At Maturity)
+    months = {}
+    for name in ('interest_freq', 'coupon_freq'):
+        months[name] = np.zeros(count, dtype=np.int64)
+        for code, frequency in enumerate(categories[name]):
+            rows = data[name] == code
+            try:
+                months[name][rows] = payment_frequency_months(frequency) or 0
+            except ValueError as error:
+                fail(rows, error)
+
+    # Every priced note's schedule, built across the book into one buffer
+    priced = columns['priced']
+    if not priced.any():
+        return BookResult(columns, _empty_schedules(count))
+    built = build_schedule_buffer(
+        equity[priced], loan_notional[priced], total_invested[priced], total_borrowing_cost[priced],
+        data['coupon_rate'][priced], issue[priced], maturity[priced], months['interest_freq'][priced],
+        months['coupon_freq'][priced], book.column('liability_daycount')[priced],
+        book.column('asset_daycount')[priced]
+    )
+    lengths = np.zeros(count, dtype=np.int64)
+    lengths[priced] = np.diff(built.offsets)
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    schedules = ScheduleBuffer(built.dates, built.principal, built.interest, built.coupon, built.total, offsets)
+
+    batch = solve_xirr_ragged(schedules.year_fractions(), schedules.total, offsets)
+    columns['issue_date'][priced] = issue[priced]
+    columns['maturity_date'][priced] = maturity[priced]
+    columns['total_borrowing_cost'][priced] = total_borrowing_cost[priced]
+    columns['net_yield_pa'][priced] = net_yield_pa[priced]
+    columns['xirr'][priced] = batch.rates[priced]
+    columns['xirr_converged'][priced] = batch.converged[priced]
+    return BookResult(columns, schedules)
@@ -0,0 +1,141 @@
+"""
+Scenario result cache
+Content-addressed LRU cache in front of the headless pricer and the pricing service
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from dataclasses import fields
+from datetime import date
+
+import numpy as np
+
+from net_yield_engine.pricer import NoteParams, price_note
+from net_yield_engine.rates import default_rate_index
+
+CacheStats = namedtuple('CacheStats', ['hits', 'misses', 'evictions', 'entries', 'bytes', 'max_bytes', 'hit_rate'])
+
+# Rough footprint of a PricingResult apart from its schedule arrays
+RESULT_OVERHEAD_BYTES = 2048
+
+def _canonical(value):
+    """Normalize one input so equal scenarios serialize identically"""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return repr(float(value))
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, np.datetime64):
+        return str(np.datetime64(value, 'D'))
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+def scenario_key(params, rate_index_version=None):
+    """Canonical SHA-256 key of all pricing inputs
+
+    Numbers are compared by value (12 and 12.0 give the same key) and dates by day.
+    rate_index_version (RateIndex.version) keys results to the market data they used.
+    """
+    if isinstance(params, Mapping):
+        params = NoteParams(**params)
+    values = {field.name: _canonical(getattr(params, field.name)) for field in fields(params)}
+    if rate_index_version is not None:
+        values['rate_index_version'] = rate_index_version
+    payload = json.dumps(values, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def estimate_result_bytes(result):
+    """Approximate memory held by a cached PricingResult"""
+    return RESULT_OVERHEAD_BYTES + sum(column.nbytes for column in result.schedule)
+
+class ScenarioCache:
+    """LRU cache of PricingResults keyed on scenario_key, bounded by memory and entry count
+
+    Thread-safe so one instance can be shared by every session of a deployment. Cached
+    schedule arrays are made read-only because callers share them.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entries=None, rate_index=None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.rate_index = rate_index
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Cached result for key (marking it most recently used), or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result, size=None):
+        """Store a result, evicting least recently used entries beyond the limits
+
+        Without a size the result is taken to be a PricingResult: its schedule is made
+        read-only and its footprint estimated. Other results (e.g. the service's JSON
+        responses) pass their own size in bytes.
+        """
+        if size is None:
+            for column in result.schedule:
+                column.setflags(write=False)
+            size = estimate_result_bytes(result)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while self._entries and (self._bytes > self.max_bytes or
+                                     (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def price_note(self, params):
+        """price_note with caching; pricing errors are raised and not cached"""
+        if isinstance(params, Mapping):
+            params = NoteParams(**params)
+        rate_index = default_rate_index() if self.rate_index is None else self.rate_index
+        key = scenario_key(params, rate_index.version)
+        result = self.get(key)
+        if result is None:
+            result = price_note(params, rate_index)
+            self.put(key, result)
+        return result
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Snapshot of hit/miss/eviction counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hit_rate=self.hits / lookups if lookups else 0.0,
+            )
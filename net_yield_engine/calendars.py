@@ -0,0 +1,121 @@
+"""
+Business-day calendars
+Weekend and holiday aware settlement and payment date arithmetic over datetime64 arrays
+"""
+
+import csv
+
+import numpy as np
+
+# Business day conventions mapped to numpy busday_offset roll modes (None leaves dates as generated)
+BUSINESS_DAY_CONVENTIONS = {
+    "Unadjusted": None,
+    "Following": 'following',
+    "Modified Following": 'modifiedfollowing',
+    "Preceding": 'preceding',
+    "Modified Preceding": 'modifiedpreceding',
+}
+
+WEEKDAYS = "1111100"  # Monday to Friday
+
+def _as_dates(dates):
+    return np.asarray(dates, dtype='datetime64[D]')
+
+def _restore(result, dates):
+    """Match the input kind: datetime.date in, datetime.date out; numpy in, numpy out"""
+    if np.ndim(result) == 0:
+        return np.datetime64(result, 'D') if isinstance(dates, (np.ndarray, np.datetime64)) else result.item()
+    return result
+
+def read_holiday_file(path):
+    """Holiday dates from a text or CSV file with an ISO date (YYYY-MM-DD) first on each line
+
+    Blank lines, '#' comments and a header row that is not a date are skipped, so
+    both one-date-per-line lists and exports like 'date,name' work.
+    """
+    holidays = []
+    with open(path, newline='') as handle:
+        for row in csv.reader(handle):
+            if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+                continue
+            try:
+                holidays.append(np.datetime64(row[0].strip()[:10], 'D'))
+            except ValueError:
+                if holidays:
+                    raise ValueError(f"Invalid holiday date {row[0]!r} in {path}") from None
+    return np.array(holidays, dtype='datetime64[D]')
+
+class BusinessCalendar:
+    """Weekend mask plus holiday list compiled once into a numpy busdaycalendar
+
+    All methods accept a date, a datetime64 or arrays of them and broadcast against
+    the day offsets, so whole books of trade dates are settled in one call. Lookups
+    go through the precompiled holiday index instead of stepping day by day.
+    """
+
+    def __init__(self, holidays=(), weekmask=WEEKDAYS, name=None):
+        holidays = _as_dates(list(holidays))
+        # np.unique loads numpy.ma on first use; skip it for the holiday-free WEEKENDS_ONLY built at import
+        self.holidays = np.unique(holidays) if len(holidays) else holidays
+        self.weekmask = weekmask
+        self.name = name
+        self._calendar = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    def __repr__(self):
+        return f"BusinessCalendar(name={self.name!r}, holidays={len(self.holidays)}, weekmask={self.weekmask!r})"
+
+    @classmethod
+    def from_files(cls, *paths, weekmask=WEEKDAYS, name=None):
+        """Calendar closed on the holidays of every file (e.g. a NY and a London list)"""
+        holidays = [read_holiday_file(path) for path in paths]
+        return cls(np.concatenate(holidays) if holidays else (), weekmask, name)
+
+    def combine(self, *others, name=None):
+        """Joint calendar: a business day only when it is one in every calendar"""
+        calendars = (self,) + others
+        weekmask = ''.join('1' if all(c.weekmask[i] == '1' for c in calendars) else '0' for i in range(7))
+        return BusinessCalendar(np.concatenate([c.holidays for c in calendars]), weekmask, name)
+
+    def is_business_day(self, dates):
+        """True where a date is neither a weekend nor a holiday"""
+        return np.is_busday(_as_dates(dates), busdaycal=self._calendar)
+
+    def add_business_days(self, dates, days):
+        """Shift dates by a number of business days, like Excel WORKDAY
+
+        A date that is not a business day counts from the previous business day when
+        moving forward (and the next one when moving back), so Saturday + 1 is
+        Monday. Zero days returns the date unchanged.
+        """
+        if np.ndim(dates) == 0 and np.ndim(days) == 0:
+            # One busday_offset call for a single date, as in calculate_workday
+            if days == 0:
+                return dates
+            start = np.datetime64(dates, 'D')
+            result = np.busday_offset(start, days, roll='backward' if days > 0 else 'forward',
+                                      busdaycal=self._calendar)
+            return _restore(result, dates)
+        start = _as_dates(dates)
+        days = np.asarray(days, dtype=np.int64)
+        forward = np.busday_offset(start, np.maximum(days, 0), roll='backward', busdaycal=self._calendar)
+        backward = np.busday_offset(start, np.minimum(days, 0), roll='forward', busdaycal=self._calendar)
+        result = np.where(days > 0, forward, np.where(days < 0, backward, start))
+        return _restore(result, dates)
+
+    def adjust(self, dates, convention="Modified Following"):
+        """Roll dates that fall on non-business days by a business day convention"""
+        try:
+            roll = BUSINESS_DAY_CONVENTIONS[convention]
+        except KeyError:
+            raise ValueError(f"Unknown business day convention {convention!r}; "
+                             f"expected one of {list(BUSINESS_DAY_CONVENTIONS)}") from None
+        start = _as_dates(dates)
+        if roll is None:
+            return _restore(start, dates)
+        return _restore(np.busday_offset(start, 0, roll=roll, busdaycal=self._calendar), dates)
+
+    def business_days_between(self, start_dates, end_dates):
+        """Business days in [start, end), broadcast over arrays"""
+        return np.busday_count(_as_dates(start_dates), _as_dates(end_dates), busdaycal=self._calendar)
+
+WEEKENDS_ONLY = BusinessCalendar(name="Weekends")
@@ -0,0 +1,79 @@
+"""
+Rate curve interpolation
+Continuous curves over the rate index tenors, evaluated for whole vectors of tenors
+"""
+
+import numpy as np
+
+INTERPOLATION_METHODS = ['linear', 'log-linear', 'monotone-cubic']
+
+def _monotone_slopes(x, y):
+    """Fritsch-Carlson node slopes that keep the cubic monotone between pillars"""
+    h = np.diff(x)
+    delta = np.diff(y) / h
+    slopes = np.empty_like(y)
+    slopes[0] = delta[0]
+    slopes[-1] = delta[-1]
+    if len(x) > 2:
+        # Weighted harmonic mean of neighbouring secants, zero at local extrema
+        w1 = 2 * h[1:] + h[:-1]
+        w2 = h[1:] + 2 * h[:-1]
+        same_sign = delta[:-1] * delta[1:] > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            harmonic = (w1 + w2) / (w1 / delta[:-1] + w2 / delta[1:])
+        slopes[1:-1] = np.where(same_sign, harmonic, 0.0)
+    return slopes
+
+class RateCurve:
+    """Interpolated curve of rates by tenor in months
+
+    Methods:
+    - 'linear': linear in the rate
+    - 'log-linear': linear in the log discount factor, i.e. in rate * tenor
+    - 'monotone-cubic': Fritsch-Carlson monotone cubic Hermite spline
+
+    Tenors outside the pillars are extrapolated flat.
+    """
+
+    def __init__(self, tenors, rates, method='linear'):
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError(f"Unknown interpolation method {method!r}; expected one of {INTERPOLATION_METHODS}")
+        tenors = np.asarray(tenors, dtype=np.float64)
+        rates = np.asarray(rates, dtype=np.float64)
+        order = np.argsort(tenors, kind='stable')
+        self.tenors = tenors[order]
+        self.rates = rates[order]
+        self.method = method
+        if len(self.tenors) == 0:
+            raise ValueError("A rate curve needs at least one pillar")
+        if np.any(np.diff(self.tenors) <= 0):
+            raise ValueError("Rate curve tenors must be unique")
+        if method == 'log-linear' and self.tenors[0] <= 0:
+            raise ValueError("Log-linear interpolation needs strictly positive tenors")
+        self._slopes = _monotone_slopes(self.tenors, self.rates) if method == 'monotone-cubic' and len(self.tenors) > 1 else None
+
+    def __call__(self, tenors):
+        """Evaluate the curve at a scalar or an array of tenors in months"""
+        t = np.asarray(tenors, dtype=np.float64)
+        x, y = self.tenors, self.rates
+        if len(x) == 1:
+            return np.full_like(t, y[0]) if t.ndim else float(y[0])
+
+        t_clipped = np.clip(t, x[0], x[-1])
+        i = np.clip(np.searchsorted(x, t_clipped, side='right') - 1, 0, len(x) - 2)
+        x0, x1 = x[i], x[i + 1]
+        y0, y1 = y[i], y[i + 1]
+        h = x1 - x0
+        s = (t_clipped - x0) / h
+
+        if self.method == 'linear':
+            values = y0 + s * (y1 - y0)
+        elif self.method == 'log-linear':
+            values = ((1 - s) * y0 * x0 + s * y1 * x1) / t_clipped
+        else:
+            m0, m1 = self._slopes[i], self._slopes[i + 1]
+            s2, s3 = s * s, s * s * s
+            values = ((2 * s3 - 3 * s2 + 1) * y0 + (s3 - 2 * s2 + s) * h * m0 +
+                      (-2 * s3 + 3 * s2) * y1 + (s3 - s2) * h * m1)
+
+        return values if t.ndim else float(values)
@@ -0,0 +1,49 @@
+"""
+Date utilities
+Settlement, maturity and term calculations following the Excel workbook formulas
+"""
+
+from datetime import timedelta
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from net_yield_engine.calendars import WEEKENDS_ONLY
+from net_yield_engine.daycount import days360
+from net_yield_engine.schedule import add_months
+
+def calculate_workday(trade_date, days_to_settle, calendar=None):
+    """Calculate settlement date skipping weekends (and holidays of an optional BusinessCalendar)"""
+    return (calendar or WEEKENDS_ONLY).add_business_days(trade_date, days_to_settle)
+
+def settlement_dates(trade_dates, days_to_settle, calendar=None):
+    """Vectorized calculate_workday over arrays of trade dates and settlement lags"""
+    return (calendar or WEEKENDS_ONLY).add_business_days(np.asarray(trade_dates, dtype='datetime64[D]'),
+                                                       days_to_settle)
+
+def calculate_days360(start_date, end_date):
+    """Calculate days using 30/360 convention"""
+    return int(days360(start_date, end_date))
+
+def calculate_maturity_date(issue_date, tenor_years):
+    """Calculate maturity date from tenor: EDATE(Issue_Date, months) - 1"""
+    return issue_date + relativedelta(months=int(tenor_years * 12)) - timedelta(days=1)
+
+def maturity_dates(issue_dates, tenor_years):
+    """Vectorized calculate_maturity_date over arrays of issue dates and tenors"""
+    months = (np.asarray(tenor_years, dtype=np.float64) * 12).astype(np.int64)
+    return add_months(issue_dates, months) - np.timedelta64(1, 'D')
+
+def calculate_term(issue_date, maturity_date):
+    """Calculate term in days, months and years between issue and maturity"""
+    term_days = (maturity_date - issue_date).days + 1
+    term_months = round(((maturity_date.year - issue_date.year) * 12 +
+                         (maturity_date.month - issue_date.month)) +
+                        (maturity_date.day - issue_date.day) / 30)
+    term_years = round(term_days / 365.25, 2)
+    return term_days, term_months, term_years
+
+def rounded_term_years(term_days):
+    """calculate_term's term years for an array of term days, rounded once per distinct length"""
+    distinct, inverse = np.unique(term_days, return_inverse=True)
+    return np.array([round(days / 365.25, 2) for days in distinct.tolist()])[inverse.reshape(-1)]
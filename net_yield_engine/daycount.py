@@ -0,0 +1,133 @@
+"""
+Day-count conventions
+Vectorized day counts and year fractions over arrays of start and end dates
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+DAYCOUNT_CONVENTIONS = ["30/360", "A/365", "A/360", "30E/360", "ACT/ACT"]
+
+# Fixed denominators; ACT/ACT divides each calendar year's days by that year's length
+DAYCOUNT_BASIS = {"30/360": 360, "30E/360": 360, "A/365": 365, "A/360": 360}
+
+ACTUAL_CONVENTIONS = ("A/365", "A/360", "ACT/ACT")
+
+def _check(convention):
+    if convention not in DAYCOUNT_CONVENTIONS:
+        raise ValueError(f"Unknown daycount convention {convention!r}; expected one of {DAYCOUNT_CONVENTIONS}")
+
+def _as_dates(dates):
+    return np.asarray(dates, dtype='datetime64[D]')
+
+def _day(value):
+    """datetime.date of a date or datetime (time of day dropped, as datetime64[D] does)"""
+    return value.date() if hasattr(value, 'date') else value
+
+def _month_day(dates):
+    """Months since 1970-01 and day-of-month integer arrays of datetime64[D] dates"""
+    months = dates.astype('datetime64[M]')
+    return months.astype(np.int64), (dates - months.astype('datetime64[D]')).astype(np.int64) + 1
+
+def _days360(m1, d1, m2, d2, european):
+    """DAYS360 from month indexes and days of month (360 * years + 30 * months == 30 * month index)"""
+    d1 = np.minimum(d1, 30)
+    d2 = np.minimum(d2, 30) if european else np.where(d1 == 30, np.minimum(d2, 30), d2)
+    return 30 * (m2 - m1) + (d2 - d1)
+
+def _is_scalar_date(value):
+    return isinstance(value, date)
+
+def days360(start_dates, end_dates, european=False):
+    """30/360 day count: Excel DAYS360 (US method, as in the workbook) or 30E/360
+
+    US: a start day of 31 becomes 30, and an end day of 31 becomes 30 only when the
+    start day is 30 or 31. European: both 31sts become 30.
+    """
+    if _is_scalar_date(start_dates) and _is_scalar_date(end_dates):
+        # Plain-Python path for single dates, where NumPy call overhead dominates
+        d1 = min(start_dates.day, 30)
+        d2 = min(end_dates.day, 30) if european or d1 == 30 else end_dates.day
+        return 360 * (end_dates.year - start_dates.year) + 30 * (end_dates.month - start_dates.month) + (d2 - d1)
+    m1, d1 = _month_day(_as_dates(start_dates))
+    m2, d2 = _month_day(_as_dates(end_dates))
+    return _days360(m1, d1, m2, d2, european)
+
+def actual_days(start_dates, end_dates):
+    """Calendar days from start to end"""
+    if _is_scalar_date(start_dates) and _is_scalar_date(end_dates):
+        return (_day(end_dates) - _day(start_dates)).days
+    return (_as_dates(end_dates) - _as_dates(start_dates)).astype(np.int64)
+
+def day_count(convention, start_dates, end_dates):
+    """Accrual days between dates under a convention (30-day months or actual days)"""
+    _check(convention)
+    if convention == "30/360":
+        return days360(start_dates, end_dates)
+    if convention == "30E/360":
+        return days360(start_dates, end_dates, european=True)
+    return actual_days(start_dates, end_dates)
+
+def _actual_actual(start_dates, end_dates):
+    """ACT/ACT (ISDA): days falling in each calendar year over that year's length"""
+    if _is_scalar_date(start_dates) and _is_scalar_date(end_dates):
+        def position(day):
+            day = _day(day)
+            first = date(day.year, 1, 1)
+            return (day - first).days / (date(day.year + 1, 1, 1) - first).days
+        return (end_dates.year - start_dates.year) + position(end_dates) - position(start_dates)
+
+    start = _as_dates(start_dates)
+    end = _as_dates(end_dates)
+
+    def position(dates):
+        years = dates.astype('datetime64[Y]')
+        first = years.astype('datetime64[D]')
+        length = ((years + 1).astype('datetime64[D]') - first).astype(np.int64)
+        return years.astype(np.int64), (dates - first).astype(np.int64) / length
+
+    start_year, start_position = position(start)
+    end_year, end_position = position(end)
+    return (end_year - start_year) + end_position - start_position
+
+def year_fraction(convention, start_dates, end_dates):
+    """Year fraction between dates under a convention, broadcast over arrays"""
+    _check(convention)
+    if convention == "ACT/ACT":
+        return _actual_actual(start_dates, end_dates)
+    return day_count(convention, start_dates, end_dates) / DAYCOUNT_BASIS[convention]
+
+def period_year_fractions(convention, boundaries):
+    """Year fractions of consecutive periods [boundaries[i], boundaries[i + 1])
+
+    Each boundary date is decomposed once, so a schedule's accruals cost one pass
+    over its dates.
+    """
+    _check(convention)
+    boundaries = _as_dates(boundaries)
+    if convention in ("30/360", "30E/360"):
+        months, days = _month_day(boundaries)
+        counts = _days360(months[:-1], days[:-1], months[1:], days[1:], convention == "30E/360")
+        return counts / DAYCOUNT_BASIS[convention]
+    if convention == "ACT/ACT":
+        return _actual_actual(boundaries[:-1], boundaries[1:])
+    return np.diff(boundaries).astype(np.int64) / DAYCOUNT_BASIS[convention]
+
+def term_year_fraction(convention, issue_dates, maturity_dates):
+    """Year fraction of a whole note term, following the workbook
+
+    30-day conventions count DAYS360 from issue to maturity; actual conventions count
+    the term days including the maturity date (maturity is EDATE - 1).
+    """
+    _check(convention)
+    if convention in ACTUAL_CONVENTIONS:
+        if _is_scalar_date(maturity_dates):
+            maturity_dates = _day(maturity_dates) + timedelta(days=1)
+        else:
+            maturity_dates = _as_dates(maturity_dates) + np.timedelta64(1, 'D')
+    return year_fraction(convention, issue_dates, maturity_dates)
+
+def accrued(amount, rate, convention, start_dates, end_dates):
+    """Simple interest amount * rate * year fraction for each accrual period"""
+    return amount * rate * year_fraction(convention, start_dates, end_dates)
@@ -0,0 +1,274 @@
+"""
+Result export
+Streaming CSV, Parquet and Excel writers for schedules, sweeps and portfolio results
+"""
+
+import csv
+import os
+
+import numpy as np
+
+from net_yield_engine._io import file_format, require_pyarrow
+
+# Excel's row limit less the header; larger results continue on a new sheet
+XLSX_MAX_ROWS = 1048575
+
+def require_xlsxwriter():
+    try:
+        import xlsxwriter
+    except ImportError:
+        raise ImportError("Excel export needs xlsxwriter (pip install xlsxwriter)") from None
+    return xlsxwriter
+
+def format_column(values):
+    """CSV text for a whole column at once: blanks for NaN/NaT, lower-case booleans
+
+    Returns a list of str. Floats use repr (shortest round-trip text); dates are
+    formatted once per distinct value, since result columns repeat a few dates.
+    """
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind == 'f':
+        return ['' if value != value else repr(value) for value in values.tolist()]
+    if kind == 'M':
+        distinct, inverse = np.unique(values.astype('datetime64[D]'), return_inverse=True)
+        text = np.where(np.isnat(distinct), '', distinct.astype(str))
+        return text[inverse].tolist()
+    if kind == 'b':
+        return np.where(values, 'true', 'false').tolist()
+    if kind in 'iu':
+        return list(map(str, values.tolist()))
+    return [_quote('' if value is None else str(value)) for value in values.tolist()]
+
+def _quote(text):
+    """Minimal CSV quoting (as csv.QUOTE_MINIMAL) for free-text values"""
+    if ',' in text or '"' in text or '\r' in text or '\n' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+class CsvColumnWriter:
+    """Append chunks of columns (dicts of equal-length arrays) to a CSV file
+
+    Each chunk is formatted column by column and joined into one block of text, so
+    only one chunk of text is held at a time. Quoting and line endings follow
+    csv.writer's defaults; cells follow format_column (true/false, blank NaN/NaT).
+    """
+
+    def __init__(self, path, columns):
+        self.columns = list(columns)
+        self.rows = 0
+        self._handle = open(path, 'w', newline='')
+        csv.writer(self._handle).writerow(self.columns)
+
+    def write(self, chunk):
+        lines = map(','.join, zip(*(format_column(chunk[name]) for name in self.columns)))
+        text = '\r\n'.join(lines)
+        if text:
+            self._handle.write(text + '\r\n')
+        self.rows += len(chunk[self.columns[0]])
+
+    def close(self):
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ParquetColumnWriter:
+    """Append chunks of columns to a Parquet file, one row group per chunk
+
+    Object columns are written as strings with None as null. A writer closed without
+    any chunk writes an empty file with null-typed columns.
+    """
+
+    def __init__(self, path, columns):
+        self.columns = list(columns)
+        self.rows = 0
+        self._pyarrow = require_pyarrow()
+        self._path = path
+        self._writer = None
+
+    def write(self, chunk):
+        pyarrow = self._pyarrow
+        table = pyarrow.table({name: self._array(chunk[name]) for name in self.columns})
+        if self._writer is None:
+            self._writer = pyarrow.parquet.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+
+    def _array(self, values):
+        if values.dtype == object:
+            return self._pyarrow.array([None if value is None else str(value) for value in values.tolist()],
+                                       type=self._pyarrow.string())
+        return self._pyarrow.array(values)
+
+    def close(self):
+        if self._writer is None:
+            schema = self._pyarrow.schema([(name, self._pyarrow.null()) for name in self.columns])
+            self._pyarrow.parquet.write_table(schema.empty_table(), self._path)
+        else:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class XlsxColumnWriter:
+    """Append chunks of columns to an Excel workbook in xlsxwriter constant_memory mode
+
+    Rows are flushed to disk as they are written, so memory stays flat; numbers, dates
+    and booleans are written as native cells (NaN/NaT as blanks), never as formatted
+    strings. column_formats maps column names to Excel number formats. Results longer
+    than Excel's row limit continue on further sheets.
+    """
+
+    def __init__(self, path, columns, sheet_name='Results', column_formats=None):
+        xlsxwriter = require_xlsxwriter()
+        self.columns = list(columns)
+        self.rows = 0
+        self.sheet_name = sheet_name
+        self._workbook = xlsxwriter.Workbook(path, {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd'})
+        self._formats = {name: self._workbook.add_format({'num_format': number_format})
+                         for name, number_format in (column_formats or {}).items()}
+        self._header = self._workbook.add_format({'bold': True})
+        self._sheet = None
+        self._sheet_row = 0
+
+    def _new_sheet(self):
+        sheets = len(self._workbook.worksheets())
+        name = self.sheet_name if sheets == 0 else f"{self.sheet_name} {sheets + 1}"
+        self._sheet = self._workbook.add_worksheet(name[:31])
+        for col, name in enumerate(self.columns):
+            self._sheet.set_column(col, col, 16, self._formats.get(name))
+        self._sheet.write_row(0, 0, self.columns, self._header)
+        self._sheet_row = 1
+
+    def write(self, chunk):
+        columns = []
+        for name in self.columns:
+            values = np.asarray(chunk[name])
+            column = values.astype('datetime64[D]').tolist() if values.dtype.kind == 'M' else values.tolist()
+            if values.dtype.kind in 'fM':
+                # tolist gives nan / None for missing values; both become blank cells
+                column = [None if value is None or value != value else value for value in column]
+            columns.append(column)
+        for row in zip(*columns):
+            if self._sheet is None or self._sheet_row > XLSX_MAX_ROWS:
+                self._new_sheet()
+            self._sheet.write_row(self._sheet_row, 0, row)
+            self._sheet_row += 1
+            self.rows += 1
+
+    def close(self):
+        if self._sheet is None:
+            self._new_sheet()
+        self._workbook.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def open_writer(path, columns, **options):
+    """Column writer for a path, picked by extension (.csv, .parquet/.pq, .xlsx)"""
+    kind = file_format(path)
+    if kind == 'parquet':
+        return ParquetColumnWriter(path, columns)
+    if kind == 'xlsx':
+        return XlsxColumnWriter(path, columns, **options)
+    return CsvColumnWriter(path, columns)
+
+def export_chunks(chunks, path, columns=None, **options):
+    """Stream an iterable of column chunks (e.g. iter_sweep) to a file; returns the row count
+
+    columns defaults to the first chunk's columns, in order. With columns given, the file
+    is written (header only) even when there are no chunks; without, nothing is written.
+    """
+    writer = open_writer(path, columns, **options) if columns else None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                writer = open_writer(path, list(chunk), **options)
+            writer.write(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return writer.rows if writer is not None else 0
+
+SCHEDULE_COLUMNS = ['Date', 'Principal', 'Interest', 'Coupon', 'Total Cash Flow', 'Cumulative']
+
+def write_note_workbook(result, output, details=None):
+    """Excel workbook of one priced note: Summary, XIRR schedule and Rate Breakdown sheets
+
+    output is a path or a binary file object (e.g. BytesIO for a download). details is
+    an optional mapping of extra summary rows (note type, issuer, ...) written first.
+    Values are native Excel numbers with number formats.
+    """
+    xlsxwriter = require_xlsxwriter()
+    # Paths stream rows to disk; file objects (small, one note) are assembled in memory
+    mode = {'constant_memory': True} if isinstance(output, (str, os.PathLike)) else {'in_memory': True}
+    workbook = xlsxwriter.Workbook(output, dict(mode, default_date_format='yyyy-mm-dd'))
+    bold = workbook.add_format({'bold': True})
+    money = workbook.add_format({'num_format': '$#,##0.00'})
+    percent = workbook.add_format({'num_format': '0.00%'})
+    rate = workbook.add_format({'num_format': '0.0000%'})
+    date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+    params = result.params
+
+    summary = workbook.add_worksheet('Summary')
+    summary.set_column(0, 0, 32)
+    summary.set_column(1, 1, 20)
+    summary.write_row(0, 0, ['Parameter', 'Value'], bold)
+    rows = [(name, value, None) for name, value in (details or {}).items()]
+    rows += [
+        ('Issue Date', result.issue_date, date_format),
+        ('Maturity Date', result.maturity_date, date_format),
+        ('Tenor (years)', params.tenor_years, None),
+        ('Equity', params.equity, money),
+        ('Drawn LTV', params.ltv, percent),
+        ('Total Invested', result.total_invested, money),
+        ('Loan Notional', result.loan_notional, money),
+        ('Coupon p.a.', params.coupon_rate, percent),
+        ('Total Cost of Borrowing', result.total_borrowing_cost, rate),
+        ('Coupon Cash Flow', result.coupon_cashflow, money),
+        ('Borrowing Cost', result.borrowing_cost, money),
+        ('Exp. Return on Equity p.a.', result.net_yield_pa, percent),
+        ('XIRR', result.xirr.rate if result.xirr.converged else 'n/a', percent),
+    ]
+    for row, (name, value, cell_format) in enumerate(rows, start=1):
+        summary.write(row, 0, name)
+        summary.write(row, 1, value, cell_format)
+
+    schedule = result.schedule
+    sheet = workbook.add_worksheet('XIRR')
+    sheet.set_column(0, 0, 12, date_format)
+    sheet.set_column(1, len(SCHEDULE_COLUMNS) - 1, 16, money)
+    sheet.write_row(0, 0, SCHEDULE_COLUMNS, bold)
+    columns = zip(schedule.dates.tolist(), schedule.principal.tolist(), schedule.interest.tolist(),
+                  schedule.coupon.tolist(), schedule.total.tolist(), np.cumsum(schedule.total).tolist())
+    for row, values in enumerate(columns, start=1):
+        sheet.write_row(row, 0, values)
+
+    breakdown = workbook.add_worksheet('Rate Breakdown')
+    breakdown.set_column(0, 0, 26)
+    breakdown.set_column(1, 1, 14, rate)
+    breakdown.write_row(0, 0, ['Component', 'Rate'], bold)
+    components = [
+        ('ST Reference Rate', result.st_reference_rate),
+        ('Fixing Adjustment', result.fixing_adjustment),
+        ('Reference Rate', result.reference_rate),
+        ('Swap Cost', result.swap_cost),
+        ('CoF v SOFR', result.cof_spread),
+        ('Bank Spread', result.bank_spread),
+        ('Total Cost of Borrowing', result.total_borrowing_cost),
+    ]
+    for row, values in enumerate(components, start=1):
+        breakdown.write_row(row, 0, values)
+
+    workbook.close()
+    return output
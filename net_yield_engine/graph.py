@@ -0,0 +1,171 @@
+"""
+Recomputation graph
+Cached pricing stages that only rerun when their own inputs change
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from dataclasses import fields
+
+from net_yield_engine.pricer import (
+    NoteParams,
+    PricingResult,
+    borrowing_rates,
+    funding_plan,
+    note_dates,
+    note_schedule,
+    term_cashflows,
+)
+from net_yield_engine.rates import default_rate_index
+from net_yield_engine.xirr import solve_xirr
+
+NodeTiming = namedtuple('NodeTiming', ['name', 'evaluations', 'recomputes', 'last_seconds', 'total_seconds'])
+
+class _Node:
+    __slots__ = ('name', 'function', 'inputs', 'memo', 'evaluations', 'recomputes', 'last_seconds', 'total_seconds')
+
+    def __init__(self, name, function, inputs):
+        self.name = name
+        self.function = function
+        self.inputs = tuple(inputs)
+        self.memo = OrderedDict()
+        self.evaluations = 0
+        self.recomputes = 0
+        self.last_seconds = 0.0
+        self.total_seconds = 0.0
+
+class StageGraph:
+    """Dependency graph of memoized stages
+
+    Each node is a function of named inputs: either sources (hashable values passed to
+    evaluate) or earlier nodes. A node's memo key is its direct source values plus the
+    keys of its upstream nodes, so a node reruns only when something it depends on
+    changed, and upstream outputs (arrays, tables) never need hashing. Each node keeps
+    the last max_entries results in LRU order, so flipping a widget back and forth
+    also hits. Thread-safe so one graph can serve every session. on_compute, if
+    given, is called as on_compute(name, seconds) after every recompute (e.g.
+    Instrumentation.record_stage).
+    """
+
+    def __init__(self, max_entries=64, on_compute=None):
+        self.max_entries = max_entries
+        self.on_compute = on_compute
+        self._nodes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, name, function, inputs):
+        """Add a node computing function(*inputs); node inputs must be added first"""
+        if name in self._nodes:
+            raise ValueError(f"Stage {name!r} already exists")
+        self._nodes[name] = _Node(name, function, inputs)
+        return self
+
+    def __contains__(self, name):
+        return name in self._nodes
+
+    def _required(self, outputs):
+        """Nodes needed for outputs, in insertion (topological) order"""
+        needed = set()
+        pending = list(outputs)
+        while pending:
+            name = pending.pop()
+            if name not in self._nodes:
+                raise KeyError(f"Unknown stage {name!r}")
+            if name in needed:
+                continue
+            needed.add(name)
+            pending.extend(i for i in self._nodes[name].inputs if i in self._nodes)
+        return [name for name in self._nodes if name in needed]
+
+    def evaluate(self, sources, outputs=None):
+        """Values of the requested nodes (all nodes by default) for a mapping of sources"""
+        names = self._required(self._nodes if outputs is None else outputs)
+        keys = {}
+        values = {}
+        for name in names:
+            node = self._nodes[name]
+            try:
+                key = tuple(keys[i] if i in self._nodes else sources[i] for i in node.inputs)
+            except KeyError as error:
+                raise KeyError(f"Stage {name!r} needs source {error.args[0]!r}") from None
+            keys[name] = key
+            with self._lock:
+                node.evaluations += 1
+                memo = node.memo.get(key, _MISSING)
+                if memo is not _MISSING:
+                    node.memo.move_to_end(key)
+            if memo is _MISSING:
+                start = time.perf_counter()
+                memo = node.function(*(values[i] if i in self._nodes else sources[i] for i in node.inputs))
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    node.memo[key] = memo
+                    while len(node.memo) > self.max_entries:
+                        node.memo.popitem(last=False)
+                    node.recomputes += 1
+                    node.last_seconds = elapsed
+                    node.total_seconds += elapsed
+                if self.on_compute is not None:
+                    self.on_compute(name, elapsed)
+            values[name] = memo
+        return values if outputs is None else {name: values[name] for name in outputs}
+
+    def timings(self):
+        """Per-node evaluation and recompute counts and compute time"""
+        with self._lock:
+            return [NodeTiming(node.name, node.evaluations, node.recomputes, node.last_seconds, node.total_seconds)
+                    for node in self._nodes.values()]
+
+    def clear(self):
+        """Drop memoized results (counters are kept)"""
+        with self._lock:
+            for node in self._nodes.values():
+                node.memo.clear()
+
+_MISSING = object()
+
+PARAM_FIELDS = [field.name for field in fields(NoteParams)]
+
+def _shared_schedule(*inputs):
+    """note_schedule with read-only columns, since memoized schedules are shared"""
+    schedule = note_schedule(*inputs)
+    for column in schedule:
+        column.setflags(write=False)
+    return schedule
+
+def _pricing_result(params, dates, funding, rates, cashflows, schedule, xirr):
+    return PricingResult(params=params, **dates, **funding, **rates, **cashflows, schedule=schedule, xirr=xirr)
+
+def pricing_graph(max_entries=64, on_compute=None):
+    """StageGraph of the price_note pipeline
+
+    Sources are 'params', every NoteParams field and 'rate_index' (see pricing_sources).
+    Nodes: dates, funding, rates, cashflows, schedule, xirr and result (a PricingResult).
+    Callers can add their own nodes (e.g. display tables) on top.
+    """
+    graph = StageGraph(max_entries, on_compute)
+    graph.add('dates', note_dates, ['trade_date', 'days_to_settle', 'tenor_years'])
+    graph.add('funding', funding_plan, ['equity', 'ltv'])
+    graph.add('rates', borrowing_rates,
+              ['rate_index', 'floating_ref', 'financing_tenor', 'lender', 'rate_interpolation'])
+    graph.add('cashflows', term_cashflows,
+              ['dates', 'funding', 'rates', 'equity', 'coupon_rate', 'asset_daycount', 'liability_daycount'])
+    graph.add('schedule', _shared_schedule,
+              ['dates', 'funding', 'rates', 'equity', 'coupon_rate', 'interest_freq', 'coupon_freq',
+               'asset_daycount', 'liability_daycount'])
+    graph.add('xirr', lambda schedule: solve_xirr(schedule.year_fractions(), schedule.total), ['schedule'])
+    graph.add('result', _pricing_result, ['params', 'dates', 'funding', 'rates', 'cashflows', 'schedule', 'xirr'])
+    return graph
+
+def pricing_sources(params, rate_index=None, **extra):
+    """Source mapping for pricing_graph from a NoteParams, plus any extra sources
+
+    rate_index defaults to the current default_rate_index(). A RateIndex keys memos by
+    its version, so reloaded market data reruns the rate lookup and everything after it.
+    """
+    sources = {name: getattr(params, name) for name in PARAM_FIELDS}
+    sources['params'] = params
+    sources['rate_index'] = default_rate_index() if rate_index is None else rate_index
+    sources.update(extra)
+    return sources
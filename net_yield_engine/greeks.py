@@ -0,0 +1,126 @@
+"""
+Sensitivities
+Analytic gradients of XIRR and net yield to the pricing inputs for batches of notes
+"""
+
+from collections import namedtuple
+from collections.abc import Mapping
+
+import numpy as np
+
+from net_yield_engine.daycount import term_year_fraction
+from net_yield_engine.pricer import NoteParams
+from net_yield_engine.rates import RateIndexLookupError
+from net_yield_engine.solve import note_legs
+from net_yield_engine.xirr import solve_xirr_ragged
+
+# Inputs differentiated, in gradient column order. The borrowing cost components add up
+# to total_borrowing_cost, so their derivatives equal its derivative.
+SENSITIVITY_INPUTS = ['coupon_rate', 'ltv', 'total_borrowing_cost', 'reference_rate',
+                      'swap_cost', 'cof_spread', 'bank_spread']
+
+BASIS_POINT = 1e-4
+
+Sensitivities = namedtuple('Sensitivities', [
+    'xirr',                # XIRR per note (NaN where it did not converge or could not be priced)
+    'net_yield_pa',        # net yield p.a. per note
+    'converged',           # XIRR convergence flag per note
+    'xirr_gradient',       # d XIRR / d input, (notes, SENSITIVITY_INPUTS)
+    'net_yield_gradient',  # d net_yield_pa / d input, (notes, SENSITIVITY_INPUTS)
+])
+
+def note_sensitivities(params_list, rate_index=None):
+    """XIRR and net yield gradients to SENSITIVITY_INPUTS for many notes in one pass
+
+    The schedule's cash flows are P + Invested * coupon_rate * C - Loan * rate * I
+    for the unit coupon and interest legs C and I. At the solved XIRR r the NPV
+    F(r, theta) is zero, so by implicit differentiation dr/dtheta = -(dF/dtheta) /
+    (dF/dr). Both partials are sums of leg values times the discount factors at r,
+    which are computed once over every note's flattened schedule; no note is
+    re-solved. Net yield is linear in the inputs, so its gradient is exact. Gradients
+    are per unit of input (multiply by BASIS_POINT for a 1bp move); notes that cannot
+    be priced come back as NaN. A single NoteParams gives 1-D results.
+    """
+    single = isinstance(params_list, (NoteParams, Mapping))
+    if single:
+        params_list = [params_list]
+    count = len(params_list)
+    inputs = len(SENSITIVITY_INPUTS)
+    xirr = np.full(count, np.nan)
+    net_yield_pa = np.full(count, np.nan)
+    converged = np.zeros(count, dtype=bool)
+    xirr_gradient = np.full((count, inputs), np.nan)
+    net_yield_gradient = np.full((count, inputs), np.nan)
+
+    notes = []
+    for i, params in enumerate(params_list):
+        if isinstance(params, Mapping):
+            params = NoteParams(**params)
+        try:
+            terms, unit = note_legs(params, rate_index)
+        except (RateIndexLookupError, ValueError):
+            continue
+        notes.append((i, params, terms, unit))
+
+    if notes:
+        rows = np.array([i for i, _, _, _ in notes])
+        equity = np.array([params.equity for _, params, _, _ in notes])
+        ltv = np.array([params.ltv for _, params, _, _ in notes])
+        coupon_rate = np.array([params.coupon_rate for _, params, _, _ in notes])
+        rate = np.array([terms['total_borrowing_cost'] for _, _, terms, _ in notes])
+        loan = np.array([terms['loan_notional'] for _, _, terms, _ in notes])
+        invested = np.array([terms['total_invested'] for _, _, terms, _ in notes])
+        years = np.array([terms['term_years'] for _, _, terms, _ in notes], dtype=np.float64)
+        # Loan = Equity * ltv / (1 - ltv) (zero at ltv >= 1, as in funding_plan)
+        with np.errstate(divide='ignore'):
+            loan_per_ltv = np.where(ltv < 1, equity / (1 - ltv) ** 2, 0.0)
+
+        # Every schedule back to back, with each row's note
+        units = [unit for _, _, _, unit in notes]
+        offsets = np.zeros(len(units) + 1, dtype=np.int64)
+        np.cumsum([len(unit) for unit in units], out=offsets[1:])
+        note = np.repeat(np.arange(len(units)), np.diff(offsets))
+        periods = np.concatenate([unit.year_fractions() for unit in units])
+        principal = np.concatenate([unit.principal for unit in units])
+        coupon_leg = np.concatenate([unit.coupon for unit in units])
+        interest_leg = -np.concatenate([unit.interest for unit in units])
+        total = principal + (invested * coupon_rate)[note] * coupon_leg - (loan * rate)[note] * interest_leg
+
+        batch = solve_xirr_ragged(periods, total, offsets)
+        solved = batch.rates
+        starts = offsets[:-1]
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            discount = np.power(1 + solved[note], -periods)
+            npv_rate = np.add.reduceat(-periods * total * discount / (1 + solved[note]), starts)
+            coupon_pv = np.add.reduceat(coupon_leg * discount, starts)
+            interest_pv = np.add.reduceat(interest_leg * discount, starts)
+            npv_inputs = np.column_stack([
+                invested * coupon_pv,                                         # coupon_rate
+                loan_per_ltv * (coupon_rate * coupon_pv - rate * interest_pv),  # ltv
+            ] + [-loan * interest_pv] * (inputs - 2))                          # borrowing cost components
+            gradient = -npv_inputs / npv_rate[:, None]
+        gradient[~batch.converged] = np.nan
+
+        # Net yield p.a. = (Invested * coupon_rate * asset fraction - Loan * rate * liability fraction) / (Equity * Years)
+        asset_fraction = np.array([float(term_year_fraction(params.asset_daycount, terms['issue_date'],
+                                                            terms['maturity_date']))
+                                   for _, params, terms, _ in notes])
+        liability_fraction = np.array([float(term_year_fraction(params.liability_daycount, terms['issue_date'],
+                                                                terms['maturity_date']))
+                                       for _, params, terms, _ in notes])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.where(years > 0, 1 / (equity * years), 0.0)
+        yield_gradient = np.column_stack([
+            invested * asset_fraction * scale,
+            loan_per_ltv * (coupon_rate * asset_fraction - rate * liability_fraction) * scale,
+        ] + [-loan * liability_fraction * scale] * (inputs - 2))
+
+        xirr[rows] = np.where(batch.converged, solved, np.nan)
+        converged[rows] = batch.converged
+        net_yield_pa[rows] = [terms['net_yield_pa'] for _, _, terms, _ in notes]
+        xirr_gradient[rows] = gradient
+        net_yield_gradient[rows] = yield_gradient
+
+    if single:
+        return Sensitivities(xirr[0], net_yield_pa[0], converged[0], xirr_gradient[0], net_yield_gradient[0])
+    return Sensitivities(xirr, net_yield_pa, converged, xirr_gradient, net_yield_gradient)
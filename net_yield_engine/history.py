@@ -0,0 +1,151 @@
+"""
+Rate index history
+Dated rate index snapshots with as-of lookups and backtests of a book across dates
+"""
+
+import hashlib
+from collections.abc import Mapping
+
+import numpy as np
+
+from net_yield_engine.dates import maturity_dates, rounded_term_years, settlement_dates
+from net_yield_engine.daycount import term_year_fraction
+from net_yield_engine.pricer import NoteParams, borrowing_rates, funding_plan, price_note
+from net_yield_engine.rates import (
+    RATE_INDEX_COLUMNS,
+    RateIndex,
+    RateIndexLookupError,
+    read_table_records,
+    record_to_row,
+)
+
+AS_OF_COLUMN = 'As Of'
+
+# Columns produced by reprice_history
+HISTORY_COLUMNS = ['note', 'as_of', 'rate_date', 'issue_date', 'maturity_date', 'total_borrowing_cost',
+                   'net_yield_pa', 'priced']
+
+class RateIndexHistory:
+    """Rate index snapshots keyed by as-of date
+
+    Snapshot dates are kept in a sorted datetime64 column, so the snapshot in force
+    on any date (the latest one on or before it) is found by binary search, for one
+    date or a whole array of dates at once.
+    """
+
+    def __init__(self, as_of_dates, indexes):
+        as_of_dates = np.asarray(as_of_dates, dtype='datetime64[D]')
+        if len(as_of_dates) != len(indexes):
+            raise ValueError("Need one RateIndex per as-of date")
+        order = np.argsort(as_of_dates, kind='stable')
+        self.dates = as_of_dates[order]
+        if len(self.dates) > 1 and (np.diff(self.dates) == np.timedelta64(0, 'D')).any():
+            raise ValueError("Rate index history has duplicate as-of dates")
+        self.indexes = [indexes[i] for i in order]
+        self.version = hashlib.sha256(
+            ''.join(f"{day}:{index.version};" for day, index in zip(self.dates, self.indexes)).encode()
+        ).hexdigest()[:16]
+
+    def __len__(self):
+        return len(self.dates)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """History from rate index rows that each carry an 'As Of' date"""
+        snapshots = {}
+        for row in rows:
+            as_of = np.datetime64(str(row[AS_OF_COLUMN])[:10], 'D')
+            snapshots.setdefault(as_of, []).append({column: row[column] for column in RATE_INDEX_COLUMNS})
+        return cls(list(snapshots), [RateIndex(snapshot) for snapshot in snapshots.values()])
+
+    def positions(self, dates):
+        """Snapshot position in force on each date (-1 before the first snapshot)"""
+        return np.searchsorted(self.dates, np.asarray(dates, dtype='datetime64[D]'), side='right') - 1
+
+    def as_of(self, as_of_date):
+        """RateIndex in force on a date"""
+        position = int(self.positions(as_of_date))
+        if position < 0:
+            raise RateIndexLookupError(f"No rate index snapshot on or before {np.datetime64(as_of_date, 'D')}")
+        return self.indexes[position]
+
+def read_rate_index_history(path):
+    """RateIndexHistory from a CSV or Parquet file of rate index rows with an 'As Of' column"""
+    records = read_table_records(path, [AS_OF_COLUMN] + RATE_INDEX_COLUMNS)
+    return RateIndexHistory.from_rows(
+        [dict(record_to_row(record), **{AS_OF_COLUMN: record[AS_OF_COLUMN]}) for record in records]
+    )
+
+def price_note_as_of(params, history, as_of_date=None):
+    """Price a note on the rate index in force on as_of_date (default: its trade date)"""
+    if isinstance(params, Mapping):
+        params = NoteParams(**params)
+    return price_note(params, history.as_of(params.trade_date if as_of_date is None else as_of_date))
+
+def _reprice_dates(params, history, dates, positions):
+    """Net yield of one note traded on each date, vectorized across the dates"""
+    issue = settlement_dates(dates, params.days_to_settle)
+    maturity = maturity_dates(issue, params.tenor_years)
+    term_years = rounded_term_years((maturity - issue).astype(np.int64) + 1)
+    funding = funding_plan(params.equity, params.ltv)
+
+    # Rates only change between snapshots, so each snapshot in range is looked up once
+    total_borrowing_cost = np.full(len(dates), np.nan)
+    for position in np.unique(positions[positions >= 0]).tolist():
+        try:
+            rates = borrowing_rates(history.indexes[position], params.floating_ref, params.financing_tenor,
+                                    params.lender, params.rate_interpolation)
+        except RateIndexLookupError:
+            continue
+        total_borrowing_cost[positions == position] = rates['total_borrowing_cost']
+
+    asset_fraction = term_year_fraction(params.asset_daycount, issue, maturity)
+    liability_fraction = term_year_fraction(params.liability_daycount, issue, maturity)
+    coupon_cashflow = funding['total_invested'] * params.coupon_rate * asset_fraction
+    borrowing_cost = funding['loan_notional'] * total_borrowing_cost * liability_fraction
+    with np.errstate(divide='ignore', invalid='ignore'):
+        net_yield_pa = np.where(term_years > 0, (coupon_cashflow - borrowing_cost) / (params.equity * term_years),
+                                np.where(np.isnan(total_borrowing_cost), np.nan, 0.0))
+    return issue, maturity, total_borrowing_cost, net_yield_pa
+
+def reprice_history(params_list, history, dates):
+    """Backtest a book: each note re-traded on each date at the rates in force then
+
+    Returns flat result columns (see HISTORY_COLUMNS), note-major, with one row per
+    note and date. Settlement, maturity, daycount fractions and net yield are computed
+    across all dates of a note at once; the rate lookup runs once per snapshot in
+    range rather than once per date. Dates before the first snapshot, or whose
+    snapshot cannot price the note, come back as NaN with priced=False.
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    positions = history.positions(dates)
+    rate_dates = np.where(positions >= 0, history.dates[np.maximum(positions, 0)], np.datetime64('NaT'))
+    count = len(params_list) * len(dates)
+    columns = {
+        'note': np.repeat(np.arange(len(params_list), dtype=np.int64), len(dates)),
+        'as_of': np.tile(dates, len(params_list)),
+        'rate_date': np.tile(rate_dates.astype('datetime64[D]'), len(params_list)),
+        'issue_date': np.full(count, np.datetime64('NaT'), dtype='datetime64[D]'),
+        'maturity_date': np.full(count, np.datetime64('NaT'), dtype='datetime64[D]'),
+        'total_borrowing_cost': np.full(count, np.nan),
+        'net_yield_pa': np.full(count, np.nan),
+        'priced': np.zeros(count, dtype=bool),
+    }
+    if not len(dates):
+        return columns
+
+    for i, params in enumerate(params_list):
+        if isinstance(params, Mapping):
+            params = NoteParams(**params)
+        rows = slice(i * len(dates), (i + 1) * len(dates))
+        try:
+            issue, maturity, borrowing, net_yield = _reprice_dates(params, history, dates, positions)
+        except ValueError:
+            continue
+        priced = ~np.isnan(borrowing)
+        columns['issue_date'][rows] = issue
+        columns['maturity_date'][rows] = maturity
+        columns['total_borrowing_cost'][rows] = borrowing
+        columns['net_yield_pa'][rows] = net_yield
+        columns['priced'][rows] = priced
+    return columns
@@ -0,0 +1,206 @@
+"""
+Hot-path instrumentation
+Stage timers, XIRR solver counters and cache hit rates, exportable as JSON or OpenMetrics
+"""
+
+import json
+import re
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+
+import numpy as np
+
+StageStats = namedtuple('StageStats', ['name', 'calls', 'total_seconds', 'last_seconds', 'max_seconds',
+                                       'p50_seconds', 'p99_seconds'])
+XirrStats = namedtuple('XirrStats', ['solves', 'converged', 'failed', 'iterations', 'mean_iterations',
+                                     'max_iterations', 'methods'])
+HitRate = namedtuple('HitRate', ['name', 'hits', 'misses', 'hit_rate'])
+
+# Durations kept per stage for the percentiles
+STAGE_SAMPLES = 1024
+
+METRIC_PREFIX = 'net_yield'
+
+class _Stage:
+    __slots__ = ('calls', 'total', 'last', 'max', 'samples')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=STAGE_SAMPLES)
+
+class Instrumentation:
+    """Process-wide registry of stage timings, XIRR solver counters and hit rates
+
+    Stages are timed with the stage() context manager (or record_stage); XIRR results
+    are counted with record_xirr. Caches report through collectors: callables returning
+    (hits, misses), read when a snapshot is taken, so the hot path never pays for them.
+    Thread-safe so one instance can be shared by every session of a deployment.
+    """
+
+    def __init__(self):
+        self._stages = {}
+        self._xirr = {'solves': 0, 'converged': 0, 'iterations': 0, 'max_iterations': 0, 'methods': {}}
+        self._collectors = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """Time the body of a with block as one call of stage name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - start)
+
+    def record_stage(self, name, seconds):
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = _Stage()
+            stage.calls += 1
+            stage.total += seconds
+            stage.last = seconds
+            stage.max = max(stage.max, seconds)
+            stage.samples.append(seconds)
+
+    def record_xirr(self, result):
+        """Count one XirrResult (or a BatchXirrResult, counting every rate in it)"""
+        if hasattr(result, 'rates'):
+            converged = np.asarray(result.converged, dtype=bool)
+            iterations = np.asarray(result.iterations, dtype=np.int64)
+            methods = {'batch': len(converged)}
+        else:
+            converged = np.array([bool(result.converged)])
+            iterations = np.array([int(result.iterations)])
+            methods = {result.method: 1}
+        with self._lock:
+            counters = self._xirr
+            counters['solves'] += len(converged)
+            counters['converged'] += int(converged.sum())
+            counters['iterations'] += int(iterations.sum())
+            if len(iterations):
+                counters['max_iterations'] = max(counters['max_iterations'], int(iterations.max()))
+            for method, count in methods.items():
+                counters['methods'][method] = counters['methods'].get(method, 0) + count
+
+    def add_collector(self, name, collector):
+        """Report a hit rate under name from collector(), which returns (hits, misses)"""
+        with self._lock:
+            self._collectors[name] = collector
+        return self
+
+    def stages(self):
+        """StageStats per timed stage, slowest total first"""
+        with self._lock:
+            items = [(name, stage.calls, stage.total, stage.last, stage.max, np.array(stage.samples))
+                     for name, stage in self._stages.items()]
+        stats = [
+            StageStats(name, calls, total, last, longest, float(np.percentile(samples, 50)),
+                       float(np.percentile(samples, 99)))
+            for name, calls, total, last, longest, samples in items
+        ]
+        return sorted(stats, key=lambda stats: -stats.total_seconds)
+
+    def xirr(self):
+        with self._lock:
+            counters = dict(self._xirr, methods=dict(self._xirr['methods']))
+        solves = counters['solves']
+        return XirrStats(
+            solves=solves,
+            converged=counters['converged'],
+            failed=solves - counters['converged'],
+            iterations=counters['iterations'],
+            mean_iterations=counters['iterations'] / solves if solves else 0.0,
+            max_iterations=counters['max_iterations'],
+            methods=counters['methods'],
+        )
+
+    def hit_rates(self):
+        with self._lock:
+            collectors = list(self._collectors.items())
+        rates = []
+        for name, collector in collectors:
+            hits, misses = collector()
+            lookups = hits + misses
+            rates.append(HitRate(name, hits, misses, hits / lookups if lookups else 0.0))
+        return rates
+
+    def snapshot(self):
+        """All metrics as plain JSON-serializable data"""
+        return {
+            'stages': [stats._asdict() for stats in self.stages()],
+            'xirr': self.xirr()._asdict(),
+            'hit_rates': [rate._asdict() for rate in self.hit_rates()],
+        }
+
+    def to_json(self, **options):
+        return json.dumps(self.snapshot(), **options)
+
+    def to_openmetrics(self, prefix=METRIC_PREFIX):
+        """Metrics in the OpenMetrics text exposition format"""
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{_label(text)}"' for key, text in labels.items())
+                lines.append(f"{prefix}_{name}{suffix}{{{label_text}}} {value!r}" if label_text
+                             else f"{prefix}_{name}{suffix} {value!r}")
+
+        stages = self.stages()
+        family('stage_seconds', 'summary', "Wall time per calculation stage", [
+            sample
+            for stats in stages
+            for sample in (
+                ('', {'stage': stats.name, 'quantile': '0.5'}, stats.p50_seconds),
+                ('', {'stage': stats.name, 'quantile': '0.99'}, stats.p99_seconds),
+                ('_sum', {'stage': stats.name}, stats.total_seconds),
+                ('_count', {'stage': stats.name}, stats.calls),
+            )
+        ])
+        xirr = self.xirr()
+        family('xirr_solves', 'counter', "XIRR solves by outcome", [
+            ('_total', {'outcome': 'converged'}, xirr.converged),
+            ('_total', {'outcome': 'failed'}, xirr.failed),
+        ])
+        family('xirr_iterations', 'counter', "Total XIRR solver iterations", [('_total', {}, xirr.iterations)])
+        family('xirr_method_solves', 'counter', "XIRR solves by solver method", [
+            ('_total', {'method': method}, count) for method, count in sorted(xirr.methods.items())
+        ])
+        rates = self.hit_rates()
+        family('cache_hits', 'counter', "Cache and memo hits", [('_total', {'cache': r.name}, r.hits) for r in rates])
+        family('cache_misses', 'counter', "Cache and memo misses",
+               [('_total', {'cache': r.name}, r.misses) for r in rates])
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Zero the stage and XIRR counters (collectors are kept)"""
+        with self._lock:
+            self._stages.clear()
+            self._xirr = {'solves': 0, 'converged': 0, 'iterations': 0, 'max_iterations': 0, 'methods': {}}
+
+def _label(text):
+    return re.sub(r'(["\\])', r'\\\1', str(text)).replace('\n', r'\n')
+
+def graph_collector(graph, stage=None):
+    """(hits, misses) of a StageGraph's memo, for one stage or summed over all of them"""
+    def collect():
+        timings = [timing for timing in graph.timings() if stage is None or timing.name == stage]
+        evaluations = sum(timing.evaluations for timing in timings)
+        recomputes = sum(timing.recomputes for timing in timings)
+        return evaluations - recomputes, recomputes
+    return collect
+
+def lru_collector(function):
+    """(hits, misses) of a functools.lru_cache wrapped function (or anything with cache_info)"""
+    def collect():
+        info = function.cache_info()
+        return info.hits, info.misses
+    return collect
@@ -0,0 +1,132 @@
+"""
+Monte Carlo borrowing cost
+Simulated floating reference rate paths resetting the interest leg of the XIRR schedule
+"""
+
+from collections import namedtuple
+from collections.abc import Mapping
+
+import numpy as np
+
+from net_yield_engine.daycount import term_year_fraction
+from net_yield_engine.pricer import NoteParams, price_terms
+from net_yield_engine.rates import default_rate_index
+from net_yield_engine.schedule import build_cashflow_schedule
+from net_yield_engine.xirr import solve_xirr_batch
+
+RATE_MODELS = ['hull-white', 'lognormal']
+
+# Default volatilities: normal (absolute) for Hull-White, proportional for lognormal
+DEFAULT_VOLATILITY = {'hull-white': 0.01, 'lognormal': 0.25}
+
+DEFAULT_PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+MonteCarloResult = namedtuple('MonteCarloResult', [
+    'xirr',            # XIRR per path (NaN where the solver did not converge)
+    'net_yield_pa',    # net yield p.a. per path
+    'converged',       # XIRR convergence flag per path
+    'reset_times',     # interest period start times in years from issue
+    'forward_rates',   # forward reference rate at each reset (the path mean for both models)
+])
+
+def forward_reference_rates(rate_index, floating_ref, reset_times, interpolation='linear'):
+    """Forward floating_ref-tenor rates starting at each reset time (years)
+
+    The rate index LAST_PRICE curve is read as zero rates by tenor, so the forward
+    over [t, t + tau] is (R(t + tau) * (t + tau) - R(t) * t) / tau.
+    """
+    curve = rate_index.tenor_curve(interpolation or 'linear')
+    tau = float(rate_index.row_for_floating_ref(floating_ref)['M']) / 12
+    t = np.asarray(reset_times, dtype=np.float64)
+    return (curve((t + tau) * 12) * (t + tau) - curve(t * 12) * t) / tau
+
+def simulate_reference_rates(forward_rates, reset_times, n_paths, model='hull-white', volatility=None,
+                             mean_reversion=0.03, rng=None):
+    """Reference rate paths at the reset times, shape (n_paths, resets)
+
+    'hull-white' adds a mean-reverting Gaussian factor (exact Ornstein-Uhlenbeck steps,
+    normal volatility) to the forward curve; 'lognormal' scales the forwards by a
+    driftless geometric Brownian factor. Both start at zero shock, so the first reset
+    fixes at today's forward, and both have the forward curve as their mean.
+    """
+    if model not in RATE_MODELS:
+        raise ValueError(f"Unknown rate model {model!r}; expected one of {RATE_MODELS}")
+    if volatility is None:
+        volatility = DEFAULT_VOLATILITY[model]
+    rng = np.random.default_rng(rng)
+    times = np.asarray(reset_times, dtype=np.float64)
+    steps = np.diff(times)
+    shocks = np.zeros((n_paths, len(times)))
+
+    if model == 'hull-white':
+        a = mean_reversion
+        decay = np.exp(-a * steps)
+        step_std = volatility * (np.sqrt((1 - decay ** 2) / (2 * a)) if a > 1e-12 else np.sqrt(steps))
+        normals = rng.standard_normal((n_paths, len(steps)))
+        for k in range(len(steps)):
+            shocks[:, k + 1] = shocks[:, k] * decay[k] + step_std[k] * normals[:, k]
+        return forward_rates[None, :] + shocks
+
+    np.cumsum(volatility * np.sqrt(steps) * rng.standard_normal((n_paths, len(steps))), axis=1, out=shocks[:, 1:])
+    return forward_rates[None, :] * np.exp(shocks - 0.5 * volatility ** 2 * times[None, :])
+
+def simulate_note(params, n_paths=10000, model='hull-white', volatility=None, mean_reversion=0.03,
+                  seed=None, chunk_size=20000, rate_index=None):
+    """Simulate XIRR and net yield distributions for one note under floating resets
+
+    Each interest period accrues at the simulated floating_ref rate fixed at its start
+    plus the lender's swap cost, CoF and bank spread; coupons and principal are as in
+    the deterministic schedule. Paths are generated and solved chunk_size at a time
+    (one batched XIRR solve per chunk), so memory stays bounded for any n_paths. Net
+    yield uses the period accruals rescaled to the term daycount, so a flat path
+    reproduces price_note's net yield.
+    """
+    if isinstance(params, Mapping):
+        params = NoteParams(**params)
+    if rate_index is None:
+        rate_index = default_rate_index()
+    terms = price_terms(params, rate_index)
+    unit = build_cashflow_schedule(
+        params.equity, 1.0, 1.0, 1.0, 1.0, terms['issue_date'], terms['maturity_date'],
+        params.interest_freq, params.coupon_freq, params.liability_daycount, params.asset_daycount
+    )
+
+    # Interest rows of the schedule and the start (reset) time of each accrual period
+    periods = unit.year_fractions()
+    interest_rows = np.nonzero(unit.interest)[0]
+    accruals = -unit.interest[interest_rows]
+    reset_times = np.append(0.0, periods[interest_rows[:-1]])
+    forwards = forward_reference_rates(rate_index, params.floating_ref, reset_times, params.rate_interpolation)
+    spread = terms['swap_cost'] + terms['cof_spread'] + terms['bank_spread']
+
+    loan = terms['loan_notional']
+    fixed_flows = unit.principal + terms['total_invested'] * params.coupon_rate * unit.coupon
+    liability_fraction = float(term_year_fraction(params.liability_daycount, terms['issue_date'], terms['maturity_date']))
+    term_weights = accruals * (liability_fraction / accruals.sum())
+    yield_basis = params.equity * terms['term_years']
+
+    rng = np.random.default_rng(seed)
+    xirr = np.empty(n_paths)
+    net_yield_pa = np.empty(n_paths)
+    converged = np.empty(n_paths, dtype=bool)
+    for start in range(0, n_paths, chunk_size):
+        stop = min(start + chunk_size, n_paths)
+        rates = simulate_reference_rates(forwards, reset_times, stop - start, model, volatility,
+                                         mean_reversion, rng) + spread
+        cashflows = np.repeat(fixed_flows[None, :], stop - start, axis=0)
+        cashflows[:, interest_rows] -= loan * rates * accruals
+        batch = solve_xirr_batch(periods, cashflows)
+        xirr[start:stop] = batch.rates
+        converged[start:stop] = batch.converged
+        borrowing_cost = loan * (rates @ term_weights)
+        net_yield_pa[start:stop] = (terms['coupon_cashflow'] - borrowing_cost) / yield_basis if yield_basis > 0 else 0
+
+    return MonteCarloResult(xirr, net_yield_pa, converged, reset_times, forwards)
+
+def simulation_percentiles(result, percentiles=DEFAULT_PERCENTILES):
+    """Percentiles of the simulated XIRR and net yield distributions, keyed by measure"""
+    return {
+        'percentile': np.asarray(percentiles, dtype=np.float64),
+        'xirr': np.nanpercentile(result.xirr, percentiles),
+        'net_yield_pa': np.percentile(result.net_yield_pa, percentiles),
+    }
@@ -0,0 +1,166 @@
+"""
+Portfolio batch pricing
+Stream a trade file (CSV or Parquet) through the pricer in bounded chunks
+
+Each trade row uses the NoteParams field names as columns (trade_date, days_to_settle,
+tenor_years, asset_daycount, financing_tenor, liability_daycount, interest_freq,
+coupon_freq, coupon_rate, equity, ltv, lender, floating_ref, rate_interpolation), with
+rates as decimals. Missing columns or empty cells fall back to the NoteParams defaults,
+and an optional trade_id column is copied to the output.
+
+Usage: python -m net_yield_engine.portfolio trades.csv priced.csv [--chunk-size 10000] [--processes 4]
+"""
+
+import argparse
+import csv
+import math
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from datetime import date
+
+import numpy as np
+
+from net_yield_engine._io import file_format, require_pyarrow
+from net_yield_engine.book import NoteBook, price_book
+from net_yield_engine.export import open_writer
+from net_yield_engine.pricer import PRICE_COLUMNS, NoteParams
+
+TRADE_FIELDS = {field.name: field.type for field in fields(NoteParams)}
+
+ID_COLUMN = 'trade_id'
+
+OUTPUT_COLUMNS = [ID_COLUMN] + PRICE_COLUMNS
+
+def _number(name, value, field_type):
+    """Finite number of a numeric trade column; anything else raises ValueError"""
+    try:
+        number = float(value)
+    except TypeError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"{name} must be finite, got {value!r}")
+    if field_type is int:
+        if not number.is_integer():
+            raise ValueError(f"{name} must be a whole number, got {value!r}")
+        return int(number)
+    return number
+
+def parse_trade(row):
+    """Build NoteParams from one trade row (a mapping of column name to value)"""
+    values = {}
+    for name, field_type in TRADE_FIELDS.items():
+        value = row.get(name)
+        if value is None or (isinstance(value, str) and value.strip() == ''):
+            continue
+        if name == 'rate_interpolation' and str(value).strip().lower() in ('none', 'exact'):
+            values[name] = None
+        elif field_type is date:
+            values[name] = value if isinstance(value, date) else date.fromisoformat(str(value).strip()[:10])
+        elif field_type in (int, float):
+            values[name] = _number(name, value, field_type)
+        else:
+            values[name] = str(value).strip()
+    return NoteParams(**values)
+
+def read_trades(path, chunk_size=10000):
+    """Yield lists of trade rows (dicts) of at most chunk_size from a CSV or Parquet file"""
+    if file_format(path) == 'parquet':
+        pyarrow = require_pyarrow()
+        for batch in pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pylist()
+        return
+
+    with open(path, newline='') as handle:
+        chunk = []
+        for row in csv.DictReader(handle):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def price_trades(rows, rate_index=None):
+    """Price one chunk of trade rows into output columns (see OUTPUT_COLUMNS)
+
+    The parsed trades are priced as one NoteBook with price_book, so dates, rate
+    lookups, schedules and XIRRs are computed across the chunk in array passes. Rows
+    that fail to parse are reported through the error column like any other
+    unpriceable trade.
+    """
+    params_list = []
+    parsed = np.zeros(len(rows), dtype=bool)
+    parse_errors = {}
+    for i, row in enumerate(rows):
+        try:
+            params_list.append(parse_trade(row))
+            parsed[i] = True
+        except (TypeError, ValueError) as error:
+            parse_errors[i] = f"{type(error).__name__}: {error}"
+
+    priced = price_book(NoteBook.from_params(params_list), rate_index).columns
+    columns = {ID_COLUMN: np.array([row.get(ID_COLUMN, '') for row in rows], dtype=object)}
+    for name, values in priced.items():
+        column = np.empty(len(rows), dtype=values.dtype)
+        column[parsed] = values
+        if name == 'error':
+            column[~parsed] = [parse_errors[i] for i in np.nonzero(~parsed)[0]]
+        elif values.dtype.kind == 'f':
+            column[~parsed] = np.nan
+        elif values.dtype.kind == 'M':
+            column[~parsed] = np.datetime64('NaT')
+        else:
+            column[~parsed] = False
+        columns[name] = column
+    return columns
+
+def iter_priced_chunks(path, chunk_size=10000, processes=1, rate_index=None):
+    """Price a trade file chunk by chunk, yielding output columns in file order
+
+    With several processes at most two chunks per worker are in flight, so memory
+    stays bounded by the chunk size rather than the portfolio size.
+    """
+    chunks = read_trades(path, chunk_size)
+    if processes <= 1:
+        for rows in chunks:
+            yield price_trades(rows, rate_index)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        for rows in chunks:
+            pending.append(executor.submit(price_trades, rows, rate_index))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def price_portfolio(input_path, output_path, chunk_size=10000, processes=1, rate_index=None):
+    """Price a trade file into a CSV, Parquet or Excel result file; returns (trades, priced) counts"""
+    writer = open_writer(output_path, OUTPUT_COLUMNS)
+    trades = priced = 0
+    try:
+        for columns in iter_priced_chunks(input_path, chunk_size, processes, rate_index):
+            writer.write(columns)
+            trades += len(columns['priced'])
+            priced += int(columns['priced'].sum())
+    finally:
+        writer.close()
+    return trades, priced
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help="trade file (.csv or .parquet)")
+    parser.add_argument('output', help="result file (.csv, .parquet or .xlsx)")
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    parser.add_argument('--processes', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    trades, priced = price_portfolio(args.input, args.output, args.chunk_size, args.processes)
+    print(f"Priced {priced:,} of {trades:,} trades into {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
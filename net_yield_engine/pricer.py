@@ -0,0 +1,234 @@
+"""
+Headless note pricer
+Single entry point turning sidebar-style inputs into the full set of results
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import date
+
+import numpy as np
+
+from net_yield_engine.curve import INTERPOLATION_METHODS
+from net_yield_engine.dates import calculate_maturity_date, calculate_term, calculate_workday
+from net_yield_engine.daycount import term_year_fraction
+from net_yield_engine.rates import RateIndexLookupError, default_rate_index
+from net_yield_engine.schedule import CashflowSchedule, build_cashflow_schedule
+from net_yield_engine.xirr import XirrResult, solve_xirr, solve_xirr_ragged
+
+INTEREST_FREQUENCIES = ["Quarterly", "Semi-Annual", "Annual"]
+COUPON_FREQUENCIES = ["Annual", "Semi-Annual", "Quarterly", "At Maturity"]
+LENDERS = ["CAI", "DB", "SG", "Barc"]
+FLOATING_REFS = ["1M", "3M", "6M", "12M"]
+
+# Columns produced by price_columns
+PRICE_COLUMNS = ['issue_date', 'maturity_date', 'total_borrowing_cost', 'net_yield_pa',
+                 'xirr', 'xirr_converged', 'priced', 'error']
+RATE_INTERPOLATIONS = INTERPOLATION_METHODS + [None]
+
+@dataclass(frozen=True)
+class NoteParams:
+    """Pricing inputs for one note, mirroring the sidebar (rates as decimals)"""
+    trade_date: date = field(default_factory=date.today)
+    days_to_settle: int = 5
+    tenor_years: float = 3.0
+    asset_daycount: str = "30/360"
+    financing_tenor: int = 12
+    liability_daycount: str = "30/360"
+    interest_freq: str = "Quarterly"
+    coupon_freq: str = "Annual"
+    coupon_rate: float = 0.05
+    equity: float = 1500000
+    ltv: float = 0.85
+    lender: str = "CAI"
+    floating_ref: str = "1M"
+    rate_interpolation: str = "linear"  # None prices exact rate index tenors only
+
+@dataclass(frozen=True)
+class PricingResult:
+    """Everything the app displays for one priced note"""
+    params: NoteParams
+    # Dates & tenor
+    issue_date: date
+    maturity_date: date
+    term_days: int
+    term_months: int
+    term_years: float
+    # Funding plan
+    loan_ratio: float
+    total_invested: float
+    loan_notional: float
+    # Borrowing costs
+    st_reference_rate: float
+    fixing_adjustment: float
+    reference_rate: float
+    swap_cost: float
+    cof_spread: float
+    bank_spread: float
+    total_borrowing_cost: float
+    # Net return
+    coupon_cashflow: float
+    borrowing_cost: float
+    net_yield_total: float
+    net_yield_pa: float
+    # XIRR schedule
+    schedule: CashflowSchedule
+    xirr: XirrResult
+
+def note_dates(trade_date, days_to_settle, tenor_years):
+    """Dates & tenor stage: issue and maturity dates and the term"""
+    issue_date = calculate_workday(trade_date, days_to_settle)
+    maturity_date = calculate_maturity_date(issue_date, tenor_years)
+    term_days, term_months, term_years = calculate_term(issue_date, maturity_date)
+    return dict(issue_date=issue_date, maturity_date=maturity_date,
+                term_days=term_days, term_months=term_months, term_years=term_years)
+
+def funding_plan(equity, ltv):
+    """Funding plan stage: loan ratio, total invested and loan notional from equity and LTV"""
+    loan_ratio = ltv / (1 - ltv) if ltv < 1 else 0
+    total_invested = equity * (1 + loan_ratio)
+    loan_notional = total_invested - equity
+    return dict(loan_ratio=loan_ratio, total_invested=total_invested, loan_notional=loan_notional)
+
+def borrowing_rates(rate_index, floating_ref, financing_tenor, lender, rate_interpolation):
+    """Rate lookup stage: borrowing cost components from the rate index"""
+    if rate_index is None:
+        rate_index = default_rate_index()
+    rates = rate_index.borrowing_components(floating_ref, financing_tenor, lender, rate_interpolation)
+    st_reference_rate = rates.st_reference_rate
+    fixing_adjustment = rates.tenor_last_price - st_reference_rate
+    reference_rate = st_reference_rate + fixing_adjustment
+    total_borrowing_cost = reference_rate + rates.swap_cost + rates.cof_spread + rates.bank_spread
+    return dict(st_reference_rate=st_reference_rate, fixing_adjustment=fixing_adjustment,
+                reference_rate=reference_rate, swap_cost=rates.swap_cost, cof_spread=rates.cof_spread,
+                bank_spread=rates.bank_spread, total_borrowing_cost=total_borrowing_cost)
+
+def term_cashflows(dates, funding, rates, equity, coupon_rate, asset_daycount, liability_daycount):
+    """Cash flow stage: term coupon and borrowing cost and the resulting net yield"""
+    asset_fraction = float(term_year_fraction(asset_daycount, dates['issue_date'], dates['maturity_date']))
+    liability_fraction = float(term_year_fraction(liability_daycount, dates['issue_date'], dates['maturity_date']))
+    coupon_cashflow = funding['total_invested'] * coupon_rate * asset_fraction
+    borrowing_cost = funding['loan_notional'] * rates['total_borrowing_cost'] * liability_fraction
+
+    net_yield_total = coupon_cashflow - borrowing_cost
+    term_years = dates['term_years']
+    net_yield_pa = net_yield_total / (equity * term_years) if term_years > 0 else 0
+    return dict(coupon_cashflow=coupon_cashflow, borrowing_cost=borrowing_cost,
+                net_yield_total=net_yield_total, net_yield_pa=net_yield_pa)
+
+def note_schedule(dates, funding, rates, equity, coupon_rate, interest_freq, coupon_freq,
+                  asset_daycount, liability_daycount):
+    """Schedule stage: the XIRR cash flow schedule"""
+    return build_cashflow_schedule(
+        equity, funding['loan_notional'], funding['total_invested'], rates['total_borrowing_cost'],
+        coupon_rate, dates['issue_date'], dates['maturity_date'], interest_freq, coupon_freq,
+        liability_daycount, asset_daycount
+    )
+
+def price_terms(params, rate_index=None):
+    """Everything price_note computes except the XIRR solve, as PricingResult fields
+
+    Runs the pricing stages in order. Batch callers use this to build many schedules
+    and then solve all XIRRs in one call.
+    """
+    if isinstance(params, Mapping):
+        params = NoteParams(**params)
+
+    dates = note_dates(params.trade_date, params.days_to_settle, params.tenor_years)
+    funding = funding_plan(params.equity, params.ltv)
+    rates = borrowing_rates(rate_index, params.floating_ref, params.financing_tenor, params.lender,
+                            params.rate_interpolation)
+    cashflows = term_cashflows(dates, funding, rates, params.equity, params.coupon_rate,
+                               params.asset_daycount, params.liability_daycount)
+    schedule = note_schedule(dates, funding, rates, params.equity, params.coupon_rate, params.interest_freq,
+                             params.coupon_freq, params.asset_daycount, params.liability_daycount)
+    return dict(params=params, **dates, **funding, **rates, **cashflows, schedule=schedule)
+
+def price_note(params, rate_index=None):
+    """Price one note; params is a NoteParams or a mapping of its fields
+
+    Uses the embedded rate index unless another RateIndex is given. Financing tenors
+    missing from the table are interpolated with params.rate_interpolation; with
+    interpolation off (None) or an unknown floating reference, RateIndexLookupError
+    is raised.
+    """
+    terms = price_terms(params, rate_index)
+    schedule = terms['schedule']
+    xirr = solve_xirr(schedule.year_fractions(), schedule.total)
+    return PricingResult(**terms, xirr=xirr)
+
+def solve_schedules_xirr(schedules):
+    """Solve the XIRR of many CashflowSchedules in one batched call"""
+    offsets = np.zeros(len(schedules) + 1, dtype=np.int64)
+    np.cumsum([len(schedule) for schedule in schedules], out=offsets[1:])
+    periods = np.concatenate([schedule.year_fractions() for schedule in schedules]) if schedules else np.empty(0)
+    cashflows = np.concatenate([schedule.total for schedule in schedules]) if schedules else np.empty(0)
+    return solve_xirr_ragged(periods, cashflows, offsets)
+
+def price_notes(params_list, rate_index=None):
+    """Price many notes, solving all of their XIRRs together with the batched solver"""
+    terms_list = [price_terms(params, rate_index) for params in params_list]
+    batch = solve_schedules_xirr([terms['schedule'] for terms in terms_list])
+    return [
+        PricingResult(**terms, xirr=XirrResult(float(rate), bool(converged), int(iterations), 'batch'))
+        for terms, rate, converged, iterations in zip(terms_list, batch.rates, batch.converged, batch.iterations)
+    ]
+
+def price_columns(params_list, rate_index=None):
+    """Price many notes into NumPy result columns (see PRICE_COLUMNS)
+
+    Notes that cannot be priced (no rate index data, unknown frequency, ...) come back
+    as NaN with priced=False and the reason in error, instead of failing the batch.
+    All XIRRs are solved in one batched call.
+    """
+    count = len(params_list)
+    columns = {
+        'issue_date': np.full(count, np.datetime64('NaT'), dtype='datetime64[D]'),
+        'maturity_date': np.full(count, np.datetime64('NaT'), dtype='datetime64[D]'),
+        'total_borrowing_cost': np.full(count, np.nan),
+        'net_yield_pa': np.full(count, np.nan),
+        'xirr': np.full(count, np.nan),
+        'xirr_converged': np.zeros(count, dtype=bool),
+        'priced': np.zeros(count, dtype=bool),
+        'error': np.full(count, '', dtype=object),
+    }
+
+    schedules = []
+    for i, params in enumerate(params_list):
+        try:
+            terms = price_terms(params, rate_index)
+        except (RateIndexLookupError, TypeError, ValueError, OverflowError) as error:
+            columns['error'][i] = f"{type(error).__name__}: {error}"
+            continue
+        columns['priced'][i] = True
+        columns['issue_date'][i] = terms['issue_date']
+        columns['maturity_date'][i] = terms['maturity_date']
+        columns['total_borrowing_cost'][i] = terms['total_borrowing_cost']
+        columns['net_yield_pa'][i] = terms['net_yield_pa']
+        schedules.append(terms['schedule'])
+
+    if schedules:
+        batch = solve_schedules_xirr(schedules)
+        columns['xirr'][columns['priced']] = batch.rates
+        columns['xirr_converged'][columns['priced']] = batch.converged
+    return columns
+
+def required_coupon_rate(result, desired_net_yield):
+    """Coupon rate needed for a target net yield p.a. (Reverse Calculator)
+
+    Net Yield = (Coupon - Borrowing Cost) / (Equity * Years), so
+    Coupon = Net Yield * Equity * Years + Borrowing Cost and
+    Required Coupon Rate = Coupon / (Total Invested * asset daycount year fraction).
+    Returns (required_coupon_rate, required_coupon_cashflow), or None when the term is zero.
+    """
+    params = result.params
+    if result.term_years <= 0:
+        return None
+
+    # Calculate required total coupon cash flow
+    required_coupon_cashflow = (desired_net_yield * params.equity * result.term_years) + result.borrowing_cost
+
+    # Calculate required coupon rate based on daycount convention
+    fraction = float(term_year_fraction(params.asset_daycount, result.issue_date, result.maturity_date))
+    required_rate = required_coupon_cashflow / (result.total_invested * fraction)
+    return required_rate, required_coupon_cashflow
@@ -0,0 +1,305 @@
+"""
+Rate index table and lookups
+SOFR reference rates and lender borrowing spreads by financing tenor
+"""
+
+import csv
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from net_yield_engine.curve import RateCurve
+from net_yield_engine._io import file_format, require_pyarrow
+
+RATE_INDEX_COLUMNS = ['Floating Ref', 'M', 'LAST_PRICE', 'Custodian', 'CoF v SOFR', 'Swap Cost', 'Loan Spread']
+
+# Market data shipped with the engine; NET_YIELD_RATE_INDEX points at another CSV or Parquet file
+RATE_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'rate_index.csv')
+
+# Compiled snapshots are shared by every process on the host; NET_YIELD_SNAPSHOT_DIR overrides
+SNAPSHOT_DIR = os.path.join(tempfile.gettempdir(), 'net_yield_snapshots')
+
+# Text columns of the snapshot; the rest are float64 with NaN for blanks
+TEXT_COLUMNS = ('Floating Ref', 'Custodian')
+
+# All rate index inputs to the total cost of borrowing, from one lookup
+RateComponents = namedtuple('RateComponents', [
+    'st_reference_rate',  # LAST_PRICE matched on Floating Ref (C36)
+    'tenor_last_price',   # LAST_PRICE matched on Financing Tenor (C37)
+    'swap_cost',          # Swap Cost matched on Lender and Financing Tenor (C38)
+    'cof_spread',         # CoF v SOFR matched on Lender and Financing Tenor (C39)
+    'bank_spread',        # Loan Spread matched on Lender and Financing Tenor (C40)
+])
+
+class RateIndexLookupError(LookupError):
+    """Raised when no rate index row (or no price) matches a lookup"""
+
+class RateIndex:
+    """Rate index table compiled into hash indexes
+
+    Indexes on Floating Ref, on M and on (Custodian, M) keep the first matching row,
+    the same row the Excel LOOKUPs and the old DataFrame filters returned.
+    """
+
+    def __init__(self, rows, version=None):
+        self.rows = list(rows)
+        self.version = rows_version(self.rows) if version is None else version
+        self._by_floating_ref = {}
+        self._by_tenor = {}
+        self._by_custodian_tenor = {}
+        self._curves = {}
+        for row in self.rows:
+            tenor = float(row['M'])
+            if row['Floating Ref'] is not None:
+                self._by_floating_ref.setdefault(row['Floating Ref'], row)
+            self._by_tenor.setdefault(tenor, row)
+            self._by_custodian_tenor.setdefault((row['Custodian'], tenor), row)
+
+    def __len__(self):
+        return len(self.rows)
+
+    # Compared and hashed by version (a digest of the rows), so an index can sit in cache and memo keys
+    def __eq__(self, other):
+        return isinstance(other, RateIndex) and other.version == self.version
+
+    def __hash__(self):
+        return hash(self.version)
+
+    @classmethod
+    def from_records(cls, records, version=None):
+        """RateIndex over a snapshot structured array (see compile_rate_index_snapshot)"""
+        return cls(records_to_rows(records), version)
+
+    def row_for_floating_ref(self, floating_ref):
+        """First row with the given Floating Ref"""
+        row = self._by_floating_ref.get(floating_ref)
+        if row is None:
+            raise RateIndexLookupError(f"No rate index row for Floating Ref {floating_ref!r}")
+        return row
+
+    def row_for_tenor(self, tenor_months):
+        """First row with the given tenor in months"""
+        row = self._by_tenor.get(float(tenor_months))
+        if row is None:
+            raise RateIndexLookupError(f"No rate index row for a {tenor_months:g}M tenor")
+        return row
+
+    def row_for_custodian_tenor(self, custodian, tenor_months):
+        """Row for the given custodian and tenor in months"""
+        row = self._by_custodian_tenor.get((custodian, float(tenor_months)))
+        if row is None:
+            raise RateIndexLookupError(f"No rate index row for {custodian} at a {tenor_months:g}M tenor")
+        return row
+
+    def tenor_curve(self, method='linear'):
+        """LAST_PRICE curve by tenor, built once per method from the priced rows"""
+        key = ('LAST_PRICE', None, method)
+        if key not in self._curves:
+            pillars = {}
+            for row in self.rows:
+                if row['LAST_PRICE'] is not None:
+                    pillars.setdefault(float(row['M']), row['LAST_PRICE'])
+            self._curves[key] = RateCurve(list(pillars), list(pillars.values()), method)
+        return self._curves[key]
+
+    def spread_curve(self, custodian, column, method='linear'):
+        """Curve of one lender cost column (Swap Cost, CoF v SOFR, Loan Spread) by tenor"""
+        key = (column, custodian, method)
+        if key not in self._curves:
+            pillars = {tenor: row[column] for (row_custodian, tenor), row in self._by_custodian_tenor.items()
+                       if row_custodian == custodian and row[column] is not None}
+            if not pillars:
+                raise RateIndexLookupError(f"No rate index rows for {custodian}")
+            self._curves[key] = RateCurve(list(pillars), list(pillars.values()), method)
+        return self._curves[key]
+
+    def borrowing_components(self, floating_ref, tenor_months, custodian, interpolation=None):
+        """Look up every borrowing cost component for one note
+
+        Exact table rows are used whenever they exist. With an interpolation method
+        ('linear', 'log-linear' or 'monotone-cubic'), tenors missing from the table or
+        without a LAST_PRICE are read off the tenor and lender spread curves instead of
+        raising RateIndexLookupError.
+        """
+        st_row = self.row_for_floating_ref(floating_ref)
+        if st_row['LAST_PRICE'] is None:
+            raise RateIndexLookupError(f"No LAST_PRICE for Floating Ref {floating_ref!r}")
+
+        tenor_row = self._by_tenor.get(float(tenor_months))
+        if tenor_row is not None and tenor_row['LAST_PRICE'] is not None:
+            tenor_last_price = tenor_row['LAST_PRICE']
+        elif interpolation is not None:
+            tenor_last_price = self.tenor_curve(interpolation)(tenor_months)
+        elif tenor_row is None:
+            raise RateIndexLookupError(f"No rate index row for a {tenor_months:g}M tenor")
+        else:
+            raise RateIndexLookupError(f"No LAST_PRICE for a {tenor_months:g}M tenor")
+
+        lender_row = self._by_custodian_tenor.get((custodian, float(tenor_months)))
+        if lender_row is not None:
+            swap_cost = lender_row['Swap Cost']
+            cof_spread = lender_row['CoF v SOFR']
+            bank_spread = lender_row['Loan Spread']
+        elif interpolation is not None:
+            swap_cost = self.spread_curve(custodian, 'Swap Cost', interpolation)(tenor_months)
+            cof_spread = self.spread_curve(custodian, 'CoF v SOFR', interpolation)(tenor_months)
+            bank_spread = self.spread_curve(custodian, 'Loan Spread', interpolation)(tenor_months)
+        else:
+            raise RateIndexLookupError(f"No rate index row for {custodian} at a {tenor_months:g}M tenor")
+
+        return RateComponents(
+            st_reference_rate=st_row['LAST_PRICE'],
+            tenor_last_price=tenor_last_price,
+            swap_cost=swap_cost,
+            cof_spread=cof_spread,
+            bank_spread=bank_spread,
+        )
+
+def rows_version(rows):
+    """Version token of rate index rows: a digest of their values, so equal data gives equal tokens"""
+    text = '\n'.join(repr([row[column] for column in RATE_INDEX_COLUMNS]) for row in rows)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+def _cell(value, column):
+    if value is None or (isinstance(value, str) and value.strip() == ''):
+        return None
+    if column in TEXT_COLUMNS:
+        return str(value).strip()
+    number = float(value)
+    return None if number != number else number
+
+def read_table_records(path, columns):
+    """Records (dicts) of a CSV or Parquet file, checking that columns are present"""
+    if file_format(path) == 'parquet':
+        records = require_pyarrow().parquet.read_table(path).to_pylist()
+    else:
+        with open(path, newline='') as handle:
+            records = list(csv.DictReader(handle))
+    missing = [column for column in columns if records and column not in records[0]]
+    if missing:
+        raise ValueError(f"Rate index file {path} is missing columns {missing}")
+    return records
+
+def record_to_row(record):
+    """Rate index row from one file record; blank cells (and NaN in Parquet) become None"""
+    return {column: _cell(record[column], column) for column in RATE_INDEX_COLUMNS}
+
+def read_rate_index_file(path):
+    """Rate index rows (dicts keyed by RATE_INDEX_COLUMNS) from a CSV or Parquet file"""
+    return [record_to_row(record) for record in read_table_records(path, RATE_INDEX_COLUMNS)]
+
+def rows_to_records(rows):
+    """Pack rate index rows into a NumPy structured array (None as '' or NaN)"""
+    text_width = max([len(row[column] or '') for row in rows for column in TEXT_COLUMNS] + [1])
+    dtype = [(column, f'U{text_width}' if column in TEXT_COLUMNS else 'f8') for column in RATE_INDEX_COLUMNS]
+    records = np.empty(len(rows), dtype=dtype)
+    for column in RATE_INDEX_COLUMNS:
+        blank = '' if column in TEXT_COLUMNS else np.nan
+        records[column] = [blank if row[column] is None else row[column] for row in rows]
+    return records
+
+def records_to_rows(records):
+    """Rate index rows from a snapshot structured array"""
+    columns = {column: records[column].tolist() for column in RATE_INDEX_COLUMNS}
+    return [
+        {column: None if value == '' or value != value else value
+         for column, value in zip(RATE_INDEX_COLUMNS, values)}
+        for values in zip(*(columns[column] for column in RATE_INDEX_COLUMNS))
+    ]
+
+def file_digest(path):
+    with open(path, 'rb') as handle:
+        return hashlib.sha256(handle.read()).hexdigest()[:16]
+
+def compile_rate_index_snapshot(source, snapshot_dir=None):
+    """Compile a rate index file into a .npy snapshot and return the snapshot path
+
+    Snapshots are named by a digest of the source file's contents, so replicas reading
+    the same data share one file and a changed file never reuses a stale snapshot.
+    Existing snapshots are reused; new ones are written atomically.
+    """
+    snapshot_dir = snapshot_dir or os.environ.get('NET_YIELD_SNAPSHOT_DIR') or SNAPSHOT_DIR
+    path = os.path.join(snapshot_dir, f"rate_index-{file_digest(source)}.npy")
+    if not os.path.exists(path):
+        os.makedirs(snapshot_dir, exist_ok=True)
+        records = rows_to_records(read_rate_index_file(source))
+        handle, temporary = tempfile.mkstemp(suffix='.npy', dir=snapshot_dir)
+        with os.fdopen(handle, 'wb') as output:
+            np.save(output, records)
+        os.replace(temporary, path)
+    return path
+
+def load_rate_index_snapshot(path):
+    """Memory-mapped, read-only view of a compiled snapshot
+
+    Processes mapping the same snapshot share its pages through the OS page cache.
+    """
+    return np.load(path, mmap_mode='r')
+
+SnapshotInfo = namedtuple('SnapshotInfo', ['hits', 'misses', 'version', 'source', 'snapshot'])
+
+class RateIndexSource:
+    """RateIndex backed by a market data file, reloaded when the file changes
+
+    current() returns the loaded RateIndex, checking the file's mtime and size at
+    most every check_interval seconds and recompiling the snapshot when they change.
+    Thread-safe; a reload swaps in a new RateIndex with a new version.
+    """
+
+    def __init__(self, path, snapshot_dir=None, check_interval=1.0):
+        self.path = path
+        self.snapshot_dir = snapshot_dir
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+        self.snapshot = None
+        self._index = None
+        self._stamp = None
+        self._checked = -float('inf')
+        self._lock = threading.Lock()
+
+    def current(self):
+        now = time.monotonic()
+        index = self._index
+        if index is not None and now - self._checked < self.check_interval:
+            with self._lock:
+                self.hits += 1
+            return index
+        with self._lock:
+            self._checked = now
+            status = os.stat(self.path)
+            stamp = (status.st_mtime_ns, status.st_size)
+            if self._index is not None and stamp == self._stamp:
+                self.hits += 1
+                return self._index
+            self.snapshot = compile_rate_index_snapshot(self.path, self.snapshot_dir)
+            self._index = RateIndex.from_records(load_rate_index_snapshot(self.snapshot))
+            self._stamp = stamp
+            self.misses += 1
+            return self._index
+
+    def cache_info(self):
+        """Lookups served by the loaded index (hits) and loads (misses)"""
+        version = self._index.version if self._index is not None else None
+        return SnapshotInfo(self.hits, self.misses, version, self.path, self.snapshot)
+
+_default_source = None
+_default_source_lock = threading.Lock()
+
+def default_rate_source():
+    """Process-wide RateIndexSource for NET_YIELD_RATE_INDEX or the bundled table"""
+    global _default_source
+    if _default_source is None:
+        with _default_source_lock:
+            if _default_source is None:
+                _default_source = RateIndexSource(os.environ.get('NET_YIELD_RATE_INDEX') or RATE_INDEX_PATH)
+    return _default_source
+
+def default_rate_index():
+    """Current RateIndex of the default market data file, reloaded when it changes"""
+    return default_rate_source().current()
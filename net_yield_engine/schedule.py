@@ -0,0 +1,324 @@
+"""
+Cash flow calculations
+Daycount cash flows and the XIRR payment schedule
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from net_yield_engine.daycount import DAYCOUNT_BASIS, period_year_fractions, year_fraction
+
+# Payment frequency mapping - months increment per payment
+PAYMENT_FREQUENCY_MONTHS = {
+    "Quarterly": 3,
+    "Semi-Annual": 6,
+    "Annual": 12,
+    "At Maturity": None  # Special case - only pays at end
+}
+
+def payment_frequency_months(frequency):
+    """Months between payments for a frequency name (None for At Maturity)"""
+    try:
+        return PAYMENT_FREQUENCY_MONTHS[frequency]
+    except KeyError:
+        raise ValueError(f"Unknown payment frequency {frequency!r}") from None
+
+def calculate_cashflow(amount, rate, days, convention):
+    """Calculate cash flow from a day count under a fixed-basis daycount convention"""
+    try:
+        basis = DAYCOUNT_BASIS[convention]
+    except KeyError:
+        raise ValueError(f"{convention!r} has no fixed basis; use daycount.accrued with dates") from None
+    return amount * rate * days / basis
+
+class CashflowSchedule(namedtuple('CashflowSchedule', ['dates', 'principal', 'interest', 'coupon', 'total'])):
+    """Columnar XIRR schedule: datetime64[D] dates and float64 cash flow columns
+
+    Row 0 is the initial equity outflow on the start date; the remaining rows are the
+    merged interest and coupon payment dates, ending at maturity.
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.dates)
+
+    def year_fractions(self):
+        """Year fractions (days / 365.25) from the start date, as used by XIRR"""
+        days = self.dates.astype(np.int64)
+        return (days - days[0]).astype(np.float64) / 365.25
+
+def add_months(start_date, months):
+    """Shift dates by month offsets (broadcast together), clipping to month end like relativedelta"""
+    start = np.asarray(start_date, dtype='datetime64[D]')
+    start_month = start.astype('datetime64[M]')
+    day_index = (start - start_month.astype('datetime64[D]')).astype(np.int64)
+    target_months = start_month + np.asarray(months, dtype=np.int64)
+    first_days = target_months.astype('datetime64[D]')
+    month_lengths = ((target_months + 1).astype('datetime64[D]') - first_days).astype(np.int64)
+    return first_days + np.minimum(day_index, month_lengths - 1)
+
+def generate_payment_dates(start_date, end_date, months_increment):
+    """Payment dates every months_increment months after start, strictly before end"""
+    if months_increment is None:
+        # "At Maturity" case - payment only at end_date
+        return np.empty(0, dtype='datetime64[D]')
+
+    start = np.datetime64(start_date, 'D')
+    end = np.datetime64(end_date, 'D')
+    months_between = int(end.astype('datetime64[M]').astype(np.int64) - start.astype('datetime64[M]').astype(np.int64))
+    periods = np.arange(1, months_between // months_increment + 2)
+    dates = add_months(start, periods * months_increment)
+    return dates[dates < end]
+
+def _accruals(payment_dates, start, end, convention):
+    """Accrual end dates (payments plus maturity) and the year fraction of each period"""
+    boundaries = np.concatenate(([start], payment_dates, [end]))
+    return boundaries[1:], period_year_fractions(convention, boundaries)
+
+def adjust_payment_dates(dates, end, calendar, convention):
+    """Roll payment dates onto business days, dropping any that land on or after maturity"""
+    if calendar is None or len(dates) == 0:
+        return dates
+    adjusted = np.unique(calendar.adjust(dates, convention))
+    return adjusted[adjusted < end]
+
+def build_cashflow_schedule(equity, loan_notional, total_invested, interest_rate, coupon_rate,
+                            start_date, end_date, interest_freq, coupon_freq,
+                            interest_daycount="A/360", coupon_daycount="A/360",
+                            calendar=None, business_day_convention="Modified Following"):
+    """Build the XIRR cash flow schedule as NumPy columns
+
+    Interest and coupon dates are generated with month-offset arithmetic and merged
+    with maturity in one sorted union; each leg's accruals are scattered onto the
+    merged dates with searchsorted. Interest accrues under the liability daycount and
+    coupons under the asset daycount; the A/360 defaults match the workbook's
+    (date_diff)/360 columns. With a BusinessCalendar, intermediate payment dates
+    are rolled by business_day_convention and accrue to the adjusted dates; without one
+    the dates are left unadjusted as in the workbook.
+    """
+    start = np.datetime64(start_date, 'D')
+    end = np.datetime64(end_date, 'D')
+
+    interest_dates = generate_payment_dates(start, end, payment_frequency_months(interest_freq))
+    coupon_dates = generate_payment_dates(start, end, payment_frequency_months(coupon_freq))
+    interest_dates = adjust_payment_dates(interest_dates, end, calendar, business_day_convention)
+    coupon_dates = adjust_payment_dates(coupon_dates, end, calendar, business_day_convention)
+
+    # Start with initial investment date, then all unique payment dates including end_date
+    payment_dates = np.union1d(np.union1d(interest_dates, coupon_dates), [end])
+    dates = np.append(start, payment_dates)
+    n = len(dates)
+
+    principal = np.zeros(n)
+    interest = np.zeros(n)
+    coupon = np.zeros(n)
+
+    # Initial equity outflow and principal return at maturity
+    principal[0] = -equity
+    principal[-1] = equity
+
+    # Interest Payment = -Loan_Drawn * Interest_Rate * year fraction (date_diff/360 for A/360)
+    interest_ends, interest_fractions = _accruals(interest_dates, start, end, interest_daycount)
+    interest[np.searchsorted(dates, interest_ends)] = -loan_notional * interest_rate * interest_fractions
+
+    # Coupon Payment = Invested * Coupon_Rate * year fraction
+    coupon_ends, coupon_fractions = _accruals(coupon_dates, start, end, coupon_daycount)
+    coupon[np.searchsorted(dates, coupon_ends)] = total_invested * coupon_rate * coupon_fractions
+
+    # Total cash flow (Column F = sum of C, D, E)
+    total = principal + interest + coupon
+
+    return CashflowSchedule(dates, principal, interest, coupon, total)
+
+# Calendar periods the schedule can be summarized by - months per period
+SCHEDULE_PERIODS = {
+    "Quarter": 3,
+    "Year": 12,
+}
+
+ScheduleSummary = namedtuple('ScheduleSummary', [
+    'period_start',  # first day of each calendar period with cash flows (datetime64[D])
+    'rows',          # schedule rows in the period
+    'principal',
+    'interest',
+    'coupon',
+    'total',
+    'cumulative',    # running total cash flow to the end of the period
+])
+
+def aggregate_schedule(schedule, period="Year"):
+    """Sum a CashflowSchedule's columns by calendar quarter or year
+
+    The schedule's dates are sorted, so each period is a contiguous run of rows and
+    the sums are one np.add.reduceat per column; the result has one row per period
+    however many payments the schedule has.
+    """
+    try:
+        months = SCHEDULE_PERIODS[period]
+    except KeyError:
+        raise ValueError(f"Unknown schedule period {period!r}") from None
+    if not len(schedule):
+        empty = np.empty(0)
+        return ScheduleSummary(np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.int64),
+                               empty, empty, empty, empty, empty)
+    buckets = schedule.dates.astype('datetime64[M]').astype(np.int64) // months
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    total = np.add.reduceat(schedule.total, starts)
+    return ScheduleSummary(
+        period_start=(buckets[starts] * months).astype('datetime64[M]').astype('datetime64[D]'),
+        rows=np.diff(np.append(starts, len(buckets))),
+        principal=np.add.reduceat(schedule.principal, starts),
+        interest=np.add.reduceat(schedule.interest, starts),
+        coupon=np.add.reduceat(schedule.coupon, starts),
+        total=total,
+        cumulative=np.cumsum(total),
+    )
+
+def generate_xirr_cashflows(equity, loan_notional, total_invested, interest_rate, coupon_rate,
+                           start_date, end_date, interest_freq, coupon_freq,
+                           interest_daycount="A/360", coupon_daycount="A/360",
+                           calendar=None, business_day_convention="Modified Following"):
+    """Generate cash flows for XIRR calculation according to Complete_Net_Yield_Simulator_Requirements
+
+    List-based wrapper around build_cashflow_schedule; dates come back as datetime.date.
+    """
+    schedule = build_cashflow_schedule(equity, loan_notional, total_invested, interest_rate, coupon_rate,
+                                       start_date, end_date, interest_freq, coupon_freq,
+                                       interest_daycount, coupon_daycount, calendar, business_day_convention)
+    return (schedule.dates.tolist(), schedule.principal.tolist(), schedule.interest.tolist(),
+            schedule.coupon.tolist(), schedule.total.tolist())
+
+class ScheduleBuffer:
+    """Cash flow schedules of many notes stored back to back in flat arrays
+
+    Note i occupies rows offsets[i]:offsets[i + 1] of every column (none when it has
+    no schedule). The flat year fractions and total column with offsets are exactly
+    what solve_xirr_ragged takes, so the solver needs no per-note arrays.
+    """
+
+    __slots__ = ('dates', 'principal', 'interest', 'coupon', 'total', 'offsets')
+
+    def __init__(self, dates, principal, interest, coupon, total, offsets):
+        self.dates = dates
+        self.principal = principal
+        self.interest = interest
+        self.coupon = coupon
+        self.total = total
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+    def schedule(self, index):
+        """CashflowSchedule of one note, as views into the buffer"""
+        rows = slice(self.offsets[index], self.offsets[index + 1])
+        return CashflowSchedule(self.dates[rows], self.principal[rows], self.interest[rows], self.coupon[rows],
+                                self.total[rows])
+
+    def year_fractions(self):
+        """XIRR year fractions of every row from the first date of its own schedule"""
+        days = self.dates.astype(np.int64)
+        lengths = np.diff(self.offsets)
+        first = np.repeat(days[self.offsets[:-1][lengths > 0]], lengths[lengths > 0])
+        return (days - first).astype(np.float64) / 365.25
+
+def _leg_accruals(starts, ends, months, daycounts):
+    """Accrual periods of one leg for many notes: (note, accrual end, year fraction) rows
+
+    Payment dates are generated as in generate_payment_dates (months 0 means At
+    Maturity) and every note's leg ends with an accrual to its end date. Rows come
+    sorted by note and date.
+    """
+    count = len(starts)
+    start_months = starts.astype('datetime64[M]').astype(np.int64)
+    months_between = ends.astype('datetime64[M]').astype(np.int64) - start_months
+    payments = np.where(months > 0, np.maximum(months_between // np.maximum(months, 1) + 1, 0), 0)
+    note = np.repeat(np.arange(count), payments)
+    period = np.arange(len(note)) - np.repeat(np.cumsum(payments) - payments, payments) + 1
+    dates = add_months(starts[note], period * months[note])
+    keep = dates < ends[note]
+    note, dates = note[keep], dates[keep]
+
+    # Payments then the end date of each note, in note order (payments are already ascending)
+    order = np.argsort(np.concatenate([note, np.arange(count)]), kind='stable')
+    note = np.concatenate([note, np.arange(count)])[order]
+    period_ends = np.concatenate([dates, ends])[order]
+    period_starts = np.empty_like(period_ends)
+    period_starts[1:] = period_ends[:-1]
+    first = np.ones(len(note), dtype=bool)
+    first[1:] = note[1:] != note[:-1]
+    period_starts[first] = starts[note[first]]
+
+    fractions = np.empty(len(note))
+    conventions, codes = np.unique(daycounts, return_inverse=True)
+    codes = codes.reshape(-1)[note]
+    for code, convention in enumerate(conventions.tolist()):
+        rows = codes == code
+        fractions[rows] = year_fraction(convention, period_starts[rows], period_ends[rows])
+    return note, period_ends, fractions
+
+def build_schedule_buffer(equity, loan_notional, total_invested, interest_rate, coupon_rate,
+                          start_dates, end_dates, interest_months, coupon_months,
+                          interest_daycounts, coupon_daycounts):
+    """Build the XIRR schedules of many notes at once into one ScheduleBuffer
+
+    Every argument is an array with one entry per note; frequencies are given as
+    months between payments (0 for At Maturity) and daycounts as convention names.
+    The result matches build_cashflow_schedule note by note (with unadjusted dates),
+    but payment dates, accruals and the merged date rows are computed for the whole
+    book in a few array passes.
+    """
+    starts = np.asarray(start_dates, dtype='datetime64[D]')
+    ends = np.asarray(end_dates, dtype='datetime64[D]')
+    count = len(starts)
+    interest_note, interest_ends, interest_fractions = _leg_accruals(
+        starts, ends, np.asarray(interest_months, dtype=np.int64), np.asarray(interest_daycounts, dtype=object))
+    coupon_note, coupon_ends, coupon_fractions = _leg_accruals(
+        starts, ends, np.asarray(coupon_months, dtype=np.int64), np.asarray(coupon_daycounts, dtype=object))
+
+    # Payment rows: the sorted union of both legs' dates per note, after a start row
+    def keys(note, dates):
+        return note.astype(np.int64) << 32 | (dates.astype(np.int64) + (1 << 31))
+
+    # Both legs' keys are already sorted, so a stable sort only has to merge two runs
+    merged = np.sort(np.concatenate([keys(interest_note, interest_ends), keys(coupon_note, coupon_ends)]),
+                     kind='stable')
+    distinct = np.ones(len(merged), dtype=bool)
+    distinct[1:] = merged[1:] != merged[:-1]
+    merged = merged[distinct]
+    merged_note = merged >> 32
+    lengths = np.bincount(merged_note, minlength=count) + 1
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    size = int(offsets[-1])
+
+    dates = np.empty(size, dtype='datetime64[D]')
+    dates[offsets[:-1]] = starts
+    payment_rows = np.arange(len(merged)) + merged_note + 1
+    dates[payment_rows] = ((merged & 0xFFFFFFFF) - (1 << 31)).astype('datetime64[D]')
+
+    principal = np.zeros(size)
+    interest = np.zeros(size)
+    coupon = np.zeros(size)
+    equity = np.broadcast_to(np.asarray(equity, dtype=np.float64), (count,))
+    principal[offsets[:-1]] = -equity
+    principal[offsets[1:] - 1] = equity
+
+    def accrual_rows(note, period_ends):
+        rows = np.searchsorted(merged, keys(note, period_ends)) + note + 1
+        # A term that ends on or before its start accrues on the start row, as in build_cashflow_schedule
+        return np.where(ends[note] > starts[note], rows, offsets[note])
+
+    interest_rows = accrual_rows(interest_note, interest_ends)
+    interest_amount = -np.broadcast_to(np.asarray(loan_notional, dtype=np.float64), (count,)) * interest_rate
+    interest[interest_rows] = np.asarray(interest_amount)[interest_note] * interest_fractions
+    coupon_rows = accrual_rows(coupon_note, coupon_ends)
+    coupon_amount = np.broadcast_to(np.asarray(total_invested * coupon_rate, dtype=np.float64), (count,))
+    coupon[coupon_rows] = coupon_amount[coupon_note] * coupon_fractions
+
+    return ScheduleBuffer(dates, principal, interest, coupon, principal + interest + coupon, offsets)
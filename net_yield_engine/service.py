@@ -0,0 +1,441 @@
+"""
+Pricing service
+JSON-over-HTTP front end to the pricer with request coalescing and a process pool
+
+Endpoints:
+    POST /price    one note (NoteParams fields, rates as decimals, dates as ISO strings)
+                   or a list of notes; add "include_schedule": true for the cash flows
+    POST /xirr     {"dates": [...], "cashflows": [...]}, as calculate_xirr
+    GET  /metrics  request counts, p50/p99 latency, throughput, batch sizes and cache hits
+    GET  /health
+
+Concurrent requests arriving within the batch window are priced together: their
+XIRRs are solved in one batched call in a worker process. Notes already priced on
+the current rate index are answered from a ScenarioCache without reaching a worker.
+
+Usage:
+    python -m net_yield_engine.service serve [--port 8765] [--processes 4] [--window-ms 2]
+    python -m net_yield_engine.service load-test [--url http://127.0.0.1:8765] [--requests 2000] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from net_yield_engine.cache import ScenarioCache, scenario_key
+from net_yield_engine.portfolio import parse_trade
+from net_yield_engine.pricer import price_terms, solve_schedules_xirr
+from net_yield_engine.rates import default_rate_index
+from net_yield_engine.xirr import solve_xirr_ragged, xirr_year_fractions
+
+RESULT_FIELDS = ['issue_date', 'maturity_date', 'term_days', 'term_years', 'total_invested', 'loan_notional',
+                 'total_borrowing_cost', 'coupon_cashflow', 'borrowing_cost', 'net_yield_pa']
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+# Latencies kept for the percentile metrics
+LATENCY_SAMPLES = 10000
+
+def _json_value(value):
+    """JSON-safe scalar: floats as float (NaN as null), dates as ISO strings"""
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+def _error_entry(error):
+    return {'error': f"{type(error).__name__}: {error}"}
+
+def price_requests(requests):
+    """Worker task: price a batch of note requests, solving all XIRRs in one call
+
+    Each request is a mapping of NoteParams fields; the result list matches it in
+    order, with an 'error' entry for notes that cannot be priced. Any failure while
+    pricing one note (a bad field, an overflowing tenor, ...) stays with that note, so
+    the other requests coalesced into the batch are unaffected.
+    """
+    results = [None] * len(requests)
+    priced = []
+    for i, request in enumerate(requests):
+        try:
+            if not isinstance(request, dict):
+                raise TypeError("Expected a JSON object of NoteParams fields")
+            terms = price_terms(parse_trade(request))
+        except Exception as error:
+            results[i] = _error_entry(error)
+            continue
+        priced.append((i, terms))
+
+    if priced:
+        batch = solve_schedules_xirr([terms['schedule'] for _, terms in priced])
+        for (i, terms), rate, converged in zip(priced, batch.rates, batch.converged):
+            result = {name: _json_value(terms[name]) for name in RESULT_FIELDS}
+            result['xirr'] = _json_value(rate)
+            result['xirr_converged'] = bool(converged)
+            if requests[i].get('include_schedule'):
+                schedule = terms['schedule']
+                result['schedule'] = {
+                    'dates': [str(d) for d in schedule.dates],
+                    'principal': schedule.principal.tolist(),
+                    'interest': schedule.interest.tolist(),
+                    'coupon': schedule.coupon.tolist(),
+                    'total': schedule.total.tolist(),
+                }
+            results[i] = result
+    return results
+
+def xirr_requests(requests):
+    """Worker task: solve a batch of {"dates", "cashflows"} XIRR requests together"""
+    results = [None] * len(requests)
+    periods, cashflows, valid = [], [], []
+    for i, request in enumerate(requests):
+        try:
+            dates = request['dates']
+            flows = np.asarray(request['cashflows'], dtype=np.float64)
+            if len(dates) != len(flows):
+                raise ValueError("dates and cashflows differ in length")
+            fractions = xirr_year_fractions(dates) if len(dates) else np.empty(0)
+        except Exception as error:
+            results[i] = _error_entry(error)
+            continue
+        periods.append(fractions)
+        cashflows.append(flows)
+        valid.append(i)
+
+    if valid:
+        offsets = np.zeros(len(valid) + 1, dtype=np.int64)
+        np.cumsum([len(flows) for flows in cashflows], out=offsets[1:])
+        batch = solve_xirr_ragged(np.concatenate(periods), np.concatenate(cashflows), offsets)
+        for i, rate, converged, iterations in zip(valid, batch.rates, batch.converged, batch.iterations):
+            results[i] = {'xirr': _json_value(rate), 'converged': bool(converged), 'iterations': int(iterations)}
+    return results
+
+async def _rejected_item():
+    return {'error': "Expected a JSON object"}
+
+class RequestBatcher:
+    """Coalesce concurrent requests into batched worker calls
+
+    Requests wait at most window seconds (or until max_batch are queued); the batch
+    then runs as one function(requests) call in the executor and each caller gets
+    its own result back.
+    """
+
+    def __init__(self, executor, function, window=0.002, max_batch=256, metrics=None):
+        self.executor = executor
+        self.function = function
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = metrics
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, request):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if self.metrics is not None:
+            self.metrics.record_batch(len(batch))
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self.executor, self.function, [request for request, _ in batch])
+        task.add_done_callback(lambda done: self._deliver(done, batch))
+
+    @staticmethod
+    def _deliver(done, batch):
+        # The worker reports per-request failures as results; an exception here means
+        # the batch itself failed (e.g. a broken worker process), so every caller sees it
+        error = done.exception()
+        results = None if error is not None else done.result()
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(results[i])
+
+class ServiceMetrics:
+    """Request counts, latency percentiles, throughput and batch sizes"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = {}
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.completed = deque(maxlen=LATENCY_SAMPLES)
+        self.batches = 0
+        self.batched_requests = 0
+        self.max_batch = 0
+        self.cache = None
+
+    def record(self, path, seconds, ok):
+        self.requests[path] = self.requests.get(path, 0) + 1
+        self.errors += 0 if ok else 1
+        self.latencies.append(seconds)
+        self.completed.append(time.perf_counter())
+
+    def record_batch(self, size):
+        self.batches += 1
+        self.batched_requests += size
+        self.max_batch = max(self.max_batch, size)
+
+    def snapshot(self):
+        now = time.perf_counter()
+        latencies = np.array(self.latencies) * 1000
+        # Throughput over the window covered by the recent completions
+        recent = [t for t in self.completed if now - t <= 10.0]
+        span = min(10.0, now - self.started)
+        return {
+            'uptime_seconds': now - self.started,
+            'requests': dict(self.requests),
+            'errors': self.errors,
+            'latency_ms': {
+                'p50': float(np.percentile(latencies, 50)) if len(latencies) else None,
+                'p99': float(np.percentile(latencies, 99)) if len(latencies) else None,
+                'max': float(latencies.max()) if len(latencies) else None,
+                'samples': len(latencies),
+            },
+            'throughput_per_second': len(recent) / span if span > 0 else 0.0,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_requests / self.batches if self.batches else 0.0,
+            'max_batch_size': self.max_batch,
+            'cache': None if self.cache is None else self.cache.stats()._asdict(),
+        }
+
+class PricingService:
+    """asyncio HTTP/1.1 server (keep-alive, JSON bodies) in front of the batchers"""
+
+    def __init__(self, processes=None, window=0.002, max_batch=256, cache_bytes=64 * 1024 * 1024):
+        if processes is None:
+            processes = os.cpu_count() or 1
+        # processes=0 prices on a thread in this process (no pickling; handy for tests)
+        self.executor = ThreadPoolExecutor(1) if processes == 0 else ProcessPoolExecutor(processes)
+        self.metrics = ServiceMetrics()
+        self.cache = ScenarioCache(max_bytes=cache_bytes)
+        self.metrics.cache = self.cache
+        self.batchers = {
+            '/price': RequestBatcher(self.executor, price_requests, window, max_batch, self.metrics),
+            '/xirr': RequestBatcher(self.executor, xirr_requests, window, max_batch, self.metrics),
+        }
+
+    async def _price(self, request):
+        """Price one /price request, answering repeats of a scenario from the cache
+
+        Results are keyed on the note's inputs and the current rate index version, so
+        a reloaded rate index never serves results priced on the old data. Requests
+        that do not parse go to the batch as they are and come back with their error.
+        """
+        try:
+            key = scenario_key(parse_trade(request), default_rate_index().version)
+        except Exception:
+            return await self.batchers['/price'].submit(request)
+        if request.get('include_schedule'):
+            key += ':schedule'
+        result = self.cache.get(key)
+        if result is None:
+            result = await self.batchers['/price'].submit(request)
+            if 'error' not in result:
+                self.cache.put(key, result, size=len(json.dumps(result)))
+        return result
+
+    async def _route(self, method, path, body):
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/metrics':
+            return 200, self.metrics.snapshot()
+        batcher = self.batchers.get(path)
+        if batcher is None:
+            return 404, {'error': f"Unknown path {path}"}
+        if method != 'POST':
+            return 405, {'error': f"{path} expects POST"}
+        try:
+            payload = json.loads(body or b'null')
+        except ValueError as error:
+            return 400, {'error': f"Invalid JSON: {error}"}
+        submit = self._price if path == '/price' else batcher.submit
+        if isinstance(payload, list):
+            # Items that are not objects are answered here and never reach a batch
+            results = await asyncio.gather(*(
+                submit(item) if isinstance(item, dict) else _rejected_item()
+                for item in payload
+            ))
+            return 200, results
+        if not isinstance(payload, dict):
+            return 400, {'error': "Expected a JSON object or a list of objects"}
+        result = await submit(payload)
+        return (400 if 'error' in result else 200), result
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                start = time.perf_counter()
+                path = urlsplit(target).path
+                try:
+                    status, payload = await self._route(method, path, body)
+                except Exception as error:
+                    status, payload = 500, {'error': f"{type(error).__name__}: {error}"}
+                if path not in ('/metrics', '/health'):
+                    self.metrics.record(path, time.perf_counter() - start, status == 200)
+
+                data = json.dumps(payload).encode()
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write(
+                    f"{version} {status} {STATUS_TEXT[status]}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Pricing service on http://{host}:{port} (POST /price, POST /xirr, GET /metrics)")
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown()
+
+async def _http_json(reader, writer, method, path, host, payload=None):
+    """One keep-alive JSON request on an open connection; returns (status, body)"""
+    data = b'' if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+def sample_request(rng):
+    """A random but realistic /price request body"""
+    return {
+        'trade_date': '2025-01-06',
+        'tenor_years': float(rng.choice([1.0, 2.0, 3.0, 5.0, 10.0])),
+        'financing_tenor': int(rng.choice([1, 3, 6, 12, 24])),
+        'interest_freq': str(rng.choice(['Quarterly', 'Semi-Annual', 'Annual'])),
+        'coupon_freq': str(rng.choice(['Annual', 'Semi-Annual', 'Quarterly', 'At Maturity'])),
+        'coupon_rate': float(rng.uniform(0.03, 0.12)),
+        'ltv': float(rng.uniform(0.5, 0.9)),
+        'lender': str(rng.choice(['CAI', 'DB', 'SG', 'Barc'])),
+    }
+
+async def load_test(url='http://127.0.0.1:8765', requests=2000, concurrency=32, seed=0):
+    """Drive /price with concurrent keep-alive clients; returns client-side and server metrics"""
+    parts = urlsplit(url)
+    rng = np.random.default_rng(seed)
+    bodies = [sample_request(rng) for _ in range(requests)]
+    latencies = []
+    failures = 0
+
+    async def client(worker):
+        nonlocal failures
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port)
+        try:
+            for body in bodies[worker::concurrency]:
+                start = time.perf_counter()
+                status, _ = await _http_json(reader, writer, 'POST', '/price', parts.netloc, body)
+                latencies.append(time.perf_counter() - start)
+                failures += status != 200
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(worker) for worker in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port)
+    _, server = await _http_json(reader, writer, 'GET', '/metrics', parts.netloc)
+    writer.close()
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'non_200': failures,
+        'seconds': elapsed,
+        'throughput_per_second': requests / elapsed,
+        'latency_ms': {'p50': float(np.percentile(latencies, 50)), 'p99': float(np.percentile(latencies, 99))},
+        'server': server,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help="run the pricing service")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--processes', type=int, default=None, help="worker processes (0 prices in-process)")
+    serve.add_argument('--window-ms', type=float, default=2.0, help="request coalescing window")
+    serve.add_argument('--max-batch', type=int, default=256)
+    serve.add_argument('--cache-mb', type=float, default=64.0, help="scenario cache size (0 disables it)")
+    client = commands.add_parser('load-test', help="load-test a running service")
+    client.add_argument('--url', default='http://127.0.0.1:8765')
+    client.add_argument('--requests', type=int, default=2000)
+    client.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        service = PricingService(args.processes, args.window_ms / 1000, args.max_batch,
+                                 int(args.cache_mb * 1024 * 1024))
+        try:
+            asyncio.run(service.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.close()
+        return 0
+
+    print(json.dumps(asyncio.run(load_test(args.url, args.requests, args.concurrency)), indent=2))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Reverse solver
+Coupon rate, LTV or borrowing spread needed to hit vectors of XIRR or net yield targets
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from net_yield_engine.daycount import term_year_fraction
+from net_yield_engine.pricer import NoteParams, price_terms
+from net_yield_engine.rates import RateIndexLookupError
+from net_yield_engine.schedule import build_cashflow_schedule
+
+SOLVE_FOR = ['coupon_rate', 'ltv', 'borrowing_spread']
+SOLVE_TARGETS = ['xirr', 'net_yield_pa']
+
+def note_legs(params, rate_index):
+    """Pricing terms plus the note's unit cash flow legs
+
+    The unit schedule is built with a notional and rate of 1, so its interest and
+    coupon columns are the accrual year fractions on each payment date.
+    """
+    terms = price_terms(params, rate_index)
+    unit = build_cashflow_schedule(
+        params.equity, 1.0, 1.0, 1.0, 1.0, terms['issue_date'], terms['maturity_date'],
+        params.interest_freq, params.coupon_freq, params.liability_daycount, params.asset_daycount
+    )
+    return terms, unit
+
+def _xirr_components(units, targets):
+    """Discounted principal, coupon and interest legs per note at each target rate
+
+    With df = (1 + target) ** -t the note's NPV at a target is
+    P + Total_Invested * coupon_rate * C - Loan * borrowing_rate * I,
+    which is linear in the coupon rate, the borrowing rate and the loan notional.
+    """
+    offsets = np.zeros(len(units) + 1, dtype=np.int64)
+    np.cumsum([len(unit) for unit in units], out=offsets[1:])
+    periods = np.concatenate([unit.year_fractions() for unit in units])
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        discount = np.power(1 + targets[None, :], -periods[:, None])
+    starts = offsets[:-1]
+    principal = np.add.reduceat(np.concatenate([unit.principal for unit in units])[:, None] * discount, starts)
+    coupon = np.add.reduceat(np.concatenate([unit.coupon for unit in units])[:, None] * discount, starts)
+    interest = np.add.reduceat(-np.concatenate([unit.interest for unit in units])[:, None] * discount, starts)
+    return principal, coupon, interest
+
+def solve_required(params_list, targets, solve_for='coupon_rate', target='xirr', rate_index=None):
+    """Input needed for each note to hit each target, as a (notes, targets) array
+
+    solve_for is 'coupon_rate', 'ltv' or 'borrowing_spread' (extra spread over the
+    note's current total borrowing cost that brings it down to the target, i.e. the
+    maximum spread it can absorb); target is 'xirr' or 'net_yield_pa'. At a fixed
+    target rate the note's NPV (and its net yield) is linear in each of these
+    inputs, so every note and target is solved in closed form in one vectorized pass
+    rather than by root finding. Unreachable targets (e.g. an LTV outside [0, 1)) and
+    notes that cannot be priced come back as NaN. A single NoteParams gives a 1-D
+    array over targets.
+    """
+    if solve_for not in SOLVE_FOR:
+        raise ValueError(f"Cannot solve for {solve_for!r}; expected one of {SOLVE_FOR}")
+    if target not in SOLVE_TARGETS:
+        raise ValueError(f"Unknown target {target!r}; expected one of {SOLVE_TARGETS}")
+
+    single = isinstance(params_list, (NoteParams, Mapping))
+    if single:
+        params_list = [params_list]
+    targets = np.atleast_1d(np.asarray(targets, dtype=np.float64))
+    solved = np.full((len(params_list), len(targets)), np.nan)
+
+    notes = []
+    for i, params in enumerate(params_list):
+        if isinstance(params, Mapping):
+            params = NoteParams(**params)
+        try:
+            terms, unit = note_legs(params, rate_index)
+        except (RateIndexLookupError, ValueError):
+            continue
+        notes.append((i, params, terms, unit))
+    if not notes:
+        return solved[0] if single else solved
+
+    rows = np.array([i for i, _, _, _ in notes])
+    equity = np.array([params.equity for _, params, _, _ in notes])[:, None]
+    coupon_rate = np.array([params.coupon_rate for _, params, _, _ in notes])[:, None]
+    borrowing_rate = np.array([terms['total_borrowing_cost'] for _, _, terms, _ in notes])[:, None]
+    loan = np.array([terms['loan_notional'] for _, _, terms, _ in notes])[:, None]
+    invested = equity + loan
+
+    if target == 'xirr':
+        principal, coupon, interest = _xirr_components([unit for _, _, _, unit in notes], targets)
+        base = principal
+    else:
+        # Net yield p.a. * Equity * Years = Invested * coupon_rate * asset fraction - Loan * rate * liability fraction
+        years = np.array([terms['term_years'] for _, _, terms, _ in notes], dtype=np.float64)[:, None]
+        coupon = np.array([float(term_year_fraction(params.asset_daycount, terms['issue_date'], terms['maturity_date']))
+                           for _, params, terms, _ in notes])[:, None]
+        interest = np.array([float(term_year_fraction(params.liability_daycount, terms['issue_date'],
+                                                      terms['maturity_date']))
+                             for _, params, terms, _ in notes])[:, None]
+        base = np.where(years > 0, -targets[None, :] * equity * years, np.nan)
+
+    # Solve base + Invested * coupon_rate * coupon - Loan * borrowing_rate * interest = 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if solve_for == 'coupon_rate':
+            values = (loan * borrowing_rate * interest - base) / (invested * coupon)
+        elif solve_for == 'borrowing_spread':
+            values = (base + invested * coupon_rate * coupon) / (loan * interest) - borrowing_rate
+        else:
+            required_loan = -(base + equity * coupon_rate * coupon) / (coupon_rate * coupon - borrowing_rate * interest)
+            values = np.where(required_loan >= 0, required_loan / (equity + required_loan), np.nan)
+    solved[rows] = np.where(np.isfinite(values), values, np.nan)
+    return solved[0] if single else solved
@@ -0,0 +1,125 @@
+"""
+Parameter sweeps
+Price the Cartesian product of input axes in chunks across a process pool
+"""
+
+import os
+from collections import namedtuple
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields, replace
+
+import numpy as np
+
+from net_yield_engine.book import NoteBook, price_book
+from net_yield_engine.pricer import NoteParams, price_columns
+
+SWEEPABLE_FIELDS = [field.name for field in fields(NoteParams)]
+
+# Result columns of price_grid, each shaped like the grid
+GRID_COLUMNS = ['total_borrowing_cost', 'net_yield_pa', 'xirr', 'xirr_converged', 'priced']
+
+GridResult = namedtuple('GridResult', ['names', 'values'] + GRID_COLUMNS)
+
+class SweepGrid:
+    """Lazy Cartesian product of sweep axes over a base NoteParams
+
+    Points are numbered in C order (the last axis varies fastest) and are only
+    materialized chunk by chunk.
+    """
+
+    def __init__(self, base, axes):
+        if isinstance(base, Mapping):
+            base = NoteParams(**base)
+        unknown = [name for name in axes if name not in SWEEPABLE_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown sweep axes {unknown}; expected NoteParams fields {SWEEPABLE_FIELDS}")
+        self.base = base
+        self.names = list(axes)
+        self.values = [np.asarray(list(values)) for values in axes.values()]
+        self.shape = tuple(len(values) for values in self.values)
+
+    def __len__(self):
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def axis_columns(self, start, stop):
+        """Axis values of points [start, stop) as one array per axis"""
+        indices = np.unravel_index(np.arange(start, stop), self.shape)
+        return {name: values[index] for name, values, index in zip(self.names, self.values, indices)}
+
+    def params(self, start, stop):
+        """NoteParams for points [start, stop)"""
+        columns = self.axis_columns(start, stop)
+        rows = zip(*(columns[name].tolist() for name in self.names))
+        return [replace(self.base, **dict(zip(self.names, row))) for row in rows]
+
+    def book(self, start, stop):
+        """NoteBook of points [start, stop), built from the axis columns without NoteParams"""
+        columns = self.axis_columns(start, stop)
+        return NoteBook.from_columns({
+            name: columns[name] if name in columns else [getattr(self.base, name)] * (stop - start)
+            for name in SWEEPABLE_FIELDS
+        })
+
+def price_chunk(grid, start, stop, rate_index=None):
+    """Price points [start, stop) of a grid into result columns
+
+    Points that cannot be priced come back as NaN with priced=False instead of
+    failing the whole sweep. XIRRs of the chunk are solved in one batched call.
+    """
+    columns = {'point': np.arange(start, stop, dtype=np.int64)}
+    columns.update(grid.axis_columns(start, stop))
+    columns.update(price_columns(grid.params(start, stop), rate_index))
+    return columns
+
+# Per-process sweep state, set once by the pool initializer so tasks only carry bounds
+_worker_state = {}
+
+def _init_worker(grid, rate_index):
+    _worker_state['grid'] = grid
+    _worker_state['rate_index'] = rate_index
+
+def _price_worker_chunk(bounds):
+    start, stop = bounds
+    return price_chunk(_worker_state['grid'], start, stop, _worker_state['rate_index'])
+
+def iter_sweep(base, axes, processes=None, chunk_size=5000, rate_index=None):
+    """Price a sweep and yield its results chunk by chunk, in point order
+
+    base is a NoteParams (or mapping) supplying every input not swept; axes maps
+    NoteParams field names (ltv, coupon_rate, tenor_years, financing_tenor, lender,
+    floating_ref, interest_freq, coupon_freq, ...) to the values to sweep. Each chunk
+    is a dict of equal-length columns: point, one column per axis and PRICE_COLUMNS.
+    processes defaults to all cores; 1 prices in the calling process.
+    """
+    grid = SweepGrid(base, axes)
+    bounds = [(start, min(start + chunk_size, len(grid))) for start in range(0, len(grid), chunk_size)]
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1 or len(bounds) <= 1:
+        for start, stop in bounds:
+            yield price_chunk(grid, start, stop, rate_index)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(grid, rate_index)) as executor:
+        yield from executor.map(_price_worker_chunk, bounds)
+
+def run_sweep(base, axes, processes=None, chunk_size=5000, rate_index=None):
+    """Price a whole sweep and return one columnar table (dict of arrays)"""
+    chunks = list(iter_sweep(base, axes, processes, chunk_size, rate_index))
+    if not chunks:
+        return {}
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+def price_grid(base, axes, rate_index=None):
+    """Price a whole grid in one price_book call, with results shaped like the grid
+
+    Meant for grids that fit in memory (a 200 x 200 heatmap is 40k notes, priced in
+    well under a second); every point is an array slot, so any slice of the result
+    is a view rather than a re-price. Points that cannot be priced are NaN with
+    priced=False.
+    """
+    grid = SweepGrid(base, axes)
+    columns = price_book(grid.book(0, len(grid)), rate_index).columns
+    return GridResult(grid.names, grid.values, *(columns[name].reshape(grid.shape) for name in GRID_COLUMNS))
@@ -0,0 +1,309 @@
+"""
+XIRR solvers for the Net Yield Simulator
+Single-schedule Newton/Brent solver plus a batched kernel for scenario grids
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+XirrResult = namedtuple('XirrResult', ['rate', 'converged', 'iterations', 'method'])
+
+# Candidate rates scanned when Newton-Raphson fails and a bracket is needed
+XIRR_BRACKET_GRID = np.array([-0.99, -0.95, -0.9, -0.75, -0.5, -0.25, -0.1, 0.0, 0.05, 0.1,
+                              0.15, 0.25, 0.5, 0.75, 1.0, 2.0, 3.0, 5.0, 10.0])
+
+def xirr_year_fractions(dates):
+    """Convert cash flow dates to year fractions (days / 365.25) from the first date"""
+    days = np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+    return (days - days[0]).astype(np.float64) / 365.25
+
+def xirr_npv_derivative(rate, periods, cashflows):
+    """Calculate NPV and its derivative from one shared discount factor array"""
+    discounted = cashflows * (1.0 + rate) ** -periods
+    npv = discounted.sum()
+    derivative = -(periods * discounted).sum() / (1.0 + rate)
+    return npv, derivative
+
+def find_xirr_bracket(periods, cashflows, guess=0.1):
+    """Find the sign-change bracket of the NPV curve closest to the guess"""
+    grid = XIRR_BRACKET_GRID
+    npvs = ((1.0 + grid[:, None]) ** -periods[None, :]) @ cashflows
+    signs = np.sign(npvs)
+    changes = np.nonzero(signs[:-1] * signs[1:] <= 0)[0]
+    if len(changes) == 0:
+        return None
+    nearest = changes[np.argmin(np.abs(grid[changes] - guess))]
+    return grid[nearest], grid[nearest + 1], npvs[nearest], npvs[nearest + 1]
+
+def brent_xirr(periods, cashflows, low, high, npv_low, npv_high, tolerance=1e-12, max_iterations=200):
+    """Solve NPV(rate) = 0 inside [low, high] with Brent's method"""
+    a, b, fa, fb = low, high, npv_low, npv_high
+    c, fc = a, fa
+    d = e = b - a
+    for iteration in range(1, max_iterations + 1):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * np.finfo(float).eps * abs(b) + 0.5 * tolerance
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0:
+            return b, True, iteration
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Attempt inverse quadratic interpolation (secant when only two points)
+            s = fb / fa
+            if a == c:
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            # Bisection
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = xirr_npv_derivative(b, periods, cashflows)[0]
+    return b, False, max_iterations
+
+def solve_xirr(periods, cashflows, guess=0.1, tolerance=1e-8, max_iterations=100):
+    """Solve XIRR on year fractions with Newton-Raphson, falling back to a bracketed Brent search"""
+    periods = np.asarray(periods, dtype=np.float64)
+    cashflows = np.asarray(cashflows, dtype=np.float64)
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        # Newton-Raphson method (Excel-compatible)
+        rate = guess
+        for iteration in range(1, max_iterations + 1):
+            npv, derivative = xirr_npv_derivative(rate, periods, cashflows)
+
+            # Check for convergence
+            if abs(npv) < tolerance:
+                return XirrResult(rate, True, iteration, 'newton')
+
+            # Flat NPV curve - Newton cannot make progress
+            if not np.isfinite(derivative) or abs(derivative) < 1e-15:
+                break
+
+            rate_new = rate - npv / derivative
+
+            # Check for convergence in rate
+            if abs(rate_new - rate) < tolerance:
+                return XirrResult(rate, True, iteration, 'newton')
+
+            rate = rate_new
+
+            # Newton left the admissible range - hand over to the bracketed solver
+            if not np.isfinite(rate) or rate > 10 or rate < -0.99:
+                break
+
+        bracket = find_xirr_bracket(periods, cashflows, guess)
+        if bracket is None:
+            return XirrResult(float('nan'), False, iteration, 'none')
+        rate, converged, brent_iterations = brent_xirr(periods, cashflows, *bracket)
+        return XirrResult(float(rate), converged, iteration + brent_iterations, 'brent')
+
+def calculate_xirr(dates, cashflows, full_output=False):
+    """Calculate XIRR using proper Excel XIRR formula with fallback
+
+    Returns the rate, or the full XirrResult (rate, converged, iterations, method)
+    when full_output is True.
+    """
+    try:
+        cashflows_array = np.asarray(cashflows, dtype=np.float64)
+
+        # Check if we have enough data
+        if len(cashflows_array) < 2 or len(dates) != len(cashflows_array):
+            result = XirrResult(0.0, False, 0, 'none')
+        else:
+            result = solve_xirr(xirr_year_fractions(dates), cashflows_array)
+        return result if full_output else result.rate
+
+    except Exception as e:
+        # Robust fallback calculation
+        try:
+            # Simple IRR approximation for fallback
+            if len(cashflows) < 2:
+                return XirrResult(0.0, False, 0, 'none') if full_output else 0.0
+
+            # Basic approximation based on total return
+            initial_investment = abs(cashflows[0])
+            final_value = sum(cashflows[1:])
+
+            rate = 0.0
+            if initial_investment > 0:
+                total_return = final_value / initial_investment
+                years = (dates[-1] - dates[0]).days / 365.25
+                if years > 0:
+                    rate = (total_return ** (1/years)) - 1
+
+            return XirrResult(rate, False, 0, 'approximation') if full_output else rate
+        except:
+            return XirrResult(0.0, False, 0, 'none') if full_output else 0.0
+
+# Batched XIRR solver
+BatchXirrResult = namedtuple('BatchXirrResult', ['rates', 'converged', 'iterations'])
+
+def pad_ragged(values, offsets, fill=0.0):
+    """Expand a flat ragged array with row offsets into a padded 2-D array
+
+    Row i holds values[offsets[i]:offsets[i + 1]]; the tail of shorter rows is set to fill.
+    offsets need not start at 0, so a slice of a larger buffer's offsets works as is.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    n_rows = len(lengths)
+    width = int(lengths.max()) if n_rows else 0
+
+    padded = np.full((n_rows, width), fill, dtype=np.float64)
+    rows = np.repeat(np.arange(n_rows), lengths)
+    cols = np.arange(offsets[0], offsets[-1]) - np.repeat(offsets[:-1], lengths)
+    padded[rows, cols] = values[offsets[0]:offsets[-1]]
+    return padded
+
+def xirr_npv_derivative_batch(rates, periods, cashflows):
+    """Row-wise NPV and derivative for a batch of rates, sharing one discount factor array"""
+    growth = 1.0 + rates
+    discounted = np.power(growth[:, None], -periods)
+    discounted *= cashflows
+    npv = discounted.sum(axis=1)
+    derivative = -np.einsum('ij,ij->i', np.broadcast_to(periods, discounted.shape), discounted) / growth
+    return npv, derivative
+
+def bisect_xirr_batch(periods, cashflows, guess=0.1, tolerance=1e-12, max_iterations=100):
+    """Bracket every row on the rate grid and bisect all brackets together
+
+    Used for rows where Newton-Raphson failed. Rows without a sign change on the grid
+    come back as NaN and not converged.
+    """
+    n_rows = len(cashflows)
+    grid = XIRR_BRACKET_GRID
+    factors = (1.0 + grid)[None, :, None] ** -np.broadcast_to(periods, cashflows.shape)[:, None, :]
+    npvs = (factors * cashflows[:, None, :]).sum(axis=2)
+
+    signs = np.sign(npvs)
+    changes = signs[:, :-1] * signs[:, 1:] <= 0
+    distance = np.where(changes, np.abs(grid[:-1] - guess)[None, :], np.inf)
+    nearest = distance.argmin(axis=1)
+    bracketed = changes[np.arange(n_rows), nearest]
+
+    rates = np.full(n_rows, np.nan)
+    converged = np.zeros(n_rows, dtype=bool)
+    iterations = np.zeros(n_rows, dtype=np.int64)
+    if not bracketed.any():
+        return rates, converged, iterations
+
+    rows = np.nonzero(bracketed)[0]
+    low = grid[nearest[rows]]
+    high = grid[nearest[rows] + 1]
+    npv_low = npvs[rows, nearest[rows]]
+    row_periods = periods if periods.ndim == 1 else periods[rows]
+    row_cashflows = cashflows[rows]
+
+    for iteration in range(1, max_iterations + 1):
+        mid = 0.5 * (low + high)
+        npv_mid = (row_cashflows * (1.0 + mid)[:, None] ** -row_periods).sum(axis=1)
+        left = np.sign(npv_mid) == np.sign(npv_low)
+        low = np.where(left, mid, low)
+        npv_low = np.where(left, npv_mid, npv_low)
+        high = np.where(left, high, mid)
+        if np.all(high - low < tolerance):
+            break
+
+    rates[rows] = 0.5 * (low + high)
+    converged[rows] = True
+    iterations[rows] = iteration
+    return rates, converged, iterations
+
+def solve_xirr_batch(periods, cashflows, guess=0.1, tolerance=1e-8, max_iterations=100):
+    """Solve XIRR for many cash flow schedules at once
+
+    periods and cashflows are padded 2-D arrays (one schedule per row); periods may
+    also be a single 1-D row shared by every schedule. Padding must use a zero cash
+    flow so it drops out of the NPV. Rows follow the same Newton-Raphson steps and
+    stopping rules as solve_xirr and are masked out as soon as they converge; rows
+    that stall or leave [-99%, 1000%] are finished by a batched bisection.
+    """
+    cashflows = np.atleast_2d(np.asarray(cashflows, dtype=np.float64))
+    periods = np.asarray(periods, dtype=np.float64)
+    n_rows = len(cashflows)
+
+    rates = np.full(n_rows, guess, dtype=np.float64)
+    converged = np.zeros(n_rows, dtype=bool)
+    failed = np.zeros(n_rows, dtype=bool)
+    iterations = np.zeros(n_rows, dtype=np.int64)
+    active = np.arange(n_rows)
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        for iteration in range(1, max_iterations + 1):
+            if len(active) == 0:
+                break
+            row_periods = periods if periods.ndim == 1 else periods[active]
+            rate = rates[active]
+            npv, derivative = xirr_npv_derivative_batch(rate, row_periods, cashflows[active])
+            iterations[active] = iteration
+
+            # Check for convergence on NPV
+            done = np.abs(npv) < tolerance
+
+            # Flat NPV curve - Newton cannot make progress
+            stalled = ~done & (~np.isfinite(derivative) | (np.abs(derivative) < 1e-15))
+
+            stepping = ~done & ~stalled
+            rate_new = rate.copy()
+            rate_new[stepping] = rate[stepping] - npv[stepping] / derivative[stepping]
+
+            # Check for convergence in rate (keeps the pre-step rate, as solve_xirr does)
+            small_step = stepping & (np.abs(rate_new - rate) < tolerance)
+            done |= small_step
+            stepping &= ~small_step
+
+            # Newton left the admissible range
+            escaped = stepping & (~np.isfinite(rate_new) | (rate_new > 10) | (rate_new < -0.99))
+            stepping &= ~escaped
+
+            rates[active[stepping]] = rate_new[stepping]
+            converged[active[done]] = True
+            failed[active[stalled | escaped]] = True
+            active = active[stepping]
+
+        # Rows still iterating after max_iterations are handed over as well
+        failed[active] = True
+
+        if failed.any():
+            rows = np.nonzero(failed)[0]
+            row_periods = periods if periods.ndim == 1 else periods[rows]
+            bisect_rates, bisect_converged, bisect_iterations = bisect_xirr_batch(
+                row_periods, cashflows[rows], guess)
+            rates[rows] = bisect_rates
+            converged[rows] = bisect_converged
+            iterations[rows] += bisect_iterations
+
+    return BatchXirrResult(rates, converged, iterations)
+
+def solve_xirr_ragged(periods, cashflows, offsets, guess=0.1, tolerance=1e-8, max_iterations=100):
+    """Solve XIRR for schedules stored back to back in flat arrays
+
+    Schedule i occupies periods[offsets[i]:offsets[i + 1]] and the matching cashflows.
+    Schedules with fewer than two cash flows are returned as NaN and not converged.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    result = solve_xirr_batch(pad_ragged(periods, offsets), pad_ragged(cashflows, offsets),
+                              guess, tolerance, max_iterations)
+    too_short = np.diff(offsets) < 2
+    result.rates[too_short] = np.nan
+    result.converged[too_short] = False
+    return result
@@ -4,23 +4,37 @@ Three tables only: Summary, XIRR, Rate Breakdown
 """
 
 import streamlit as st
-import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+from datetime import datetime
 import plotly.graph_objects as go
 from io import BytesIO
-import xlsxwriter
+import time
 import warnings
+
+from net_yield_engine.pricer import (
+    COUPON_FREQUENCIES,
+    FLOATING_REFS,
+    INTEREST_FREQUENCIES,
+    LENDERS,
+    RATE_INTERPOLATIONS,
+    NoteParams,
+    required_coupon_rate,
+)
+from net_yield_engine.daycount import DAYCOUNT_CONVENTIONS
+from net_yield_engine.export import write_note_workbook
+from net_yield_engine.graph import pricing_graph, pricing_sources
+from net_yield_engine.greeks import SENSITIVITY_INPUTS, note_sensitivities
+from net_yield_engine.instrumentation import Instrumentation, graph_collector, lru_collector
+from net_yield_engine.rates import RateIndexLookupError, default_rate_source
+from net_yield_engine.schedule import aggregate_schedule
+from net_yield_engine.solve import solve_required
+from net_yield_engine.sweep import price_grid
+
 warnings.filterwarnings('ignore')
 
-# Try to import numpy-financial, fallback if not available
-try:
-    import numpy_financial as npf
-    HAS_NPF = True
-except ImportError:
-    HAS_NPF = False
+# App stylesheet, relative to the app URL (static/ next to this script)
+STYLESHEET_URL = 'app/static/net_yield.css'
 
 # Page Configuration
 st.set_page_config(
@@ -30,702 +44,233 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS - Keep the same styling but remove header styles
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    /* ==================== GLOBAL STYLES ==================== */
-    * { 
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    }
-    
-    /* Main App Background */
-    .stApp {
-        background-color: #f5f7fa !important;
-    }
-    
-    .main {
-        background-color: #f5f7fa !important;
-    }
-    
-    .main .block-container {
-        background-color: #f5f7fa !important;
-        padding: 2rem 3rem !important;
-        max-width: 1400px !important;
-    }
-    
-    /* ==================== SIDEBAR STYLING ==================== */
-    section[data-testid="stSidebar"] {
-        background-color: #e8ebf0 !important;
-        border-right: 1px solid #d1d5db !important;
-        transition: all 0.3s ease !important;
-        width: 420px !important;  /* Increased by 20% from ~350px default */
-        min-width: 420px !important;
-    }
-    
-    section[data-testid="stSidebar"] > div:first-child {
-        background-color: #e8ebf0 !important;
-        padding-top: 2rem !important;
-        width: 420px !important;  /* Match the sidebar width */
-    }
-    
-    /* ==================== FIX SIDEBAR ARROW BUTTON ==================== */
-    /* Hide the text "keyboard_double_arrow_right" completely */
-    button[kind="header"] {
-        font-size: 0 !important;
-        color: transparent !important;
-    }
-    
-    /* Hide any span or div containing the keyboard text */
-    button[kind="header"] * {
-        font-size: 0 !important;
-        color: transparent !important;
-    }
-    
-    /* Target the specific text content */
-    button[kind="header"] span {
-        visibility: hidden !important;
-        display: none !important;
-    }
-    
-    /* Hide the text but keep the button */
-    button[kind="header"] {
-        text-indent: -9999px !important;
-        overflow: hidden !important;
-    }
-    
-    /* Add custom arrow using CSS */
-    button[kind="header"]::after {
-        content: "◀" !important;
-        font-size: 1.5rem !important;
-        color: #4b5563 !important;
-        display: block !important;
-        position: absolute !important;
-        text-indent: 0 !important;
-        top: 50% !important;
-        left: 50% !important;
-        transform: translate(-50%, -50%) !important;
-    }
-    
-    /* Change arrow when sidebar is collapsed */
-    section[data-testid="stSidebar"][aria-expanded="false"] button[kind="header"]::after {
-        content: "▶" !important;
-    }
-    
-    /* Style the button itself */
-    button[kind="header"] {
-        width: 32px !important;
-        height: 32px !important;
-        position: relative !important;
-        background-color: #ffffff !important;
-        border: 1px solid #d1d5db !important;
-        border-radius: 4px !important;
-        cursor: pointer !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    button[kind="header"]:hover {
-        background-color: #f3f4f6 !important;
-        border-color: #9ca3af !important;
-    }
-    
-    /* Additional rule to hide any Material Icons text */
-    .material-icons, .material-icons-outlined {
-        font-size: 0 !important;
-        color: transparent !important;
-    }
-    
-    /* Hide the specific keyboard_double_arrow text wherever it appears */
-    *:not(button):contains("keyboard_double_arrow") {
-        font-size: 0 !important;
-        color: transparent !important;
-    }
-    
-    /* ==================== SIDEBAR CONTENT STYLES ==================== */
-    /* Sidebar Headers */
-    section[data-testid="stSidebar"] h3 {
-        color: #1f2937 !important;
-        font-weight: 600 !important;
-        font-size: 0.875rem !important;
-        margin-bottom: 1.5rem !important;
-        margin-top: 0 !important;
-    }
-    
-    section[data-testid="stSidebar"] h4 {
-        color: #1f2937 !important;
-        font-weight: 600 !important;
-        font-size: 0.875rem !important;
-        margin-top: 1.5rem !important;
-        margin-bottom: 1rem !important;
-    }
-    
-    /* Sidebar Labels */
-    section[data-testid="stSidebar"] label {
-        color: #4b5563 !important;
-        font-weight: 500 !important;
-        font-size: 0.8125rem !important;
-    }
-    
-    /* Sidebar Input Fields */
-    section[data-testid="stSidebar"] input,
-    section[data-testid="stSidebar"] select {
-        background-color: #ffffff !important;
-        border: 1px solid #d1d5db !important;
-        border-radius: 6px !important;
-        color: #1f2937 !important;
-        font-size: 0.875rem !important;
-        padding: 0.5rem 0.75rem !important;
-    }
-    
-    /* Sidebar Selectbox */
-    section[data-testid="stSidebar"] .stSelectbox > div > div {
-        background-color: #ffffff !important;
-        border: 1px solid #d1d5db !important;
-        border-radius: 6px !important;
-    }
-    
-    /* Sidebar Info Boxes */
-    section[data-testid="stSidebar"] .stAlert {
-        background-color: #dde3eb !important;
-        border: 1px solid #c2cad6 !important;
-        border-radius: 6px !important;
-        color: #1f2937 !important;
-        padding: 0.75rem !important;
-        font-size: 0.8125rem !important;
-    }
-    
-    /* Sidebar Dividers */
-    section[data-testid="stSidebar"] hr {
-        border: none !important;
-        height: 1px !important;
-        background-color: #d1d5db !important;
-        margin: 1.5rem 0 !important;
-    }
-    
-    /* ==================== TABLE STYLES ==================== */
-    h3 {
-        color: #111827 !important;
-        font-size: 1.25rem !important;
-        font-weight: 700 !important;
-        margin-bottom: 1rem !important;
-        margin-top: 0 !important;
-    }
-    
-    /* ==================== DATAFRAMES ==================== */
-    .stDataFrame {
-        border: 1px solid #e5e7eb !important;
-        border-radius: 10px !important;
-        overflow: hidden !important;
-    }
-    
-    .stDataFrame table {
-        background-color: #ffffff !important;
-    }
-    
-    .stDataFrame thead tr th {
-        background-color: #f9fafb !important;
-        color: #374151 !important;
-        font-weight: 600 !important;
-        font-size: 0.8125rem !important;
-        border-bottom: 2px solid #e5e7eb !important;
-        padding: 0.75rem 1rem !important;
-    }
-    
-    .stDataFrame tbody tr {
-        border-bottom: 1px solid #f3f4f6 !important;
-    }
-    
-    .stDataFrame tbody td {
-        color: #1f2937 !important;
-        font-size: 0.875rem !important;
-        padding: 0.75rem 1rem !important;
-    }
-    
-    .stDataFrame tbody tr:hover {
-        background-color: #f9fafb !important;
-    }
-    
-    /* ==================== EXPANDERS ==================== */
-    .streamlit-expanderHeader {
-        background-color: #ffffff !important;
-        border: 1px solid #e5e7eb !important;
-        border-radius: 8px !important;
-        color: #374151 !important;
-        font-weight: 600 !important;
-        padding: 0.75rem 1rem !important;
-    }
-    
-    .streamlit-expanderContent {
-        background-color: #ffffff !important;
-        border: 1px solid #e5e7eb !important;
-        border-top: none !important;
-        border-radius: 0 0 8px 8px !important;
-        padding: 1rem !important;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# JavaScript to remove the keyboard_double_arrow text
-st.components.v1.html("""
-<script>
-window.addEventListener('load', function() {
-    function removeKeyboardText() {
-        const elements = parent.document.querySelectorAll('*');
-        elements.forEach(el => {
-            if (el.textContent === 'keyboard_double_arrow_right' || 
-                el.textContent === 'keyboard_double_arrow_left' ||
-                el.textContent.includes('keyboard_double_arrow')) {
-                if (el.childElementCount === 0) {
-                    el.style.fontSize = '0';
-                    el.style.color = 'transparent';
-                    el.textContent = '';
-                }
-            }
-        });
-    }
-    removeKeyboardText();
-    setInterval(removeKeyboardText, 100);
-});
-</script>
-""", height=0)
-
-# Real Rate Index Table Data from Excel
-@st.cache_data  
-def load_rate_index_table():
-    """Load embedded rate index table data from Excel"""
-    rate_data = [
-    { 'Floating Ref': None, 'M': 0.25, 'LAST_PRICE': 0.039867, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': None, 'M': 0.5, 'LAST_PRICE': 0.0399563, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': None, 'M': 0.75, 'LAST_PRICE': 0.0398649, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '1M', 'M': 1.0, 'LAST_PRICE': 0.039925, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '1M', 'M': 2.0, 'LAST_PRICE': 0.0393299, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 3.0, 'LAST_PRICE': 0.0388755, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 4.0, 'LAST_PRICE': 0.03848, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 5.0, 'LAST_PRICE': 0.0381285, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '6M', 'M': 6.0, 'LAST_PRICE': 0.0378526, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 7.0, 'LAST_PRICE': 0.037563, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 8.0, 'LAST_PRICE': 0.0372395, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '9M', 'M': 9.0, 'LAST_PRICE': 0.0369332, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 10.0, 'LAST_PRICE': 0.0365935, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 11.0, 'LAST_PRICE': 0.0362817, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '12M', 'M': 12.0, 'LAST_PRICE': 0.035995, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 13.0, 'LAST_PRICE': 0.035629, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 14.0, 'LAST_PRICE': 0.0352932, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 15.0, 'LAST_PRICE': 0.035, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 16.0, 'LAST_PRICE': 0.034766, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 17.0, 'LAST_PRICE': 0.0345381, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 18.0, 'LAST_PRICE': 0.034362, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 19.0, 'LAST_PRICE': 0.034195, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 20.0, 'LAST_PRICE': 0.0340556, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 21.0, 'LAST_PRICE': 0.03394, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 22.0, 'LAST_PRICE': 0.0338324, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 23.0, 'LAST_PRICE': 0.0337583, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 24.0, 'LAST_PRICE': 0.033683, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 25.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 26.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 27.0, 'LAST_PRICE': 0.033423, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 28.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 29.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 30.0, 'LAST_PRICE': 0.033291, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 31.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 32.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 33.0, 'LAST_PRICE': 0.0332509, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 34.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 35.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 36.0, 'LAST_PRICE': 0.0332725, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 42.0, 'LAST_PRICE': 0.033265, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 48.0, 'LAST_PRICE': 0.0334167, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 54.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 57.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 60.0, 'LAST_PRICE': 0.0337801, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 63.0, 'LAST_PRICE': None, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 72.0, 'LAST_PRICE': 0.03431, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 84.0, 'LAST_PRICE': 0.03488, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 96.0, 'LAST_PRICE': 0.03545, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 108.0, 'LAST_PRICE': 0.0360085, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': '3M', 'M': 144.0, 'LAST_PRICE': 0.0375517, 'Custodian': 'Barc', 'CoF v SOFR': 0.001, 'Swap Cost': 0.0005, 'Loan Spread': 0.0065 },
-    { 'Floating Ref': None, 'M': 0.25, 'LAST_PRICE': 0.039867, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': None, 'M': 0.5, 'LAST_PRICE': 0.0399563, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': None, 'M': 0.75, 'LAST_PRICE': 0.0398649, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '1M', 'M': 1.0, 'LAST_PRICE': 0.039925, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '1M', 'M': 2.0, 'LAST_PRICE': 0.0393299, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 3.0, 'LAST_PRICE': 0.0388755, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 4.0, 'LAST_PRICE': 0.03848, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 5.0, 'LAST_PRICE': 0.0381285, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '6M', 'M': 6.0, 'LAST_PRICE': 0.0378526, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 7.0, 'LAST_PRICE': 0.037563, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 8.0, 'LAST_PRICE': 0.0372395, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '9M', 'M': 9.0, 'LAST_PRICE': 0.0369332, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 10.0, 'LAST_PRICE': 0.0365935, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 11.0, 'LAST_PRICE': 0.0362817, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '12M', 'M': 12.0, 'LAST_PRICE': 0.035995, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 13.0, 'LAST_PRICE': 0.035629, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 14.0, 'LAST_PRICE': 0.0352932, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 15.0, 'LAST_PRICE': 0.035, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 16.0, 'LAST_PRICE': 0.034766, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 17.0, 'LAST_PRICE': 0.0345381, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 18.0, 'LAST_PRICE': 0.034362, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 19.0, 'LAST_PRICE': 0.034195, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 20.0, 'LAST_PRICE': 0.0340556, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 21.0, 'LAST_PRICE': 0.03394, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 22.0, 'LAST_PRICE': 0.0338324, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 23.0, 'LAST_PRICE': 0.0337583, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 24.0, 'LAST_PRICE': 0.033683, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 25.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 26.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 27.0, 'LAST_PRICE': 0.033423, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 28.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 29.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 30.0, 'LAST_PRICE': 0.033291, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 31.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 32.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 33.0, 'LAST_PRICE': 0.0332509, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 34.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 35.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 36.0, 'LAST_PRICE': 0.0332725, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 42.0, 'LAST_PRICE': 0.033265, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 48.0, 'LAST_PRICE': 0.0334167, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 54.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 57.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 60.0, 'LAST_PRICE': 0.0337801, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 63.0, 'LAST_PRICE': None, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 72.0, 'LAST_PRICE': 0.03431, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 84.0, 'LAST_PRICE': 0.03488, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 96.0, 'LAST_PRICE': 0.03545, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 108.0, 'LAST_PRICE': 0.0360085, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 144.0, 'LAST_PRICE': 0.0375517, 'Custodian': 'CAI', 'CoF v SOFR': 0.0025, 'Swap Cost': 0.0003, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': None, 'M': 0.25, 'LAST_PRICE': 0.039867, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': None, 'M': 0.5, 'LAST_PRICE': 0.0399563, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': None, 'M': 0.75, 'LAST_PRICE': 0.0398649, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '1M', 'M': 1.0, 'LAST_PRICE': 0.039925, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '1M', 'M': 2.0, 'LAST_PRICE': 0.0393299, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 3.0, 'LAST_PRICE': 0.0388755, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 4.0, 'LAST_PRICE': 0.03848, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 5.0, 'LAST_PRICE': 0.0381285, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '6M', 'M': 6.0, 'LAST_PRICE': 0.0378526, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 7.0, 'LAST_PRICE': 0.037563, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 8.0, 'LAST_PRICE': 0.0372395, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '9M', 'M': 9.0, 'LAST_PRICE': 0.0369332, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 10.0, 'LAST_PRICE': 0.0365935, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 11.0, 'LAST_PRICE': 0.0362817, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '12M', 'M': 12.0, 'LAST_PRICE': 0.035995, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.0, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 13.0, 'LAST_PRICE': 0.035629, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 14.0, 'LAST_PRICE': 0.0352932, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 15.0, 'LAST_PRICE': 0.035, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 16.0, 'LAST_PRICE': 0.034766, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 17.0, 'LAST_PRICE': 0.0345381, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 18.0, 'LAST_PRICE': 0.034362, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 19.0, 'LAST_PRICE': 0.034195, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 20.0, 'LAST_PRICE': 0.0340556, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 21.0, 'LAST_PRICE': 0.03394, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 22.0, 'LAST_PRICE': 0.0338324, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 23.0, 'LAST_PRICE': 0.0337583, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 24.0, 'LAST_PRICE': 0.033683, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 25.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 26.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 27.0, 'LAST_PRICE': 0.033423, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 28.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 29.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 30.0, 'LAST_PRICE': 0.033291, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 31.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 32.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 33.0, 'LAST_PRICE': 0.0332509, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 34.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 35.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 36.0, 'LAST_PRICE': 0.0332725, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 42.0, 'LAST_PRICE': 0.033265, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 48.0, 'LAST_PRICE': 0.0334167, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 54.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 57.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 60.0, 'LAST_PRICE': 0.0337801, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 63.0, 'LAST_PRICE': None, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 72.0, 'LAST_PRICE': 0.03431, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 84.0, 'LAST_PRICE': 0.03488, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 96.0, 'LAST_PRICE': 0.03545, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 108.0, 'LAST_PRICE': 0.0360085, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': '3M', 'M': 144.0, 'LAST_PRICE': 0.0375517, 'Custodian': 'DB', 'CoF v SOFR': 0.0, 'Swap Cost': 0.001, 'Loan Spread': 0.0068 },
-    { 'Floating Ref': None, 'M': 0.25, 'LAST_PRICE': 0.039867, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': None, 'M': 0.5, 'LAST_PRICE': 0.0399563, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': None, 'M': 0.75, 'LAST_PRICE': 0.0398649, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '1M', 'M': 1.0, 'LAST_PRICE': 0.039925, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '1M', 'M': 2.0, 'LAST_PRICE': 0.0393299, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 3.0, 'LAST_PRICE': 0.0388755, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 4.0, 'LAST_PRICE': 0.03848, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 5.0, 'LAST_PRICE': 0.0381285, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '6M', 'M': 6.0, 'LAST_PRICE': 0.0378526, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 7.0, 'LAST_PRICE': 0.037563, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 8.0, 'LAST_PRICE': 0.0372395, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '9M', 'M': 9.0, 'LAST_PRICE': 0.0369332, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 10.0, 'LAST_PRICE': 0.0365935, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 11.0, 'LAST_PRICE': 0.0362817, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '12M', 'M': 12.0, 'LAST_PRICE': 0.035995, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 13.0, 'LAST_PRICE': 0.035629, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 14.0, 'LAST_PRICE': 0.0352932, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 15.0, 'LAST_PRICE': 0.035, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 16.0, 'LAST_PRICE': 0.034766, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 17.0, 'LAST_PRICE': 0.0345381, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 18.0, 'LAST_PRICE': 0.034362, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 19.0, 'LAST_PRICE': 0.034195, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 20.0, 'LAST_PRICE': 0.0340556, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 21.0, 'LAST_PRICE': 0.03394, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 22.0, 'LAST_PRICE': 0.0338324, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 23.0, 'LAST_PRICE': 0.0337583, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 24.0, 'LAST_PRICE': 0.033683, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 25.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 26.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 27.0, 'LAST_PRICE': 0.033423, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 28.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 29.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 30.0, 'LAST_PRICE': 0.033291, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 31.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 32.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 33.0, 'LAST_PRICE': 0.0332509, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 34.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 35.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 36.0, 'LAST_PRICE': 0.0332725, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 42.0, 'LAST_PRICE': 0.033265, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 48.0, 'LAST_PRICE': 0.0334167, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 54.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 57.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 60.0, 'LAST_PRICE': 0.0337801, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 63.0, 'LAST_PRICE': None, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 72.0, 'LAST_PRICE': 0.03431, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 84.0, 'LAST_PRICE': 0.03488, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 96.0, 'LAST_PRICE': 0.03545, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 108.0, 'LAST_PRICE': 0.0360085, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-    { 'Floating Ref': '3M', 'M': 144.0, 'LAST_PRICE': 0.0375517, 'Custodian': 'SG', 'CoF v SOFR': 0.002, 'Swap Cost': 0.0008, 'Loan Spread': 0.0045 },
-]
-    
-    return pd.DataFrame(rate_data)
-
-# Utility Functions
-def calculate_workday(trade_date, days_to_settle):
-    """Calculate settlement date skipping weekends"""
-    current_date = trade_date
-    days_added = 0
-    while days_added < days_to_settle:
-        current_date += timedelta(days=1)
-        if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-            days_added += 1
-    return current_date
-
-def calculate_days360(start_date, end_date):
-    """Calculate days using 30/360 convention"""
-    d1 = min(start_date.day, 30)
-    d2 = min(end_date.day, 30) if d1 == 30 else end_date.day
-    return 360 * (end_date.year - start_date.year) + \
-           30 * (end_date.month - start_date.month) + \
-           (d2 - d1)
-
-def calculate_cashflow(amount, rate, days, convention):
-    """Calculate cash flow based on daycount convention"""
-    if convention == "A/365":
-        return amount * rate * days / 365
-    elif convention == "A/360":
-        return amount * rate * days / 360
-    else:  # 30/360
-        return amount * rate * days / 360
-
-def get_rate_index_value(rate_table, floating_ref=None, tenor_months=None, custodian=None, column='LAST_PRICE'):
-    """Lookup value from rate index table with specific logic per field"""
-    
-    if column == 'LAST_PRICE' and floating_ref and not tenor_months:
-        # ST Reference Rate: Match only on Floating Ref (C36 logic)
-        mask = (rate_table['Floating Ref'] == floating_ref)
-    elif column == 'LAST_PRICE' and tenor_months and not floating_ref:
-        # Fixing Adjustment: Match only on Financing Tenor for LAST_PRICE (C37 logic)
-        mask = (rate_table['M'] == tenor_months)
-    elif column in ['Swap Cost', 'CoF v SOFR', 'Loan Spread'] and custodian and tenor_months:
-        # Other costs: Match on both Custodian AND Financing Tenor (C38, C39, C40 logic)
-        mask = (rate_table['Custodian'] == custodian) & (rate_table['M'] == tenor_months)
-    else:
-        # Fallback
-        return 0.04
-    
-    result = rate_table[mask]
-    if not result.empty:
-        return result[column].iloc[0]
-    return 0.04  # Default fallback
-
-def generate_xirr_cashflows(equity, loan_notional, total_invested, interest_rate, coupon_rate,
-                           start_date, end_date, interest_freq, coupon_freq):
-    """Generate cash flows for XIRR calculation according to Complete_Net_Yield_Simulator_Requirements"""
-    
-    # Payment frequency mapping - months increment per payment
-    freq_months = {
-        "Quarterly": 3,
-        "Semi-Annual": 6,
-        "Annual": 12,
-        "At Maturity": None  # Special case - only pays at end
-    }
-    
-    interest_increment = freq_months[interest_freq]
-    coupon_increment = freq_months[coupon_freq]
-    
-    # Generate separate date sequences for each payment type
-    def generate_payment_dates(start_date, end_date, months_increment):
-        """Generate payment dates based on frequency"""
-        if months_increment is None:
-            # "At Maturity" case - return empty list (payment only at end_date)
-            return []
-        
-        dates = []
-        current_date = start_date
-        
-        while True:
-            current_date = start_date + relativedelta(months=len(dates) * months_increment + months_increment)
-            if current_date >= end_date:
-                break
-            dates.append(current_date)
-        
-        return dates
-    
-    # Generate interest and coupon payment dates
-    interest_dates = generate_payment_dates(start_date, end_date, interest_increment)
-    coupon_dates = generate_payment_dates(start_date, end_date, coupon_increment)
-    
-    # Initialize cash flow arrays
-    dates = [start_date]  # Start with initial investment date
-    principal_flows = [-equity]  # Initial equity outflow
-    interest_payments = [0]  # No interest at start
-    coupon_receipts = [0]  # No coupon at start
-    
-    # Track the last interest and coupon payment dates separately
-    last_interest_date = start_date
-    last_coupon_date = start_date
-    
-    # Combine all unique dates and sort (excluding start_date, including end_date)
-    all_payment_dates = set(interest_dates + coupon_dates + [end_date])
-    sorted_dates = sorted(all_payment_dates)
-    
-    # Process each payment date
-    for payment_date in sorted_dates:
-        # Initialize cash flows for this date
-        principal_flow = 0
-        interest_payment = 0
-        coupon_receipt = 0
-        
-        # Check if this is an interest payment date
-        if payment_date in interest_dates or payment_date == end_date:
-            # Calculate days since last interest payment
-            interest_date_diff = (payment_date - last_interest_date).days
-            # Interest Payment = -Loan_Drawn * Interest_Rate * (date_diff)/360
-            interest_payment = -loan_notional * interest_rate * interest_date_diff / 360
-            last_interest_date = payment_date
-        
-        # Check if this is a coupon payment date  
-        if payment_date in coupon_dates or payment_date == end_date:
-            # Calculate days since last coupon payment
-            coupon_date_diff = (payment_date - last_coupon_date).days
-            # Coupon Payment = Invested * Coupon_Rate * (date_diff)/360
-            coupon_receipt = total_invested * coupon_rate * coupon_date_diff / 360
-            last_coupon_date = payment_date
-        
-        # Principal return at maturity
-        if payment_date == end_date:
-            principal_flow = equity
-        
-        # Add this payment to the schedule
-        dates.append(payment_date)
-        principal_flows.append(principal_flow)
-        interest_payments.append(interest_payment)
-        coupon_receipts.append(coupon_receipt)
-    
-    # Calculate total cash flows (Column F = sum of C, D, E)
-    total_cashflows = []
-    for i in range(len(dates)):
-        total_cashflows.append(principal_flows[i] + interest_payments[i] + coupon_receipts[i])
-    
-    return dates, principal_flows, interest_payments, coupon_receipts, total_cashflows
-
-def calculate_xirr(dates, cashflows):
-    """Calculate XIRR using proper Excel XIRR formula with fallback"""
-    try:
-        # Convert to numpy arrays
-        dates_array = np.array(dates)
-        cashflows_array = np.array(cashflows)
-        
-        # Check if we have enough data
-        if len(cashflows_array) < 2 or len(dates_array) != len(cashflows_array):
-            return 0.0
-        
-        # Convert dates to period numbers (days from start)
-        start_date = dates_array[0]
-        periods = [(d - start_date).days / 365.25 for d in dates_array]
-        periods_array = np.array(periods)
-        
-        # XIRR calculation using Newton-Raphson method (Excel-compatible)
-        def xirr_npv(rate):
-            """Calculate NPV for given rate"""
-            return sum([cf / ((1 + rate) ** period) for cf, period in zip(cashflows_array, periods_array)])
-        
-        def xirr_derivative(rate):
-            """Calculate derivative of NPV function"""
-            return sum([-period * cf / ((1 + rate) ** (period + 1)) 
-                       for cf, period in zip(cashflows_array, periods_array)])
-        
-        # Newton-Raphson method for XIRR
-        rate = 0.1  # Initial guess (10%)
-        tolerance = 1e-8
-        max_iterations = 100
-        
-        for iteration in range(max_iterations):
-            npv = xirr_npv(rate)
-            derivative = xirr_derivative(rate)
-            
-            # Check for convergence
-            if abs(npv) < tolerance:
-                break
-                
-            # Avoid division by zero
-            if abs(derivative) < 1e-15:
-                break
-                
-            # Newton-Raphson update
-            rate_new = rate - npv / derivative
-            
-            # Check for convergence in rate
-            if abs(rate_new - rate) < tolerance:
-                break
-                
-            rate = rate_new
-            
-            # Prevent extreme values
-            if rate > 10 or rate < -0.99:
-                rate = 0.1  # Reset to initial guess
-                break
-        
-        return rate
-        
-    except Exception as e:
-        # Robust fallback calculation
-        try:
-            # Simple IRR approximation for fallback
-            if len(cashflows) < 2:
-                return 0.0
-            
-            # Basic approximation based on total return
-            initial_investment = abs(cashflows[0])
-            final_value = sum(cashflows[1:])
-            
-            if initial_investment > 0:
-                total_return = final_value / initial_investment
-                years = (dates[-1] - dates[0]).days / 365.25
-                if years > 0:
-                    return (total_return ** (1/years)) - 1
-            
-            return 0.0
-        except:
-            return 0.0
-
-# Initialize session state
-if 'calculated' not in st.session_state:
-    st.session_state.calculated = False
-
-# Load Rate Index Table
-rate_index_table = load_rate_index_table()
+# Stage timers, XIRR counters and hit rates shared by every session on this server
+@st.cache_resource
+def get_instrumentation():
+    """Process-wide instrumentation, shown in the Diagnostics expander"""
+    return Instrumentation().add_collector('rate_index', lru_collector(default_rate_source()))
+
+diagnostics = get_instrumentation()
+rerun_start = time.perf_counter()
+
+# Styles live in static/net_yield.css, served by Streamlit's static file server (see
+# .streamlit/config.toml) so the browser fetches and caches them once; each rerun only
+# sends the link tag. Colours and the font come from the theme in the same config.
+with diagnostics.stage('inject_css'):
+    st.markdown(f'<link rel="stylesheet" href="{STYLESHEET_URL}">', unsafe_allow_html=True)
+
+# XIRR table views and their client-side formatting; detail rows are sent a page at a time
+XIRR_VIEWS = ['Payment', 'Quarter', 'Year']
+XIRR_PAGE_ROWS = 100
+XIRR_COLUMN_CONFIG = {
+    'Date': st.column_config.DateColumn(format='YYYY-MM-DD'),
+    'Quarter': st.column_config.DateColumn(format='YYYY [Q]Q'),
+    'Year': st.column_config.DateColumn(format='YYYY'),
+    'Principal': st.column_config.NumberColumn(format='dollar'),
+    'Interest': st.column_config.NumberColumn(format='dollar'),
+    'Coupon': st.column_config.NumberColumn(format='dollar'),
+    'Total Cash Flow': st.column_config.NumberColumn(format='dollar'),
+    'Cumulative': st.column_config.NumberColumn(format='dollar'),
+}
+
+# Sensitivity heatmaps: the two swept inputs of each view and their grid values
+HEATMAP_VIEWS = {
+    'LTV × Coupon': {
+        'ltv': np.round(np.arange(0.0, 0.9501, 0.005), 3),
+        'coupon_rate': np.round(np.arange(0.0, 0.2001, 0.001), 3),
+    },
+    'LTV × Financing Tenor': {
+        'ltv': np.round(np.arange(0.0, 0.9501, 0.005), 3),
+        'financing_tenor': np.arange(1, 61),
+    },
+    'Lender × Floating Ref': {
+        'lender': LENDERS,
+        'floating_ref': FLOATING_REFS,
+    },
+}
+HEATMAP_METRICS = {'Net Yield p.a.': 'net_yield_pa', 'XIRR': 'xirr'}
+HEATMAP_LABELS = {
+    'ltv': 'Drawn LTV (%)',
+    'coupon_rate': 'Coupon p.a. (%)',
+    'financing_tenor': 'Financing Tenor (Months)',
+    'lender': 'Lender',
+    'floating_ref': 'Floating Reference',
+}
+PERCENT_INPUTS = ['ltv', 'coupon_rate']
+
+# Display tables, built as stages of the pricing graph
+def build_summary_table(result, note_type, issuer, underlying):
+    """Summary table of the priced note"""
+    params = result.params
+    tenor_years = params.tenor_years
+    # Create tenor display (e.g., "3Y")
+    tenor_display = f"{int(tenor_years)}Y" if tenor_years == int(tenor_years) else f"{tenor_years}Y"
+    xirr_solution = result.xirr
+
+    return pd.DataFrame({
+        'Parameter': [
+            'Tenor',
+            'Note Type',
+            'Note Issuer',
+            'Underlying / Reference Entity',
+            'Drawn LTV (%)',
+            'Coupon p.a. (%)',
+            'Total Cost of Borrowing (%)',
+            'Exp. Return on Equity p.a. (%)',
+            'XIRR'
+        ],
+        'Value': [
+            tenor_display,
+            note_type,
+            issuer,
+            underlying,
+            f"{params.ltv:.1%}",
+            f"{params.coupon_rate:.2%}",
+            f"{result.total_borrowing_cost:.3%}",
+            f"{result.net_yield_pa:.2%}",
+            f"{xirr_solution.rate:.2%}" if xirr_solution.converged else "n/a"
+        ]
+    })
+
+def build_xirr_table(schedule, xirr_view):
+    """Unformatted XIRR cash flow table, per payment or summed by quarter or year
+
+    Columns stay numeric and are formatted in the browser by XIRR_COLUMN_CONFIG.
+    """
+    if xirr_view == 'Payment':
+        return pd.DataFrame({
+            'Date': schedule.dates,
+            'Principal': schedule.principal,
+            'Interest': schedule.interest,
+            'Coupon': schedule.coupon,
+            'Total Cash Flow': schedule.total,
+            'Cumulative': np.cumsum(schedule.total)
+        })
+    summary = aggregate_schedule(schedule, xirr_view)
+    return pd.DataFrame({
+        xirr_view: summary.period_start,
+        'Payments': summary.rows,
+        'Principal': summary.principal,
+        'Interest': summary.interest,
+        'Coupon': summary.coupon,
+        'Total Cash Flow': summary.total,
+        'Cumulative': summary.cumulative
+    })
+
+def build_rate_table(rates):
+    """Rate breakdown table from the rate lookup stage"""
+    return pd.DataFrame({
+        'Component': [
+            'ST Reference Rate',
+            'Fixing Adjustment',
+            'Reference Rate',
+            'Swap Cost',
+            'CoF v SOFR',
+            'Bank Spread',
+            'Total Cost of Borrowing'
+        ],
+        'Rate': [
+            f"{rates['st_reference_rate']:.4%}",
+            f"{rates['fixing_adjustment']:.4%}",
+            f"{rates['reference_rate']:.4%}",
+            f"{rates['swap_cost']:.4%}",
+            f"{rates['cof_spread']:.4%}",
+            f"{rates['bank_spread']:.4%}",
+            f"{rates['total_borrowing_cost']:.4%}"
+        ]
+    })
+
+def build_sensitivity_table(params, rate_index):
+    """XIRR and net yield moves for a 1bp move in each input"""
+    sensitivities = note_sensitivities(params, rate_index)
+    labels = {
+        'coupon_rate': 'Coupon p.a.',
+        'ltv': 'Drawn LTV',
+        'total_borrowing_cost': 'Total Cost of Borrowing',
+        'reference_rate': 'Reference Rate',
+        'swap_cost': 'Swap Cost',
+        'cof_spread': 'CoF v SOFR',
+        'bank_spread': 'Bank Spread',
+    }
+    return pd.DataFrame({
+        'Input (+1bp)': [labels[name] for name in SENSITIVITY_INPUTS],
+        'XIRR (bp)': [f"{value:+.3f}" for value in sensitivities.xirr_gradient],
+        'Net Yield p.a. (bp)': [f"{value:+.3f}" for value in sensitivities.net_yield_gradient],
+    })
+
+def build_heatmap_grid(params, rate_index, heatmap_view):
+    """Net yield and XIRR over a heatmap view's grid, priced once for the base note
+
+    Slider and metric changes only index into this grid; it is re-priced when the
+    base note or the view changes.
+    """
+    grid = price_grid(params, HEATMAP_VIEWS[heatmap_view], rate_index)
+    return grid._replace(xirr=np.where(grid.xirr_converged, grid.xirr, np.nan))
+
+def heatmap_axis(name, values):
+    """Axis values as shown on the heatmap (percent for rate inputs)"""
+    return np.round(np.asarray(values) * 100, 3) if name in PERCENT_INPUTS else np.asarray(values)
+
+def build_heatmap_figure(grid, metric, params):
+    """Heatmap of one metric over the grid (y axis first), marking the current note"""
+    x_name, y_name = grid.names[1], grid.names[0]
+    figure = go.Figure(go.Heatmap(
+        x=heatmap_axis(x_name, grid.values[1]),
+        y=heatmap_axis(y_name, grid.values[0]),
+        z=np.round(getattr(grid, metric) * 100, 3),
+        colorscale='RdYlGn',
+        zmid=0,
+        colorbar={'title': '%'},
+        hovertemplate=f"{HEATMAP_LABELS[y_name]}: %{{y}}<br>{HEATMAP_LABELS[x_name]}: %{{x}}<br>%{{z:.2f}}%"
+                      f"<extra></extra>",
+    ))
+    figure.add_trace(go.Scattergl(
+        x=heatmap_axis(x_name, [getattr(params, x_name)]),
+        y=heatmap_axis(y_name, [getattr(params, y_name)]),
+        mode='markers',
+        marker={'symbol': 'x', 'size': 12, 'color': '#111827'},
+        name='Current note',
+        hoverinfo='skip',
+    ))
+    figure.update_layout(xaxis_title=HEATMAP_LABELS[x_name], yaxis_title=HEATMAP_LABELS[y_name], height=520,
+                         margin={'l': 10, 'r': 10, 't': 10, 'b': 10}, showlegend=False)
+    return figure
+
+def build_workbook(result, note_type, issuer, underlying):
+    """Excel export of the summary, XIRR schedule and rate breakdown"""
+    details = {'Note Type': note_type, 'Note Issuer': issuer, 'Underlying / Reference Entity': underlying}
+    return write_note_workbook(result, BytesIO(), details).getvalue()
+
+def solve_reverse(params, desired_yield, target):
+    """Coupon rate, LTV and spread headroom needed for the Reverse Calculator target"""
+    return {
+        solve_for: solve_required(params, [desired_yield], solve_for, target)[0]
+        for solve_for in ("coupon_rate", "ltv", "borrowing_spread")
+    }
+
+# Pricing results shared by every session on this server
+@st.cache_resource
+def get_pricing_graph():
+    """Process-wide stage graph: the pricing stages plus the tables built on them
+
+    A rerun only recomputes the stages whose inputs changed, e.g. editing the Reverse
+    Calculator target leaves the schedule, XIRR and tables untouched. Every recompute
+    is timed into the shared instrumentation.
+    """
+    diagnostics = get_instrumentation()
+    graph = pricing_graph(max_entries=256, on_compute=diagnostics.record_stage)
+    graph.add('summary_table', build_summary_table, ['result', 'note_type', 'issuer', 'underlying'])
+    graph.add('xirr_table', build_xirr_table, ['schedule', 'xirr_view'])
+    graph.add('rate_table', build_rate_table, ['rates'])
+    graph.add('sensitivity_table', build_sensitivity_table, ['params', 'rate_index'])
+    graph.add('heatmap_grid', build_heatmap_grid, ['params', 'rate_index', 'heatmap_view'])
+    graph.add('workbook', build_workbook, ['result', 'note_type', 'issuer', 'underlying'])
+    graph.add('reverse', solve_reverse, ['params', 'desired_yield', 'reverse_target'])
+    # Reruns with the xirr stage, so each XIRR solve is counted once
+    graph.add('xirr_stats', diagnostics.record_xirr, ['xirr'])
+    diagnostics.add_collector('pricing_graph', graph_collector(graph))
+    diagnostics.add_collector('rate_lookup', graph_collector(graph, 'rates'))
+    return graph
 
 # Sidebar Inputs (keeping configuration side the same)
 with st.sidebar:
@@ -744,10 +289,6 @@ with st.sidebar:
     trade_date = st.date_input("Trade Date", value=datetime.today())
     days_to_settle = st.number_input("Days to Settle", value=5, min_value=1, max_value=30)
     
-    # Calculate issue date
-    issue_date_ts = calculate_workday(pd.to_datetime(trade_date), days_to_settle)
-    issue_date = issue_date_ts.date() if hasattr(issue_date_ts, 'date') else issue_date_ts
-    
     # Tenor input (manual)
     tenor_years = st.number_input(
         "Tenor (Years)", 
@@ -758,25 +299,12 @@ with st.sidebar:
         format="%.1f"
     )
     
-    # Calculate maturity date from tenor (not editable)
-    maturity_date = issue_date_ts + relativedelta(months=int(tenor_years * 12)) - timedelta(days=1)
-    
-    # Display calculated values
-    st.info(f"Issue Date: {issue_date.strftime('%Y-%m-%d')}")
-    st.info(f"Maturity Date: {maturity_date.strftime('%Y-%m-%d')} (calculated)")
-    
-    # Calculate term values
-    term_days = (maturity_date - issue_date_ts).days + 1
-    term_months = round(((maturity_date.year - issue_date_ts.year) * 12 + 
-                        (maturity_date.month - issue_date_ts.month)) + 
-                       (maturity_date.day - issue_date_ts.day) / 30)
-    term_years = round(term_days / 365.25, 2)
+    # Calculated dates and term are filled in once the note is priced
+    dates_info = st.container()
 
-    st.info(f"Term: {term_days} days ({term_months} months, {term_years} years)")
-
-    asset_daycount = st.selectbox("Asset Daycount Convention", ["30/360", "A/365", "A/360"])
+    asset_daycount = st.selectbox("Asset Daycount Convention", DAYCOUNT_CONVENTIONS)
     financing_tenor = st.number_input("Financing Tenor (Months)", value=12, min_value=1, max_value=60)
-    liability_daycount = st.selectbox("Liability Daycount Convention", ["30/360", "A/365", "A/360"])
+    liability_daycount = st.selectbox("Liability Daycount Convention", DAYCOUNT_CONVENTIONS)
     
     st.divider()
     
@@ -784,13 +312,13 @@ with st.sidebar:
     st.markdown("<h4>XIRR Payment Frequencies</h4>", unsafe_allow_html=True)
     interest_freq = st.selectbox(
         "Interest Payment Frequency", 
-        ["Quarterly", "Semi-Annual", "Annual"], 
+        INTEREST_FREQUENCIES, 
         index=0,
         key="interest_payment_freq_selector"
     )
     coupon_freq = st.selectbox(
         "Coupon Payment Frequency", 
-        ["Annual", "Semi-Annual", "Quarterly", "At Maturity"], 
+        COUPON_FREQUENCIES, 
         index=0,
         key="coupon_payment_freq_selector"
     )
@@ -824,190 +352,236 @@ with st.sidebar:
         format="%.1f"
     )
     ltv = ltv_pct / 100
-    loan_ratio = ltv / (1 - ltv) if ltv < 1 else 0
-    total_invested = equity * (1 + loan_ratio)
-    loan_notional = total_invested - equity
-
-    st.info(f"Loan Ratio: {loan_ratio:.3f}")
-    st.info(f"Total Invested: ${total_invested:,.0f}")
-    st.info(f"Loan Notional: ${loan_notional:,.0f}")
+    funding_info = st.container()
 
     st.divider()
 
     # Borrowing Costs
     st.markdown("<h4>Borrowing Costs</h4>", unsafe_allow_html=True)
-    lender = st.selectbox("Lender", ["CAI", "DB", "SG", "Barc"])
-    floating_ref = st.selectbox("Floating Reference", ["1M", "3M", "6M", "12M"])
-
-    # Calculate borrowing costs from rate index using correct logic
-    st_reference_rate = get_rate_index_value(rate_index_table, floating_ref=floating_ref, column='LAST_PRICE')
-    tenor_last_price = get_rate_index_value(rate_index_table, tenor_months=financing_tenor, column='LAST_PRICE')
-    fixing_adjustment = tenor_last_price - st_reference_rate
-    reference_rate = st_reference_rate + fixing_adjustment
-    swap_cost = get_rate_index_value(rate_index_table, tenor_months=financing_tenor, custodian=lender, column='Swap Cost')
-    cof_spread = get_rate_index_value(rate_index_table, tenor_months=financing_tenor, custodian=lender, column='CoF v SOFR')
-    bank_spread = get_rate_index_value(rate_index_table, tenor_months=financing_tenor, custodian=lender, column='Loan Spread')
-    total_borrowing_cost = reference_rate + swap_cost + cof_spread + bank_spread
-
-    st.info(f"Total Borrowing Cost: {total_borrowing_cost:.3%}")
-
-# Main Content Area - Three Tables Only
-# Calculate cash flows
-if asset_daycount == "A/365":
-    coupon_cashflow = (total_invested * coupon_rate * term_days) / 365
-elif asset_daycount == "A/360":
-    coupon_cashflow = (total_invested * coupon_rate * term_days) / 360
-else:  # 30/360
-    days_360 = calculate_days360(issue_date_ts, maturity_date)
-    coupon_cashflow = days_360 * coupon_rate * total_invested / 360
-
-if liability_daycount == "A/365":
-    borrowing_cost = (loan_notional * total_borrowing_cost * term_days) / 365
-elif liability_daycount == "A/360":
-    borrowing_cost = (loan_notional * total_borrowing_cost * term_days) / 360
-else:  # 30/360
-    days_360 = calculate_days360(issue_date_ts, maturity_date)
-    borrowing_cost = days_360 * total_borrowing_cost * loan_notional / 360
-
-net_yield_total = coupon_cashflow - borrowing_cost
-net_yield_pa = net_yield_total / (equity * term_years) if term_years > 0 else 0
-
-# Generate XIRR cash flows
-dates, principal_flows, interest_payments, coupon_receipts, total_cashflows = generate_xirr_cashflows(
-    equity, loan_notional, total_invested, total_borrowing_cost, 
-    coupon_rate, issue_date_ts, maturity_date, interest_freq, coupon_freq
+    lender = st.selectbox("Lender", LENDERS)
+    floating_ref = st.selectbox("Floating Reference", FLOATING_REFS)
+    rate_interpolation = st.selectbox(
+        "Rate Curve Interpolation",
+        RATE_INTERPOLATIONS,
+        format_func=lambda method: "Exact tenors only" if method is None else method.replace('-', ' ').title(),
+        help="How financing tenors missing from the rate index table are priced"
+    )
+    borrowing_info = st.container()
+
+# Price the note with the headless engine
+params = NoteParams(
+    trade_date=trade_date,
+    days_to_settle=days_to_settle,
+    tenor_years=tenor_years,
+    asset_daycount=asset_daycount,
+    financing_tenor=financing_tenor,
+    liability_daycount=liability_daycount,
+    interest_freq=interest_freq,
+    coupon_freq=coupon_freq,
+    coupon_rate=coupon_rate,
+    equity=equity,
+    ltv=ltv,
+    lender=lender,
+    floating_ref=floating_ref,
+    rate_interpolation=rate_interpolation,
 )
+pricing = get_pricing_graph()
+sources = pricing_sources(params, note_type=note_type, issuer=issuer, underlying=underlying)
+try:
+    stages = pricing.evaluate(sources, ['result', 'summary_table', 'rate_table', 'xirr_stats'])
+except RateIndexLookupError as error:
+    st.error(f"Cannot price this note: {error}. Choose another financing tenor, lender, floating reference or an interpolation method.")
+    st.stop()
+result = stages['result']
+xirr_solution = result.xirr
+
+# Display calculated values
+with dates_info:
+    st.info(f"Issue Date: {result.issue_date.strftime('%Y-%m-%d')}")
+    st.info(f"Maturity Date: {result.maturity_date.strftime('%Y-%m-%d')} (calculated)")
+    st.info(f"Term: {result.term_days} days ({result.term_months} months, {result.term_years} years)")
+
+with funding_info:
+    st.info(f"Loan Ratio: {result.loan_ratio:.3f}")
+    st.info(f"Total Invested: ${result.total_invested:,.0f}")
+    st.info(f"Loan Notional: ${result.loan_notional:,.0f}")
+
+with borrowing_info:
+    st.info(f"Total Borrowing Cost: {result.total_borrowing_cost:.3%}")
 
-# Calculate XIRR
-xirr_result = calculate_xirr(dates, total_cashflows)
-
+# Main Content Area - Three Tables Only
 # TABLE 1: Summary Table
 st.markdown("### Summary", unsafe_allow_html=True)
 
-# Create tenor display (e.g., "3Y")
-tenor_display = f"{int(tenor_years)}Y" if tenor_years == int(tenor_years) else f"{tenor_years}Y"
-
-summary_data = pd.DataFrame({
-    'Parameter': [
-        'Tenor',
-        'Note Type',
-        'Note Issuer',
-        'Underlying / Reference Entity',
-        'Drawn LTV (%)',
-        'Coupon p.a. (%)',
-        'Total Cost of Borrowing (%)',
-        'Exp. Return on Equity p.a. (%)',
-        'XIRR'
-    ],
-    'Value': [
-        tenor_display,
-        note_type,
-        issuer,
-        underlying,
-        f"{ltv:.1%}",
-        f"{coupon_rate:.2%}",
-        f"{total_borrowing_cost:.3%}",
-        f"{net_yield_pa:.2%}",
-        f"{xirr_result:.2%}"
-    ]
-})
-
-st.dataframe(summary_data, use_container_width=True, hide_index=True)
+with diagnostics.stage('render_summary_table'):
+    st.dataframe(stages['summary_table'], use_container_width=True, hide_index=True)
+
+if not xirr_solution.converged:
+    st.warning("XIRR did not converge for this cash flow schedule - no rate found between -99% and 1000%")
 
 # TABLE 2: XIRR Table
 st.markdown("### XIRR", unsafe_allow_html=True)
 
-xirr_df = pd.DataFrame({
-    'Date': dates,
-    'Principal': principal_flows,
-    'Interest': interest_payments,
-    'Coupon': coupon_receipts,
-    'Total Cash Flow': total_cashflows,
-    'Cumulative': np.cumsum(total_cashflows)
-})
-
-st.dataframe(xirr_df.style.format({
-    'Date': lambda x: x.strftime('%Y-%m-%d'),
-    'Principal': '${:,.2f}',
-    'Interest': '${:,.2f}',
-    'Coupon': '${:,.2f}',
-    'Total Cash Flow': '${:,.2f}',
-    'Cumulative': '${:,.2f}'
-}), use_container_width=True)
+xirr_view = st.radio("View", XIRR_VIEWS, horizontal=True, key="xirr_view",
+                     format_func=lambda view: "Per payment" if view == 'Payment' else f"By {view.lower()}")
+xirr_table = pricing.evaluate(dict(sources, xirr_view=xirr_view), ['xirr_table'])['xirr_table']
+
+# Only the selected page of a long schedule is sent to the browser
+pages = max(-(-len(xirr_table) // XIRR_PAGE_ROWS), 1)
+page = st.number_input("Page", min_value=1, max_value=pages, value=1, key=f"xirr_page_{xirr_view}") if pages > 1 else 1
+first_row = (page - 1) * XIRR_PAGE_ROWS
+with diagnostics.stage('render_xirr_table'):
+    st.dataframe(xirr_table.iloc[first_row:first_row + XIRR_PAGE_ROWS], column_config=XIRR_COLUMN_CONFIG,
+                 use_container_width=True, hide_index=True)
+if pages > 1:
+    st.caption(f"Rows {first_row + 1}-{min(first_row + XIRR_PAGE_ROWS, len(xirr_table))} of {len(xirr_table)}")
+
+st.download_button(
+    "Download Excel (Summary, XIRR, Rate Breakdown)",
+    data=pricing.evaluate(sources, ['workbook'])['workbook'],
+    file_name=f"net_yield_{result.issue_date:%Y%m%d}.xlsx",
+    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+)
 
 # TABLE 3: Rate Breakdown Table (moved from sidebar)
 st.markdown("### Rate Breakdown", unsafe_allow_html=True)
 
-rate_breakdown_data = pd.DataFrame({
-    'Component': [
-        'ST Reference Rate',
-        'Fixing Adjustment', 
-        'Reference Rate',
-        'Swap Cost',
-        'CoF v SOFR',
-        'Bank Spread',
-        'Total Cost of Borrowing'
-    ],
-    'Rate': [
-        f"{st_reference_rate:.4%}",
-        f"{fixing_adjustment:.4%}",
-        f"{reference_rate:.4%}",
-        f"{swap_cost:.4%}",
-        f"{cof_spread:.4%}",
-        f"{bank_spread:.4%}",
-        f"{total_borrowing_cost:.4%}"
-    ]
-})
-
-st.dataframe(rate_breakdown_data, use_container_width=True, hide_index=True)
-
-# REVERSE CALCULATOR: Calculate Required Coupon Rate from Desired Net Yield
+with diagnostics.stage('render_rate_table'):
+    st.dataframe(stages['rate_table'], use_container_width=True, hide_index=True)
+
+with st.expander("Sensitivities (per 1bp)"):
+    st.dataframe(pricing.evaluate(sources, ['sensitivity_table'])['sensitivity_table'],
+                 use_container_width=True, hide_index=True)
+    st.caption("Analytic derivatives at the current inputs; an LTV move of 1bp is 0.01%.")
+
+# SENSITIVITY ANALYSIS: heatmaps over a cached grid around the current note
+st.markdown("### Sensitivity Analysis", unsafe_allow_html=True)
+
+@st.fragment
+def render_heatmap_slice(grid, metric):
+    """Metric along one row of the cached grid; moving the slider reruns only this fragment"""
+    x_name, y_name = grid.names[1], grid.names[0]
+    rows = heatmap_axis(y_name, grid.values[0]).tolist()
+    row = st.select_slider(HEATMAP_LABELS[y_name], options=rows, value=rows[len(rows) // 2],
+                           key=f"heatmap_slice_{'_'.join(grid.names)}")
+    values = getattr(grid, metric)[rows.index(row)]
+    figure = go.Figure(go.Scattergl(x=heatmap_axis(x_name, grid.values[1]), y=np.round(values * 100, 3),
+                                    mode='lines+markers', hovertemplate="%{x}: %{y:.2f}%<extra></extra>"))
+    figure.update_layout(xaxis_title=HEATMAP_LABELS[x_name], yaxis_title='%', height=300,
+                         margin={'l': 10, 'r': 10, 't': 10, 'b': 10})
+    st.plotly_chart(figure, use_container_width=True)
+
+col1, col2 = st.columns(2)
+with col1:
+    heatmap_view = st.selectbox("Heatmap", list(HEATMAP_VIEWS))
+with col2:
+    heatmap_metric = HEATMAP_METRICS[st.radio("Metric", list(HEATMAP_METRICS), horizontal=True)]
+
+heatmap_grid = pricing.evaluate(dict(sources, heatmap_view=heatmap_view), ['heatmap_grid'])['heatmap_grid']
+with diagnostics.stage('render_heatmap'):
+    st.plotly_chart(build_heatmap_figure(heatmap_grid, heatmap_metric, params), use_container_width=True)
+render_heatmap_slice(heatmap_grid, heatmap_metric)
+st.caption("Each grid is priced once per base note in one vectorized pass; the slider only indexes into it. "
+           "Blank cells cannot be priced (e.g. financing tenors missing from the rate index).")
+
+# REVERSE CALCULATOR: Calculate Required Coupon Rate, LTV or Spread from a Target Yield
 st.markdown("### Reverse Calculator", unsafe_allow_html=True)
 
 col1, col2 = st.columns(2)
 
 with col1:
+    reverse_target = st.radio(
+        "Target",
+        ["net_yield_pa", "xirr"],
+        format_func=lambda target: "Net Yield p.a." if target == "net_yield_pa" else "XIRR",
+        horizontal=True
+    )
     desired_net_yield_pct = st.number_input(
-        "Desired Net Yield p.a. (%)",
+        "Desired Net Yield p.a. (%)" if reverse_target == "net_yield_pa" else "Desired XIRR (%)",
         min_value=0.0,
         max_value=50.0,
         value=8.0,
         step=0.1,
         format="%.1f",
-        help="Enter your target net yield to calculate the required coupon rate"
+        help="Enter your target yield to calculate the required coupon rate, LTV or borrowing spread"
     )
     desired_net_yield = desired_net_yield_pct / 100
 
 with col2:
-    # Calculate required coupon rate
-    # Net Yield = (Coupon - Borrowing Cost) / (Equity * Years)
-    # Rearranging: Coupon = Net Yield * Equity * Years + Borrowing Cost
-    # Required Coupon Rate = Coupon / Total Invested
-    
-    if term_years > 0:
-        # Calculate required total coupon cash flow
-        required_coupon_cashflow = (desired_net_yield * equity * term_years) + borrowing_cost
-        
-        # Calculate required coupon rate based on daycount convention
-        if asset_daycount == "A/365":
-            required_coupon_rate = (required_coupon_cashflow * 365) / (total_invested * term_days)
-        elif asset_daycount == "A/360":
-            required_coupon_rate = (required_coupon_cashflow * 360) / (total_invested * term_days)
-        else:  # 30/360
-            days_360_calc = calculate_days360(issue_date_ts, maturity_date)
-            required_coupon_rate = (required_coupon_cashflow * 360) / (total_invested * days_360_calc)
-        
-        required_coupon_rate_pct = required_coupon_rate * 100
-        
+    required = pricing.evaluate(
+        dict(sources, desired_yield=desired_net_yield, reverse_target=reverse_target), ['reverse']
+    )['reverse']
+
+    if not np.isnan(required["coupon_rate"]):
+        required_coupon_rate_pct = required["coupon_rate"] * 100
+
         # Display the result
         st.info(f"**Required Coupon Rate p.a.:** {required_coupon_rate_pct:.2f}%")
-        
+        required_ltv = required["ltv"]
+        st.write(f"Required LTV at the current coupon: "
+                 f"{'n/a' if np.isnan(required_ltv) else f'{required_ltv:.2%}'}")
+        spread_headroom = required["borrowing_spread"]
+        st.write(f"Borrowing spread headroom: "
+                 f"{'n/a' if np.isnan(spread_headroom) else f'{spread_headroom * 10000:+.1f} bps'}")
+
         # Show calculation details in an expander
         with st.expander("View Calculation Details"):
-            st.write(f"To achieve a net yield of {desired_net_yield_pct:.1f}%:")
-            st.write(f"- Total coupon income needed: ${required_coupon_cashflow:,.2f}")
-            st.write(f"- Current borrowing cost: ${borrowing_cost:,.2f}")
-            st.write(f"- Investment amount: ${total_invested:,.0f}")
+            if reverse_target == "net_yield_pa":
+                required_coupon_cashflow = required_coupon_rate(result, desired_net_yield)[1]
+                st.write(f"To achieve a net yield of {desired_net_yield_pct:.1f}%:")
+                st.write(f"- Total coupon income needed: ${required_coupon_cashflow:,.2f}")
+            else:
+                st.write(f"To achieve an XIRR of {desired_net_yield_pct:.1f}% on the cash flow schedule:")
+                st.write("- Coupon, LTV and spread are solved so the schedule's NPV at the target is zero")
+            st.write(f"- Current borrowing cost: ${result.borrowing_cost:,.2f}")
+            st.write(f"- Investment amount: ${result.total_invested:,.0f}")
             st.write(f"- Daycount convention: {asset_daycount}")
     else:
-        st.warning("Cannot calculate - term years must be greater than 0")
+        st.warning("Cannot calculate - the target cannot be reached for this note (term years must be greater than 0)")
+
+diagnostics.record_stage('rerun', time.perf_counter() - rerun_start)
+
+# Where rerun time goes: stage timings, XIRR solver counters and hit rates across all sessions
+with st.expander("Diagnostics"):
+    st.caption("Stages")
+    st.dataframe(pd.DataFrame([
+        {
+            'Stage': stats.name,
+            'Calls': stats.calls,
+            'Last (ms)': stats.last_seconds * 1000,
+            'p50 (ms)': stats.p50_seconds * 1000,
+            'p99 (ms)': stats.p99_seconds * 1000,
+            'Total (ms)': stats.total_seconds * 1000,
+        }
+        for stats in diagnostics.stages()
+    ]), use_container_width=True, hide_index=True)
+
+    st.caption("Recompute counts")
+    st.dataframe(pd.DataFrame([
+        {
+            'Stage': timing.name,
+            'Evaluations': timing.evaluations,
+            'Recomputes': timing.recomputes,
+            'Last (ms)': timing.last_seconds * 1000,
+            'Total (ms)': timing.total_seconds * 1000,
+        }
+        for timing in pricing.timings()
+    ]), use_container_width=True, hide_index=True)
+
+    xirr_stats = diagnostics.xirr()
+    st.write(f"This note: XIRR {'converged' if xirr_solution.converged else 'did not converge'} "
+             f"in {xirr_solution.iterations} iterations ({xirr_solution.method})")
+    st.write(f"All sessions: {xirr_stats.solves} solves, {xirr_stats.failed} failed, "
+             f"{xirr_stats.mean_iterations:.1f} iterations on average (max {xirr_stats.max_iterations})")
+
+    st.caption("Hit rates")
+    st.dataframe(pd.DataFrame([
+        {'Cache': rate.name, 'Hits': rate.hits, 'Misses': rate.misses, 'Hit Rate': f"{rate.hit_rate:.1%}"}
+        for rate in diagnostics.hit_rates()
+    ]), use_container_width=True, hide_index=True)
+
+    col1, col2 = st.columns(2)
+    col1.download_button("Export JSON", diagnostics.to_json(indent=2), file_name="diagnostics.json",
+                         mime="application/json")
+    col2.download_button("Export OpenMetrics", diagnostics.to_openmetrics(), file_name="diagnostics.txt",
+                         mime="application/openmetrics-text; version=1.0.0; charset=utf-8")
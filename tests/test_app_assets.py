@@ -0,0 +1,32 @@
+import os
+import re
+import tomllib
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def read(*parts):
+    with open(os.path.join(REPO_ROOT, *parts), encoding='utf-8') as handle:
+        return handle.read()
+
+def test_stylesheet_is_served_from_the_static_directory():
+    with open(os.path.join(REPO_ROOT, '.streamlit', 'config.toml'), 'rb') as handle:
+        config = tomllib.load(handle)
+    assert config['server']['enableStaticServing'] is True
+    url = re.search(r"^STYLESHEET_URL = '([^']+)'", read('net_yield_simulator_app.py'), re.M).group(1)
+    assert url.startswith('app/static/')
+    assert os.path.isfile(os.path.join(REPO_ROOT, 'static', url[len('app/static/'):]))
+
+def test_app_injects_no_script_or_global_font_rule():
+    app = read('net_yield_simulator_app.py')
+    assert '<script' not in app.lower()
+    css = re.sub(r'/\*.*?\*/', '', read('static', 'net_yield.css'), flags=re.S)
+    assert 'font-family' not in css
+
+def test_app_renders_headless():
+    AppTest = pytest.importorskip('streamlit.testing.v1').AppTest
+    app = AppTest.from_file(os.path.join(REPO_ROOT, 'net_yield_simulator_app.py'), default_timeout=120).run()
+    assert not app.exception
+    assert len(app.dataframe) > 0
+    assert any('<link rel="stylesheet"' in markdown.value for markdown in app.markdown)
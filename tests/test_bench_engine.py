@@ -0,0 +1,29 @@
+import importlib.util
+import json
+import os
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+spec = importlib.util.spec_from_file_location('bench_engine', os.path.join(REPO_ROOT, 'benchmarks', 'bench_engine.py'))
+bench_engine = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench_engine)
+
+def run(values):
+    return {'metrics': {name: bench_engine.metric(value, unit, better)
+                        for name, (value, unit, better) in values.items()}}
+
+def test_compare_flags_only_changes_beyond_the_threshold_in_the_worse_direction():
+    baseline = run({'latency': (1.0, 's', 'lower'), 'throughput': (100.0, 'notes/s', 'higher'),
+                    'memory': (10.0, 'bytes', 'lower')})
+    current = run({'latency': (1.2, 's', 'lower'), 'throughput': (70.0, 'notes/s', 'higher'),
+                   'memory': (5.0, 'bytes', 'lower')})
+    rows = {name: regressed for name, _, _, _, regressed in bench_engine.compare(current, baseline, 25)}
+    assert rows == {'latency': False, 'throughput': True, 'memory': False}
+
+def test_committed_baseline_covers_the_suite():
+    with open(os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')) as handle:
+        baseline = json.load(handle)
+    assert not baseline['metadata']['quick']
+    names = set(baseline['metrics'])
+    assert {f'latency.price_note.{name}' for name in bench_engine.CONFIGURATIONS} <= names
+    assert {'throughput.price_columns', 'throughput.solve_xirr_batch'} <= names
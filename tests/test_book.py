@@ -0,0 +1,98 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.book import BOOK_FIELDS, NoteBook, NoteSpec, price_book
+from net_yield_engine.pricer import NoteParams, price_columns, price_note
+from net_yield_engine.schedule import build_schedule_buffer
+from net_yield_engine.sweep import price_grid
+
+def random_book(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        NoteParams(trade_date=date.fromordinal(date(2024, 1, 1).toordinal() + int(day)),
+                   days_to_settle=int(settle), tenor_years=float(tenor), coupon_rate=float(coupon), ltv=float(ltv),
+                   financing_tenor=int(financing), lender=str(lender), interest_freq=str(interest),
+                   coupon_freq=str(coupon_freq), asset_daycount=str(asset), liability_daycount=str(liability))
+        for day, settle, tenor, coupon, ltv, financing, lender, interest, coupon_freq, asset, liability in zip(
+            rng.integers(0, 400, count), rng.integers(1, 10, count), rng.choice([0.5, 1, 2, 3, 5, 7.5], count),
+            rng.uniform(0.03, 0.1, count), rng.uniform(0.3, 0.95, count), rng.choice([1, 3, 6, 12, 24, 37], count),
+            rng.choice(['CAI', 'DB', 'SG', 'Barc', 'XX'], count),
+            rng.choice(['Quarterly', 'Semi-Annual', 'Annual', 'Weekly'], count),
+            rng.choice(['Annual', 'Semi-Annual', 'Quarterly', 'At Maturity'], count),
+            rng.choice(['30/360', 'A/365', 'A/360', 'ACT/ACT', '30E/360'], count),
+            rng.choice(['30/360', 'A/360', 'A/365', 'ACT/ACT'], count),
+        )
+    ]
+
+def test_price_book_matches_price_columns():
+    params_list = random_book(400)
+    expected = price_columns(params_list)
+    columns, schedules = price_book(NoteBook.from_params(params_list))
+    assert expected['priced'].any() and not expected['priced'].all()
+    np.testing.assert_array_equal(columns['priced'], expected['priced'])
+    priced = expected['priced']
+    for name in ('issue_date', 'maturity_date'):
+        np.testing.assert_array_equal(columns[name][priced], expected[name][priced])
+    for name in ('total_borrowing_cost', 'net_yield_pa'):
+        np.testing.assert_array_equal(columns[name], expected[name])
+    np.testing.assert_allclose(columns['xirr'], expected['xirr'], atol=1e-10, equal_nan=True)
+
+    for i in np.flatnonzero(priced)[:50]:
+        reference = price_note(params_list[i]).schedule
+        for actual, wanted in zip(schedules.schedule(i), reference):
+            np.testing.assert_array_equal(actual, wanted)
+    assert all(len(schedules.schedule(i)) == 0 for i in np.flatnonzero(~priced))
+
+def test_price_book_empty_book():
+    columns, schedules = price_book(NoteBook.from_params([]))
+    assert len(columns['priced']) == 0
+    assert len(schedules) == 0
+
+def test_price_book_without_a_priceable_note():
+    book = NoteBook.from_columns({'financing_tenor': [37, 37], 'rate_interpolation': [None, None]})
+    columns, schedules = price_book(book)
+    assert not columns['priced'].any()
+    assert np.isnan(columns['xirr']).all()
+    assert all('RateIndexLookupError' in error for error in columns['error'])
+    np.testing.assert_array_equal(schedules.offsets, [0, 0, 0])
+
+def test_price_grid_without_a_priceable_point():
+    grid = price_grid(NoteParams(rate_interpolation=None), {'financing_tenor': [37, 38], 'ltv': [0.5, 0.8]})
+    assert grid.priced.shape == (2, 2)
+    assert not grid.priced.any()
+
+def test_build_schedule_buffer_without_notes():
+    empty = np.empty(0)
+    days = np.empty(0, dtype='datetime64[D]')
+    months = np.empty(0, dtype=np.int64)
+    daycounts = np.empty(0, dtype=object)
+    buffer = build_schedule_buffer(empty, empty, empty, empty, empty, days, days, months, months, daycounts, daycounts)
+    assert len(buffer) == 0
+    assert buffer.total.size == 0
+
+def test_note_book_round_trips_params():
+    params_list = random_book(20, seed=3)
+    book = NoteBook.from_params(params_list)
+    assert [spec.to_params() for spec in book] == params_list
+    assert list(book) == [NoteSpec.from_params(params) for params in params_list]
+    assert book[-1].lender == params_list[-1].lender
+    assert len(book[5:10]) == 5
+    with pytest.raises(IndexError):
+        book[20]
+
+def test_note_spec_is_a_slotted_record():
+    spec = NoteSpec(ltv=0.7, lender='DB')
+    assert not hasattr(spec, '__dict__')
+    assert set(NoteSpec.__slots__) == set(BOOK_FIELDS)
+    assert spec.to_params() == NoteParams(ltv=0.7, lender='DB')
+    with pytest.raises(TypeError):
+        NoteSpec(leverage=2)
+
+def test_note_book_from_specs_prices_like_from_params():
+    params_list = random_book(30, seed=4)
+    from_specs = price_book(NoteBook.from_specs([NoteSpec.from_params(params) for params in params_list])).columns
+    from_params = price_book(NoteBook.from_params(params_list)).columns
+    np.testing.assert_array_equal(from_specs['net_yield_pa'], from_params['net_yield_pa'])
+    np.testing.assert_array_equal(from_specs['xirr'], from_params['xirr'])
@@ -0,0 +1,57 @@
+from datetime import date
+
+import numpy as np
+
+from net_yield_engine.cache import ScenarioCache, scenario_key
+from net_yield_engine.graph import pricing_graph, pricing_sources
+from net_yield_engine.pricer import NoteParams
+from net_yield_engine.rates import RateIndex, default_rate_index
+
+def test_scenario_key_depends_on_inputs_and_rate_index_version():
+    params = NoteParams()
+    assert scenario_key(params, 'a') == scenario_key({}, 'a')
+    assert scenario_key(params, 'a') != scenario_key(params, 'b')
+    assert scenario_key(params, 'a') != scenario_key(NoteParams(ltv=0.5), 'a')
+
+def test_scenario_key_canonicalizes_numbers():
+    assert scenario_key({'trade_date': date(2025, 1, 6), 'days_to_settle': 5}) == \
+        scenario_key({'trade_date': date(2025, 1, 6), 'days_to_settle': np.float64(5.0)})
+    assert scenario_key({'trade_date': date(2025, 1, 6)}) != scenario_key({'trade_date': date(2025, 1, 7)})
+
+def test_cache_evicts_beyond_max_entries_and_clear_keeps_counters():
+    cache = ScenarioCache(max_entries=2)
+    for key in 'abc':
+        cache.put(key, key, size=1)
+    assert len(cache) == 2 and 'a' not in cache
+    cache.get('b')
+    cache.clear()
+    stats = cache.stats()
+    assert (len(cache), stats.hits, stats.evictions) == (0, 1, 1)
+
+def test_cache_evicts_least_recently_used_by_size():
+    cache = ScenarioCache(max_bytes=100)
+    cache.put('a', {'x': 1}, size=60)
+    cache.put('b', {'x': 2}, size=30)
+    assert cache.get('a') == {'x': 1}
+    cache.put('c', {'x': 3}, size=30)
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert cache.stats().evictions == 1
+
+def test_price_note_caches_read_only_schedules():
+    cache = ScenarioCache()
+    first = cache.price_note(NoteParams())
+    assert cache.price_note(NoteParams()) is first
+    assert not first.schedule.total.flags.writeable
+    assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+def test_rate_index_reload_invalidates_memoized_pricing():
+    current = default_rate_index()
+    reloaded = RateIndex(current.rows, version=current.version + '-reloaded')
+    computed = []
+    graph = pricing_graph(on_compute=lambda name, seconds: computed.append(name))
+    graph.evaluate(pricing_sources(NoteParams(), current), ['result'])
+    computed.clear()
+    graph.evaluate(pricing_sources(NoteParams(), current), ['result'])
+    assert computed == []
+    graph.evaluate(pricing_sources(NoteParams(), reloaded), ['result'])
+    assert 'rates' in computed and 'result' in computed and 'dates' not in computed
@@ -0,0 +1,51 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from net_yield_engine.calendars import WEEKENDS_ONLY, BusinessCalendar, read_holiday_file
+from net_yield_engine.dates import calculate_maturity_date, calculate_workday, maturity_dates, settlement_dates
+
+def excel_workday(start, days, holidays=()):
+    """Excel WORKDAY stepping one day at a time"""
+    current = start
+    while days:
+        current += timedelta(days=1)
+        if current.weekday() < 5 and current not in holidays:
+            days -= 1
+    return current
+
+def test_calculate_workday_matches_excel_workday():
+    for offset in range(14):
+        trade_date = date(2025, 1, 1) + timedelta(days=offset)
+        for days in (0, 1, 2, 5, 7):
+            assert calculate_workday(trade_date, days) == excel_workday(trade_date, days)
+
+def test_holidays_are_skipped_and_arrays_broadcast():
+    calendar = BusinessCalendar([date(2025, 12, 25), date(2025, 12, 26)])
+    assert calculate_workday(date(2025, 12, 24), 1, calendar) == date(2025, 12, 29)
+    trade_dates = np.array(['2025-12-22', '2025-12-23', '2025-12-24'], dtype='datetime64[D]')
+    expected = [excel_workday(day.item(), 2, {date(2025, 12, 25), date(2025, 12, 26)}) for day in trade_dates]
+    assert settlement_dates(trade_dates, 2, calendar).tolist() == expected
+
+def test_adjust_by_business_day_convention():
+    saturday = date(2025, 5, 31)
+    assert WEEKENDS_ONLY.adjust(saturday, 'Following') == date(2025, 6, 2)
+    assert WEEKENDS_ONLY.adjust(saturday, 'Modified Following') == date(2025, 5, 30)
+    assert WEEKENDS_ONLY.adjust(saturday, 'Unadjusted') == saturday
+    with pytest.raises(ValueError):
+        WEEKENDS_ONLY.adjust(saturday, 'Nearest')
+
+def test_combined_calendars_close_on_either_holiday_list(tmp_path):
+    (tmp_path / 'ny.csv').write_text("date,name\n2025-07-04,Independence Day\n")
+    (tmp_path / 'ldn.txt').write_text("# London\n2025-08-25\n")
+    joint = BusinessCalendar.from_files(tmp_path / 'ny.csv').combine(
+        BusinessCalendar(read_holiday_file(tmp_path / 'ldn.txt')))
+    assert not joint.is_business_day(date(2025, 7, 4)) and not joint.is_business_day(date(2025, 8, 25))
+    assert joint.business_days_between(date(2025, 7, 1), date(2025, 7, 8)) == 4
+
+def test_maturity_dates_match_calculate_maturity_date():
+    issues = [date(2024, 1, 31), date(2024, 2, 29), date(2025, 1, 13)]
+    tenors = [0.5, 1.0, 2.75]
+    expected = [calculate_maturity_date(issue, tenor) for issue, tenor in zip(issues, tenors)]
+    assert maturity_dates(np.array(issues, dtype='datetime64[D]'), tenors).tolist() == expected
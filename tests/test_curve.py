@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from net_yield_engine.curve import INTERPOLATION_METHODS, RateCurve
+
+TENORS = [1.0, 3.0, 6.0, 12.0]
+RATES = [0.040, 0.041, 0.043, 0.042]
+
+@pytest.mark.parametrize('method', INTERPOLATION_METHODS)
+def test_curves_hit_their_pillars_and_extrapolate_flat(method):
+    curve = RateCurve(TENORS, RATES, method)
+    np.testing.assert_allclose(curve(TENORS), RATES)
+    assert curve(0.5) == pytest.approx(0.040)
+    assert curve(24) == pytest.approx(0.042)
+
+def test_linear_and_log_linear_between_pillars():
+    assert RateCurve(TENORS, RATES, 'linear')(4.5) == pytest.approx(0.042)
+    assert RateCurve(TENORS, RATES, 'log-linear')(4.5) == pytest.approx((0.5 * 0.041 * 3 + 0.5 * 0.043 * 6) / 4.5)
+
+def test_monotone_cubic_stays_within_its_pillars():
+    values = RateCurve(TENORS, RATES, 'monotone-cubic')(np.linspace(1, 12, 200))
+    assert values.min() >= 0.040 - 1e-12 and values.max() <= 0.043 + 1e-12
+
+def test_bad_curves_raise():
+    with pytest.raises(ValueError):
+        RateCurve(TENORS, RATES, 'spline')
+    with pytest.raises(ValueError):
+        RateCurve([1.0, 1.0], [0.04, 0.05])
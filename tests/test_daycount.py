@@ -0,0 +1,31 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.daycount import DAYCOUNT_CONVENTIONS, day_count, days360, term_year_fraction, year_fraction
+
+def test_days360_us_rule():
+    assert days360(date(2024, 1, 31), date(2024, 3, 31)) == 60
+    assert days360(date(2024, 1, 30), date(2024, 2, 29)) == 29
+
+@pytest.mark.parametrize('convention, expected', [
+    ('A/365', 366 / 365),
+    ('A/360', 366 / 360),
+    ('30/360', 1.0),
+    ('30E/360', 1.0),
+    ('ACT/ACT', 1.0),
+])
+def test_year_fraction_over_a_leap_year(convention, expected):
+    assert year_fraction(convention, date(2024, 1, 1), date(2025, 1, 1)) == pytest.approx(expected)
+
+def test_term_year_fraction_matches_scalar_conventions():
+    starts = np.array(['2024-01-15', '2024-02-29', '2025-06-30'], dtype='datetime64[D]')
+    ends = np.array(['2025-01-15', '2026-02-28', '2025-12-31'], dtype='datetime64[D]')
+    for convention in DAYCOUNT_CONVENTIONS:
+        expected = [term_year_fraction(convention, start.item(), end.item()) for start, end in zip(starts, ends)]
+        np.testing.assert_allclose(term_year_fraction(convention, starts, ends), expected)
+
+def test_unknown_convention_raises():
+    with pytest.raises(ValueError):
+        day_count('ACT/999', date(2024, 1, 1), date(2025, 1, 1))
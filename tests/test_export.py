@@ -0,0 +1,110 @@
+import io
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from net_yield_engine import export
+from net_yield_engine._io import file_format
+from net_yield_engine.export import SCHEDULE_COLUMNS, export_chunks, open_writer, write_note_workbook
+from net_yield_engine.pricer import NoteParams, price_note
+
+COLUMNS = ['point', 'rate', 'date', 'priced', 'error']
+
+def chunk(start):
+    return {
+        'point': np.arange(start, start + 3),
+        'rate': np.array([0.1, np.nan, 1 / 3]),
+        'date': np.array(['2025-01-06', 'NaT', '2025-01-06'], dtype='datetime64[D]'),
+        'priced': np.array([True, False, True]),
+        'error': np.array(['', 'ValueError: bad, "quoted"', None], dtype=object),
+    }
+
+def test_csv_export_text(tmp_path):
+    assert export_chunks([chunk(0), chunk(3)], tmp_path / 'out.csv') == 6
+    with open(tmp_path / 'out.csv', newline='') as handle:
+        text = handle.read()
+    assert text == (
+        'point,rate,date,priced,error\r\n'
+        '0,0.1,2025-01-06,true,\r\n'
+        '1,,,false,"ValueError: bad, ""quoted"""\r\n'
+        '2,0.3333333333333333,2025-01-06,true,\r\n'
+        '3,0.1,2025-01-06,true,\r\n'
+        '4,,,false,"ValueError: bad, ""quoted"""\r\n'
+        '5,0.3333333333333333,2025-01-06,true,\r\n'
+    )
+
+def test_writers_are_picked_by_extension():
+    assert [file_format(path) for path in ('a.csv', 'a.PQ', 'a.parquet', 'a.xlsx', 'a')] == \
+        ['csv', 'parquet', 'parquet', 'xlsx', 'csv']
+
+def test_parquet_export_round_trips(tmp_path):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    with open_writer(tmp_path / 'out.parquet', COLUMNS) as writer:
+        writer.write(chunk(0))
+    table = parquet.read_table(tmp_path / 'out.parquet').to_pydict()
+    assert table['point'] == [0, 1, 2] and table['priced'] == [True, False, True]
+    assert table['error'] == ['', 'ValueError: bad, "quoted"', None]
+
+def test_nothing_is_written_without_chunks(tmp_path):
+    assert export_chunks([], tmp_path / 'out.csv') == 0
+    assert not (tmp_path / 'out.csv').exists()
+
+def test_empty_export_with_columns_writes_the_header(tmp_path):
+    assert export_chunks([], tmp_path / 'out.csv', COLUMNS) == 0
+    assert (tmp_path / 'out.csv').read_bytes() == b'point,rate,date,priced,error\r\n'
+    parquet = pytest.importorskip('pyarrow.parquet')
+    assert export_chunks([], tmp_path / 'out.parquet', COLUMNS) == 0
+    table = parquet.read_table(tmp_path / 'out.parquet')
+    assert table.column_names == COLUMNS and table.num_rows == 0
+
+def read_workbook(path):
+    openpyxl = pytest.importorskip('openpyxl')
+    workbook = openpyxl.load_workbook(path)
+    return {sheet.title: [list(row) for row in sheet.iter_rows(values_only=True)] for sheet in workbook}
+
+def test_xlsx_export_writes_native_cells(tmp_path):
+    pytest.importorskip('xlsxwriter')
+    assert export_chunks([chunk(0), chunk(3)], tmp_path / 'out.xlsx') == 6
+    sheets = read_workbook(tmp_path / 'out.xlsx')
+    assert list(sheets) == ['Results']
+    rows = sheets['Results']
+    assert rows[0] == COLUMNS
+    assert rows[1] == [0, 0.1, datetime(2025, 1, 6), True, None]
+    assert rows[2] == [1, None, None, False, 'ValueError: bad, "quoted"']
+    assert rows[6] == [5, 1 / 3, datetime(2025, 1, 6), True, None]
+    assert len(rows) == 7
+
+def test_xlsx_export_rolls_over_past_the_row_limit(tmp_path, monkeypatch):
+    pytest.importorskip('xlsxwriter')
+    monkeypatch.setattr(export, 'XLSX_MAX_ROWS', 4)
+    assert export_chunks([chunk(0), chunk(3), chunk(6)], tmp_path / 'out.xlsx', sheet_name='Sweep') == 9
+    sheets = read_workbook(tmp_path / 'out.xlsx')
+    assert list(sheets) == ['Sweep', 'Sweep 2', 'Sweep 3']
+    assert [len(rows) for rows in sheets.values()] == [5, 5, 2]
+    assert all(rows[0] == COLUMNS for rows in sheets.values())
+    assert [row[0] for rows in sheets.values() for row in rows[1:]] == list(range(9))
+
+def test_empty_xlsx_export_with_columns_writes_the_header(tmp_path):
+    pytest.importorskip('xlsxwriter')
+    assert export_chunks([], tmp_path / 'out.xlsx', COLUMNS) == 0
+    assert read_workbook(tmp_path / 'out.xlsx') == {'Results': [COLUMNS]}
+
+def test_note_workbook(tmp_path):
+    pytest.importorskip('xlsxwriter')
+    result = price_note(NoteParams(trade_date=date(2025, 1, 6)))
+    write_note_workbook(result, tmp_path / 'note.xlsx', details={'Note Type': 'Fixed'})
+    sheets = read_workbook(tmp_path / 'note.xlsx')
+    assert list(sheets) == ['Summary', 'XIRR', 'Rate Breakdown']
+    summary = dict(sheets['Summary'][1:])
+    assert summary['Note Type'] == 'Fixed'
+    assert summary['Maturity Date'] == datetime.combine(result.maturity_date, datetime.min.time())
+    assert summary['Exp. Return on Equity p.a.'] == pytest.approx(result.net_yield_pa)
+    schedule = sheets['XIRR']
+    assert schedule[0] == SCHEDULE_COLUMNS
+    assert len(schedule) == len(result.schedule.dates) + 1
+    assert schedule[-1][-1] == pytest.approx(result.schedule.total.sum())
+    assert dict(sheets['Rate Breakdown'][1:])['Total Cost of Borrowing'] == pytest.approx(result.total_borrowing_cost)
+
+    download = write_note_workbook(result, io.BytesIO())
+    assert read_workbook(io.BytesIO(download.getvalue()))['XIRR'] == schedule
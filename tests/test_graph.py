@@ -0,0 +1,42 @@
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from net_yield_engine.graph import StageGraph, pricing_graph, pricing_sources
+from net_yield_engine.pricer import NoteParams, price_note
+
+PARAMS = NoteParams(trade_date=date(2025, 1, 6))
+
+def test_graph_result_matches_price_note():
+    result = pricing_graph().evaluate(pricing_sources(PARAMS), ['result'])['result']
+    expected = price_note(PARAMS)
+    assert result.net_yield_pa == expected.net_yield_pa
+    assert result.xirr.rate == pytest.approx(expected.xirr.rate, abs=1e-12)
+
+def test_only_stages_downstream_of_a_change_rerun():
+    computed = []
+    graph = pricing_graph(on_compute=lambda name, seconds: computed.append(name))
+    graph.evaluate(pricing_sources(PARAMS))
+    computed.clear()
+    graph.evaluate(pricing_sources(replace(PARAMS, coupon_rate=0.09)))
+    assert sorted(computed) == ['cashflows', 'result', 'schedule', 'xirr']
+    computed.clear()
+    graph.evaluate(pricing_sources(PARAMS))
+    assert computed == []
+
+def test_memo_keeps_max_entries_per_stage():
+    calls = []
+    graph = StageGraph(max_entries=2).add('double', lambda x: calls.append(x) or 2 * x, ['x'])
+    for x in (1, 2, 3, 1):
+        assert graph.evaluate({'x': x}, ['double'])['double'] == 2 * x
+    assert calls == [1, 2, 3, 1]
+    assert graph.evaluate({'x': 3}, ['double'])['double'] == 6
+    assert calls == [1, 2, 3, 1]
+
+def test_missing_sources_and_duplicate_stages_raise():
+    graph = StageGraph().add('double', lambda x: 2 * x, ['x'])
+    with pytest.raises(KeyError):
+        graph.evaluate({}, ['double'])
+    with pytest.raises(ValueError):
+        graph.add('double', lambda x: x, ['x'])
@@ -0,0 +1,42 @@
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.greeks import SENSITIVITY_INPUTS, note_sensitivities
+from net_yield_engine.pricer import NoteParams, price_note
+from net_yield_engine.rates import RateIndex, default_rate_index
+
+NOTES = [NoteParams(trade_date=date(2025, 1, 6), coupon_rate=0.07, ltv=0.8),
+         NoteParams(trade_date=date(2025, 1, 6), tenor_years=5.0, interest_freq='Semi-Annual',
+                    coupon_freq='At Maturity', liability_daycount='A/360', lender='DB')]
+STEP = 1e-6
+
+def bumped(params, name, step):
+    """Price params with one input moved by step"""
+    if name in ('coupon_rate', 'ltv'):
+        return price_note(replace(params, **{name: getattr(params, name) + step}))
+    rows = [dict(row, **{'Loan Spread': row['Loan Spread'] + step}) if row['Custodian'] == params.lender else row
+            for row in default_rate_index().rows]
+    return price_note(params, RateIndex(rows))
+
+@pytest.mark.parametrize('name', ['coupon_rate', 'ltv', 'bank_spread'])
+def test_gradients_match_finite_differences(name):
+    sensitivities = note_sensitivities(NOTES)
+    column = SENSITIVITY_INPUTS.index(name)
+    for i, params in enumerate(NOTES):
+        up, down = bumped(params, name, STEP), bumped(params, name, -STEP)
+        assert sensitivities.xirr_gradient[i, column] == pytest.approx(
+            (up.xirr.rate - down.xirr.rate) / (2 * STEP), rel=1e-5)
+        assert sensitivities.net_yield_gradient[i, column] == pytest.approx(
+            (up.net_yield_pa - down.net_yield_pa) / (2 * STEP), rel=1e-6)
+
+def test_borrowing_components_share_the_total_cost_gradient():
+    gradient = note_sensitivities(NOTES[0]).xirr_gradient
+    np.testing.assert_allclose(gradient[2:], gradient[2])
+
+def test_unpriceable_notes_have_nan_gradients():
+    sensitivities = note_sensitivities([NOTES[0], replace(NOTES[0], interest_freq='Weekly')])
+    assert np.isfinite(sensitivities.xirr_gradient[0]).all()
+    assert np.isnan(sensitivities.xirr_gradient[1]).all() and not sensitivities.converged[1]
@@ -0,0 +1,39 @@
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.history import RateIndexHistory, price_note_as_of, reprice_history
+from net_yield_engine.pricer import NoteParams, price_note
+from net_yield_engine.rates import RateIndex, RateIndexLookupError, default_rate_index
+
+def shifted_index(shift):
+    return RateIndex([dict(row, LAST_PRICE=None if row['LAST_PRICE'] is None else row['LAST_PRICE'] + shift)
+                      for row in default_rate_index().rows])
+
+HISTORY = RateIndexHistory(['2025-03-03', '2025-01-02'], [shifted_index(0.01), shifted_index(0.0)])
+NOTES = [NoteParams(trade_date=date(2025, 1, 6)), NoteParams(trade_date=date(2025, 1, 6), coupon_rate=0.08)]
+
+def test_as_of_picks_the_latest_snapshot_on_or_before_a_date():
+    assert HISTORY.as_of(date(2025, 3, 2)) == shifted_index(0.0)
+    assert HISTORY.as_of(date(2025, 3, 3)) == shifted_index(0.01)
+    with pytest.raises(RateIndexLookupError):
+        HISTORY.as_of(date(2024, 12, 31))
+    with pytest.raises(ValueError):
+        RateIndexHistory(['2025-01-02', '2025-01-02'], [shifted_index(0.0)] * 2)
+
+def test_price_note_as_of_uses_the_trade_date_snapshot():
+    params = replace(NOTES[0], trade_date=date(2025, 3, 10))
+    assert price_note_as_of(params, HISTORY).net_yield_pa == price_note(params, shifted_index(0.01)).net_yield_pa
+
+def test_reprice_history_matches_price_note_on_each_date():
+    dates = np.array(['2024-12-31', '2025-01-06', '2025-03-03', '2025-06-30'], dtype='datetime64[D]')
+    columns = reprice_history(NOTES, HISTORY, dates)
+    assert columns['note'].tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+    assert columns['priced'].tolist() == [False, True, True, True] * 2
+    for row in np.flatnonzero(columns['priced']):
+        params = replace(NOTES[columns['note'][row]], trade_date=columns['as_of'][row].item())
+        expected = price_note(params, HISTORY.as_of(params.trade_date))
+        assert columns['issue_date'][row].item() == expected.issue_date
+        assert columns['net_yield_pa'][row] == pytest.approx(expected.net_yield_pa, rel=1e-12)
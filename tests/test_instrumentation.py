@@ -0,0 +1,50 @@
+import functools
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.graph import pricing_graph, pricing_sources
+from net_yield_engine.instrumentation import Instrumentation, graph_collector, lru_collector
+from net_yield_engine.pricer import NoteParams
+from net_yield_engine.xirr import BatchXirrResult, XirrResult
+
+def test_stage_timings_and_percentiles():
+    diagnostics = Instrumentation()
+    for seconds in np.linspace(0.001, 0.1, 100):
+        diagnostics.record_stage('schedule', seconds)
+    with diagnostics.stage('dates'):
+        pass
+    slowest, fastest = diagnostics.stages()
+    assert (slowest.name, slowest.calls, fastest.name, fastest.calls) == ('schedule', 100, 'dates', 1)
+    assert slowest.max_seconds == pytest.approx(0.1)
+    assert slowest.p50_seconds == pytest.approx(0.0505)
+
+def test_xirr_counters_take_single_and_batch_results():
+    diagnostics = Instrumentation()
+    diagnostics.record_xirr(XirrResult(0.1, True, 4, 'newton'))
+    diagnostics.record_xirr(BatchXirrResult(np.array([0.1, np.nan]), np.array([True, False]), np.array([5, 100])))
+    stats = diagnostics.xirr()
+    assert (stats.solves, stats.converged, stats.failed, stats.iterations, stats.max_iterations) == (3, 2, 1, 109, 100)
+    assert stats.methods == {'newton': 1, 'batch': 2}
+
+def test_collectors_report_hit_rates_in_every_export():
+    @functools.lru_cache
+    def square(x):
+        return x * x
+
+    graph = pricing_graph()
+    sources = pricing_sources(NoteParams(trade_date=date(2025, 1, 6)))
+    graph.evaluate(sources)
+    graph.evaluate(sources)
+    square(2), square(2), square(3)
+    diagnostics = Instrumentation().add_collector('square', lru_collector(square))
+    diagnostics.add_collector('graph', graph_collector(graph, 'result'))
+    rates = {rate.name: rate for rate in diagnostics.hit_rates()}
+    assert (rates['square'].hits, rates['square'].misses) == (1, 2)
+    assert (rates['graph'].hits, rates['graph'].misses) == (1, 1)
+    assert json.loads(diagnostics.to_json())['hit_rates'][0]['name'] == 'square'
+    text = diagnostics.to_openmetrics()
+    assert 'net_yield_cache_hits_total{cache="graph"} 1' in text
+    assert text.endswith('# EOF\n')
@@ -0,0 +1,46 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.montecarlo import (
+    RATE_MODELS,
+    simulate_note,
+    simulate_reference_rates,
+    simulation_percentiles,
+)
+from net_yield_engine.pricer import NoteParams, price_note
+from net_yield_engine.rates import RateIndex, default_rate_index
+
+PARAMS = NoteParams(trade_date=date(2025, 1, 6), coupon_rate=0.07, ltv=0.8)
+
+def flat_rate_index(rate):
+    return RateIndex([dict(row, LAST_PRICE=rate) for row in default_rate_index().rows])
+
+@pytest.mark.parametrize('model', RATE_MODELS)
+def test_simulated_rates_average_to_the_forwards(model):
+    times = np.array([0.0, 0.25, 0.5, 1.0, 2.0])
+    forwards = np.array([0.04, 0.041, 0.042, 0.043, 0.045])
+    paths = simulate_reference_rates(forwards, times, 200000, model, rng=1)
+    np.testing.assert_array_equal(paths[:, 0], forwards[0])
+    np.testing.assert_allclose(paths.mean(axis=0), forwards, atol=2e-4)
+
+def test_a_flat_curve_without_volatility_reproduces_price_note():
+    rate_index = flat_rate_index(0.04)
+    result = simulate_note(PARAMS, n_paths=8, volatility=0.0, rate_index=rate_index)
+    expected = price_note(PARAMS, rate_index)
+    np.testing.assert_allclose(result.forward_rates, 0.04)
+    np.testing.assert_allclose(result.net_yield_pa, expected.net_yield_pa)
+    np.testing.assert_allclose(result.xirr, expected.xirr.rate, atol=1e-9)
+
+def test_results_do_not_depend_on_the_chunk_size():
+    whole = simulate_note(PARAMS, n_paths=500, seed=7)
+    chunked = simulate_note(PARAMS, n_paths=500, seed=7, chunk_size=64)
+    np.testing.assert_array_equal(whole.xirr, chunked.xirr)
+    assert whole.converged.all()
+    percentiles = simulation_percentiles(whole)
+    assert np.all(np.diff(percentiles['xirr']) >= 0)
+
+def test_unknown_model_raises():
+    with pytest.raises(ValueError):
+        simulate_reference_rates(np.zeros(2), np.array([0.0, 1.0]), 10, 'cir')
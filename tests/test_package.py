@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import net_yield_engine
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_engine_import_leaves_heavy_modules_unloaded():
+    code = ("import sys, net_yield_engine; "
+            "print(' '.join(m for m in ('asyncio', 'concurrent.futures', 'multiprocessing', 'numpy.ma') "
+            "if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True,
+                            check=True).stdout.split()
+    assert loaded == []
+
+def test_lazy_exports_resolve():
+    from net_yield_engine import PricingService, price_portfolio, run_sweep
+    from net_yield_engine.service import PricingService as service_class
+    assert PricingService is service_class
+    assert callable(run_sweep) and callable(price_portfolio)
+    assert 'iter_sweep' in dir(net_yield_engine)
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        net_yield_engine.not_an_export
@@ -0,0 +1,58 @@
+import csv
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.portfolio import OUTPUT_COLUMNS, parse_trade, price_portfolio, price_trades
+from net_yield_engine.pricer import NoteParams, price_columns, price_note
+
+def write_trades(path, rows):
+    with open(path, 'w', newline='') as handle:
+        writer = csv.DictWriter(handle, fieldnames=sorted({name for row in rows for name in row}))
+        writer.writeheader()
+        writer.writerows(rows)
+
+def test_price_portfolio_streams_csv_in_chunks(tmp_path):
+    rows = [{'trade_id': f"T{i}", 'trade_date': '2025-01-06', 'ltv': str(0.5 + i / 100), 'coupon_rate': '0.06'}
+            for i in range(25)]
+    write_trades(tmp_path / 'trades.csv', rows)
+    trades, priced = price_portfolio(tmp_path / 'trades.csv', tmp_path / 'priced.csv', chunk_size=7)
+    assert (trades, priced) == (25, 25)
+
+    with open(tmp_path / 'priced.csv', newline='') as handle:
+        output = list(csv.DictReader(handle))
+    assert list(output[0]) == OUTPUT_COLUMNS
+    assert [row['trade_id'] for row in output] == [row['trade_id'] for row in rows]
+    expected = price_note(NoteParams(trade_date=date(2025, 1, 6), ltv=0.53, coupon_rate=0.06))
+    assert float(output[3]['net_yield_pa']) == expected.net_yield_pa
+
+def test_price_trades_reports_unparseable_rows():
+    columns = price_trades([{'trade_date': 'not a date'}, {'trade_date': '2025-01-06'}])
+    assert columns['priced'].tolist() == [False, True]
+    assert columns['error'][0].startswith('ValueError')
+
+def test_parse_trade_rejects_bad_numbers():
+    assert parse_trade({'days_to_settle': '3', 'tenor_years': 2}).days_to_settle == 3
+    for row in ({'days_to_settle': [2]}, {'days_to_settle': 2.5}, {'tenor_years': float('nan')},
+                {'ltv': 'inf'}, {'equity': 'abc'}):
+        with pytest.raises(ValueError):
+            parse_trade(row)
+
+def test_price_columns_marks_mistyped_notes_as_failed():
+    columns = price_columns([NoteParams(days_to_settle=None), NoteParams(), NoteParams(tenor_years=1e300)])
+    assert columns['priced'].tolist() == [False, True, False]
+    assert columns['error'][0].startswith('TypeError')
+
+def test_price_trades_matches_price_columns():
+    rows = [{'trade_date': '2025-01-06', 'ltv': str(0.3 + i / 20), 'lender': lender, 'interest_freq': freq}
+            for i, (lender, freq) in enumerate([('DB', 'Quarterly'), ('SG', 'Annual'), ('Nowhere', 'Quarterly'),
+                                                ('Barc', 'Monthly'), ('CAI', 'Semi-Annual')])]
+    columns = price_trades(rows)
+    expected = price_columns([parse_trade(row) for row in rows])
+    assert columns['priced'].tolist() == [True, True, False, False, True]
+    for name, values in expected.items():
+        if values.dtype.kind == 'f':
+            np.testing.assert_allclose(columns[name], values, rtol=1e-12)
+        else:
+            assert columns[name].tolist() == values.tolist()
@@ -0,0 +1,33 @@
+from datetime import date
+
+import pytest
+
+from net_yield_engine.pricer import NoteParams, price_note, price_notes, required_coupon_rate
+
+PARAMS = NoteParams(trade_date=date(2025, 1, 6), coupon_rate=0.07, ltv=0.8)
+
+def test_price_note_follows_the_net_yield_formulas():
+    result = price_note(PARAMS)
+    assert result.issue_date == date(2025, 1, 13)
+    assert result.maturity_date == date(2028, 1, 12)
+    assert result.loan_ratio == pytest.approx(4.0)
+    assert result.total_invested == pytest.approx(7500000)
+    assert result.loan_notional == pytest.approx(6000000)
+    fraction = 1079 / 360  # DAYS360(2025-01-13, 2028-01-12)
+    assert result.coupon_cashflow == pytest.approx(7500000 * 0.07 * fraction)
+    assert result.borrowing_cost == pytest.approx(6000000 * result.total_borrowing_cost * fraction)
+    assert result.net_yield_pa == pytest.approx(
+        (result.coupon_cashflow - result.borrowing_cost) / (PARAMS.equity * result.term_years))
+    assert result.xirr.converged
+
+def test_price_notes_matches_price_note():
+    params_list = [PARAMS, NoteParams(trade_date=date(2025, 1, 6), tenor_years=5.0, coupon_freq='At Maturity')]
+    for batched, params in zip(price_notes(params_list), params_list):
+        single = price_note(params)
+        assert batched.net_yield_pa == single.net_yield_pa
+        assert batched.xirr.rate == pytest.approx(single.xirr.rate, abs=1e-9)
+
+def test_required_coupon_rate_reprices_to_the_target():
+    rate, _ = required_coupon_rate(price_note(PARAMS), 0.12)
+    repriced = price_note(NoteParams(**{**PARAMS.__dict__, 'coupon_rate': rate}))
+    assert repriced.net_yield_pa == pytest.approx(0.12)
@@ -0,0 +1,86 @@
+import shutil
+import threading
+
+import pytest
+
+from net_yield_engine.rates import (
+    RATE_INDEX_PATH,
+    RateIndex,
+    RateIndexLookupError,
+    RateIndexSource,
+    compile_rate_index_snapshot,
+    load_rate_index_snapshot,
+    read_rate_index_file,
+)
+
+def row(floating_ref, tenor, price, custodian='DB', cof=0.001, swap=0.0005, spread=0.006):
+    return {'Floating Ref': floating_ref, 'M': tenor, 'LAST_PRICE': price, 'Custodian': custodian,
+            'CoF v SOFR': cof, 'Swap Cost': swap, 'Loan Spread': spread}
+
+ROWS = [
+    row('1M', 1.0, 0.040),
+    row('3M', 3.0, 0.041),
+    row(None, 3.0, 0.099, custodian='SG', spread=0.009),
+    row(None, 12.0, 0.044),
+    row('12M', 12.0, 0.045, custodian='SG', spread=0.008),
+]
+
+def test_lookups_return_the_first_matching_row():
+    index = RateIndex(ROWS)
+    assert index.row_for_tenor(3)['LAST_PRICE'] == 0.041
+    assert index.row_for_custodian_tenor('SG', 3)['Loan Spread'] == 0.009
+    components = index.borrowing_components('1M', 12, 'SG')
+    assert components.st_reference_rate == 0.040
+    assert components.tenor_last_price == 0.044
+    assert components.bank_spread == 0.008
+
+def test_lookups_raise_for_missing_rows():
+    index = RateIndex(ROWS)
+    with pytest.raises(RateIndexLookupError):
+        index.row_for_floating_ref('6M')
+    with pytest.raises(RateIndexLookupError):
+        index.borrowing_components('1M', 3, 'CAI')
+    with pytest.raises(RateIndexLookupError):
+        index.borrowing_components('1M', 6, 'DB')
+
+def test_version_follows_the_rows():
+    assert RateIndex(ROWS) == RateIndex(list(ROWS))
+    assert RateIndex(ROWS).version != RateIndex(ROWS[:-1]).version
+
+def test_missing_tenors_are_interpolated_only_when_asked():
+    index = RateIndex(ROWS)
+    components = index.borrowing_components('1M', 6, 'DB', 'linear')
+    assert components.tenor_last_price == pytest.approx(0.041 + (0.044 - 0.041) / 3)
+    assert components.bank_spread == pytest.approx(0.006)
+    assert index.borrowing_components('1M', 3, 'DB', 'linear').tenor_last_price == 0.041
+
+def test_snapshot_round_trips_the_rate_index(tmp_path):
+    snapshot = compile_rate_index_snapshot(RATE_INDEX_PATH, tmp_path)
+    assert compile_rate_index_snapshot(RATE_INDEX_PATH, tmp_path) == snapshot
+    index = RateIndex.from_records(load_rate_index_snapshot(snapshot))
+    assert index.rows == read_rate_index_file(RATE_INDEX_PATH)
+    assert index.version == RateIndex(read_rate_index_file(RATE_INDEX_PATH)).version
+
+def test_source_reloads_when_the_file_changes(tmp_path):
+    path = tmp_path / 'rates.csv'
+    shutil.copy(RATE_INDEX_PATH, path)
+    source = RateIndexSource(path, tmp_path / 'snapshots', check_interval=0)
+    first = source.current()
+    assert source.current() is first
+    with open(path) as handle:
+        text = handle.read()
+    path.write_text(text.replace('0.0065', '0.0075'))
+    reloaded = source.current()
+    assert reloaded.version != first.version
+    assert reloaded.row_for_custodian_tenor('Barc', 1)['Loan Spread'] == 0.0075
+    assert (source.cache_info().hits, source.cache_info().misses) == (1, 2)
+
+def test_source_counts_every_lookup_across_threads(tmp_path):
+    source = RateIndexSource(RATE_INDEX_PATH, tmp_path, check_interval=60)
+    threads = [threading.Thread(target=lambda: [source.current() for _ in range(2000)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = source.cache_info()
+    assert (info.hits + info.misses, info.misses) == (16000, 1)
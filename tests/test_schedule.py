@@ -0,0 +1,79 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from net_yield_engine.schedule import aggregate_schedule, build_cashflow_schedule
+
+def baseline_schedule(equity, loan_notional, total_invested, interest_rate, coupon_rate, start, end,
+                      interest_months, coupon_months):
+    """The original app's loop: relativedelta payment dates and (date_diff)/360 accruals"""
+    def payment_dates(months):
+        dates = []
+        while months is not None:
+            current = start + relativedelta(months=(len(dates) + 1) * months)
+            if current >= end:
+                break
+            dates.append(current)
+        return dates
+
+    interest_dates = payment_dates(interest_months)
+    coupon_dates = payment_dates(coupon_months)
+    rows = [(start, -equity, 0.0, 0.0)]
+    last_interest = last_coupon = start
+    for day in sorted(set(interest_dates + coupon_dates + [end])):
+        interest = coupon = 0.0
+        if day in interest_dates or day == end:
+            interest = -loan_notional * interest_rate * (day - last_interest).days / 360
+            last_interest = day
+        if day in coupon_dates or day == end:
+            coupon = total_invested * coupon_rate * (day - last_coupon).days / 360
+            last_coupon = day
+        rows.append((day, equity if day == end else 0.0, interest, coupon))
+    return rows
+
+@pytest.mark.parametrize('interest_freq, interest_months, coupon_freq, coupon_months', [
+    ('Quarterly', 3, 'Annual', 12),
+    ('Semi-Annual', 6, 'Quarterly', 3),
+    ('Annual', 12, 'At Maturity', None),
+])
+@pytest.mark.parametrize('start, end', [
+    (date(2025, 1, 13), date(2028, 1, 12)),
+    (date(2024, 8, 31), date(2027, 2, 27)),
+])
+def test_schedule_matches_the_original_loop(interest_freq, interest_months, coupon_freq, coupon_months, start, end):
+    schedule = build_cashflow_schedule(1500000, 6000000, 7500000, 0.05, 0.07, start, end,
+                                       interest_freq, coupon_freq)
+    expected = baseline_schedule(1500000, 6000000, 7500000, 0.05, 0.07, start, end,
+                                 interest_months, coupon_months)
+    assert schedule.dates.tolist() == [row[0] for row in expected]
+    np.testing.assert_allclose(schedule.principal, [row[1] for row in expected])
+    np.testing.assert_allclose(schedule.interest, [row[2] for row in expected])
+    np.testing.assert_allclose(schedule.coupon, [row[3] for row in expected])
+    np.testing.assert_allclose(schedule.total, schedule.principal + schedule.interest + schedule.coupon)
+
+def test_unknown_frequency_raises():
+    with pytest.raises(ValueError):
+        build_cashflow_schedule(1, 1, 2, 0.05, 0.07, date(2025, 1, 1), date(2026, 1, 1), 'Weekly', 'Annual')
+
+@pytest.mark.parametrize('period, months', [('Quarter', 3), ('Year', 12)])
+def test_aggregate_schedule_sums_by_calendar_period(period, months):
+    schedule = build_cashflow_schedule(1500000, 6000000, 7500000, 0.05, 0.07, date(2024, 11, 15), date(2028, 2, 14),
+                                       'Quarterly', 'Semi-Annual')
+    summary = aggregate_schedule(schedule, period)
+    buckets = [(day.year * 12 + day.month - 1) // months for day in schedule.dates.tolist()]
+    distinct = sorted(set(buckets))
+    assert summary.period_start.tolist() == [date(bucket * months // 12, bucket * months % 12 + 1, 1)
+                                             for bucket in distinct]
+    assert summary.rows.sum() == len(schedule)
+    for column in ('principal', 'interest', 'coupon', 'total'):
+        values = getattr(schedule, column)
+        expected = [sum(value for value, bucket in zip(values, buckets) if bucket == key) for key in distinct]
+        np.testing.assert_allclose(getattr(summary, column), expected)
+    assert summary.cumulative[-1] == pytest.approx(schedule.total.sum())
+
+def test_aggregate_schedule_rejects_unknown_periods():
+    schedule = build_cashflow_schedule(1, 1, 2, 0.05, 0.07, date(2025, 1, 1), date(2026, 1, 1), 'Annual', 'Annual')
+    with pytest.raises(ValueError):
+        aggregate_schedule(schedule, 'Month')
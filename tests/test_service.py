@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from net_yield_engine.service import PricingService, RequestBatcher, price_requests, xirr_requests
+
+VALID = {'trade_date': '2025-01-06', 'coupon_rate': 0.07, 'ltv': 0.8}
+
+def test_price_requests_isolates_bad_items():
+    results = price_requests([VALID, 5, dict(VALID, tenor_years=1e300), dict(VALID, tenor_years='x'), VALID])
+    assert 'error' not in results[0] and 'error' not in results[4]
+    assert results[0] == results[4]
+    assert all('error' in result for result in results[1:4])
+
+def test_xirr_requests_isolates_bad_items():
+    good = {'dates': ['2025-01-01', '2026-01-01'], 'cashflows': [-100.0, 110.0]}
+    results = xirr_requests([good, 'junk', {'dates': ['2025-01-01'], 'cashflows': [1.0, 2.0]}, good])
+    assert results[0]['xirr'] == pytest.approx(0.1, abs=1e-3)
+    assert 'error' in results[1] and 'error' in results[2]
+    assert results[3] == results[0]
+
+def test_batcher_keeps_valid_requests_when_one_item_is_bad():
+    async def run():
+        with ThreadPoolExecutor(1) as executor:
+            batcher = RequestBatcher(executor, price_requests, window=0.01)
+            return await asyncio.gather(batcher.submit(VALID), batcher.submit(dict(VALID, tenor_years=1e300)),
+                                        batcher.submit(VALID))
+
+    first, bad, last = asyncio.run(run())
+    assert 'error' not in first and 'error' not in last
+    assert 'error' in bad
+
+def test_batcher_fails_every_request_when_the_batch_fails():
+    def broken(requests):
+        raise RuntimeError("worker died")
+
+    async def run():
+        with ThreadPoolExecutor(1) as executor:
+            batcher = RequestBatcher(executor, broken, window=0.01)
+            return await asyncio.gather(batcher.submit({}), batcher.submit({}), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(run()))
+
+def test_route_rejects_non_object_items_before_queueing():
+    service = PricingService(processes=0)
+    try:
+        status, results = asyncio.run(service._route('POST', '/price', b'[5, {"trade_date": "2025-01-06"}]'))
+    finally:
+        service.close()
+    assert status == 200
+    assert 'error' in results[0]
+    assert 'error' not in results[1]
+
+def test_repeated_price_requests_are_answered_from_the_cache():
+    service = PricingService(processes=0)
+    try:
+        first = asyncio.run(service._route('POST', '/price', b'{"trade_date": "2025-01-06"}'))
+        second = asyncio.run(service._route('POST', '/price', b'{"trade_date": "2025-01-06"}'))
+        with_schedule = asyncio.run(service._route('POST', '/price',
+                                                   b'{"trade_date": "2025-01-06", "include_schedule": true}'))
+        stats = service.cache.stats()
+    finally:
+        service.close()
+    assert first == second
+    assert 'schedule' in with_schedule[1]
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert service.metrics.snapshot()['cache']['hits'] == 1
+
+def test_price_errors_are_not_cached():
+    body = b'{"financing_tenor": 37, "rate_interpolation": "none"}'
+    service = PricingService(processes=0)
+    try:
+        for _ in range(2):
+            status, result = asyncio.run(service._route('POST', '/price', body))
+            assert status == 400 and 'error' in result
+    finally:
+        service.close()
+    assert len(service.cache) == 0
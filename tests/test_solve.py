@@ -0,0 +1,42 @@
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.pricer import NoteParams, price_note
+from net_yield_engine.rates import RateIndex, default_rate_index
+from net_yield_engine.solve import solve_required
+
+NOTES = [NoteParams(trade_date=date(2025, 1, 6), coupon_rate=0.07, ltv=0.8),
+         NoteParams(trade_date=date(2025, 1, 6), tenor_years=5.0, interest_freq='Semi-Annual',
+                    coupon_freq='At Maturity', asset_daycount='ACT/ACT', liability_daycount='A/360')]
+TARGETS = [0.08, 0.15]
+
+def test_required_coupon_round_trips_through_price_note():
+    for target in ('xirr', 'net_yield_pa'):
+        solved = solve_required(NOTES, TARGETS, 'coupon_rate', target)
+        for params, rates in zip(NOTES, solved):
+            for goal, rate in zip(TARGETS, rates):
+                result = price_note(replace(params, coupon_rate=float(rate)))
+                achieved = result.xirr.rate if target == 'xirr' else result.net_yield_pa
+                assert achieved == pytest.approx(goal, abs=1e-7)
+
+def test_required_ltv_round_trips_through_price_note():
+    solved = solve_required(NOTES[0], TARGETS, 'ltv', 'xirr')
+    for goal, ltv in zip(TARGETS, solved):
+        assert 0 <= ltv < 1
+        assert price_note(replace(NOTES[0], ltv=float(ltv))).xirr.rate == pytest.approx(goal, abs=1e-7)
+
+def test_required_spread_round_trips_through_the_rate_index():
+    params = NOTES[0]
+    spread = float(solve_required(params, 0.1, 'borrowing_spread', 'net_yield_pa')[0])
+    rows = [dict(row, **{'Loan Spread': row['Loan Spread'] + spread}) if row['Custodian'] == params.lender else row
+            for row in default_rate_index().rows]
+    assert price_note(params, RateIndex(rows)).net_yield_pa == pytest.approx(0.1, abs=1e-9)
+
+def test_unpriceable_notes_and_bad_arguments():
+    solved = solve_required([NOTES[0], replace(NOTES[0], coupon_freq='Weekly')], TARGETS)
+    assert np.isfinite(solved[0]).all() and np.isnan(solved[1]).all()
+    with pytest.raises(ValueError):
+        solve_required(NOTES, TARGETS, 'equity')
@@ -0,0 +1,47 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.pricer import NoteParams, price_note
+from net_yield_engine.sweep import SweepGrid, price_grid, run_sweep
+
+BASE = NoteParams(trade_date=date(2025, 1, 6))
+AXES = {'ltv': [0.5, 0.7, 0.9], 'lender': ['CAI', 'DB'], 'financing_tenor': [12, 37]}
+
+def test_grid_points_are_in_c_order():
+    grid = SweepGrid(BASE, AXES)
+    assert len(grid) == 12
+    params = grid.params(5, 7)
+    assert (params[0].ltv, params[0].lender, params[0].financing_tenor) == (0.7, 'CAI', 37)
+    assert (params[1].ltv, params[1].lender, params[1].financing_tenor) == (0.7, 'DB', 12)
+
+def test_unknown_axes_raise():
+    with pytest.raises(ValueError):
+        SweepGrid(BASE, {'leverage': [1, 2]})
+
+def test_run_sweep_matches_price_note_across_chunks():
+    table = run_sweep(BASE, AXES, processes=1, chunk_size=5)
+    assert table['point'].tolist() == list(range(12))
+    assert table['priced'].all()
+    for point in (0, 7, 11):
+        params = SweepGrid(BASE, AXES).params(point, point + 1)[0]
+        assert table['net_yield_pa'][point] == price_note(params).net_yield_pa
+        assert table['xirr'][point] == pytest.approx(price_note(params).xirr.rate, abs=1e-9)
+
+def test_unpriceable_points_do_not_fail_the_sweep():
+    table = run_sweep(NoteParams(trade_date=date(2025, 1, 6), rate_interpolation=None),
+                      {'financing_tenor': [12, 37]}, processes=1)
+    assert table['priced'].tolist() == [True, False]
+    assert np.isnan(table['xirr'][1]) and table['error'][1].startswith('RateIndexLookupError')
+
+def test_price_grid_is_shaped_like_the_grid_and_matches_run_sweep():
+    axes = {'ltv': [0.5, 0.7, 0.9], 'coupon_rate': [0.04, 0.06], 'financing_tenor': [12, 37]}
+    base = NoteParams(trade_date=date(2025, 1, 6), rate_interpolation=None)
+    grid = price_grid(base, axes)
+    table = run_sweep(base, axes, processes=1)
+    assert grid.names == list(axes) and grid.xirr.shape == (3, 2, 2)
+    np.testing.assert_array_equal(grid.priced.ravel(), table['priced'])
+    np.testing.assert_array_equal(grid.net_yield_pa.ravel(), table['net_yield_pa'])
+    np.testing.assert_allclose(grid.xirr.ravel(), table['xirr'], atol=1e-10, equal_nan=True)
+    assert not grid.priced[:, :, 1].any()
@@ -0,0 +1,62 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from net_yield_engine.xirr import calculate_xirr, pad_ragged, solve_xirr, solve_xirr_batch, solve_xirr_ragged
+
+PERIODS = [np.array([0.0, 0.5, 1.0]), np.array([0.0, 1.0]), np.array([0.0, 0.25, 0.5, 0.75, 1.0])]
+CASHFLOWS = [np.array([-100.0, 4.0, 104.0]), np.array([-100.0, 112.0]), np.array([-50.0, 1.0, 1.0, 1.0, 51.0])]
+
+def test_pad_ragged_accepts_a_slice_of_offsets():
+    values = np.arange(10.0)
+    offsets = np.array([0, 2, 5, 6, 10])
+    np.testing.assert_array_equal(pad_ragged(values, offsets[1:4], fill=-1),
+                                  [[2.0, 3.0, 4.0], [5.0, -1.0, -1.0]])
+    np.testing.assert_array_equal(pad_ragged(values, offsets)[3], [6.0, 7.0, 8.0, 9.0])
+
+def test_batched_solvers_match_the_scalar_solver():
+    expected = [solve_xirr(periods, cashflows).rate for periods, cashflows in zip(PERIODS, CASHFLOWS)]
+    offsets = np.cumsum([0] + [len(periods) for periods in PERIODS])
+    ragged = solve_xirr_ragged(np.concatenate(PERIODS), np.concatenate(CASHFLOWS), offsets)
+    batch = solve_xirr_batch(pad_ragged(np.concatenate(PERIODS), offsets),
+                             pad_ragged(np.concatenate(CASHFLOWS), offsets))
+    np.testing.assert_allclose(ragged.rates, expected, atol=1e-9)
+    np.testing.assert_allclose(batch.rates, expected, atol=1e-9)
+    assert ragged.converged.all()
+
+def test_ragged_rows_of_a_sliced_buffer_match_the_whole():
+    offsets = np.cumsum([0] + [len(periods) for periods in PERIODS])
+    periods, cashflows = np.concatenate(PERIODS), np.concatenate(CASHFLOWS)
+    whole = solve_xirr_ragged(periods, cashflows, offsets)
+    tail = solve_xirr_ragged(periods, cashflows, offsets[1:])
+    np.testing.assert_allclose(tail.rates, whole.rates[1:])
+
+def test_short_schedules_are_not_solved():
+    result = solve_xirr_ragged([0.0, 0.0, 1.0], [-100.0, -100.0, 110.0], [0, 1, 3])
+    assert np.isnan(result.rates[0]) and not result.converged[0]
+    assert result.rates[1] == pytest.approx(0.1)
+
+def baseline_npv(rate, dates, cashflows):
+    """NPV as the original app's XIRR defined it (days / 365.25 from the first date)"""
+    return sum(cashflow / (1 + rate) ** ((day - dates[0]).days / 365.25) for day, cashflow in zip(dates, cashflows))
+
+def test_calculate_xirr_zeroes_the_baseline_npv():
+    dates = [date(2025, 1, 6), date(2025, 7, 6), date(2026, 1, 6), date(2027, 3, 1)]
+    cashflows = [-1000.0, 30.0, 30.0, 1100.0]
+    result = calculate_xirr(dates, cashflows, full_output=True)
+    assert result.converged and result.method == 'newton'
+    assert baseline_npv(result.rate, dates, cashflows) == pytest.approx(0.0, abs=1e-6)
+
+def test_solve_xirr_falls_back_to_brent_when_newton_fails():
+    # A deep loss pushes Newton from the 10% guess below -99%
+    periods = np.array([0.0, 0.1, 3.0])
+    cashflows = np.array([-100.0, 1.0, 0.5])
+    result = solve_xirr(periods, cashflows)
+    assert result.converged and result.method == 'brent'
+    npv = (cashflows * (1 + result.rate) ** -periods).sum()
+    assert npv == pytest.approx(0.0, abs=1e-6)
+
+def test_calculate_xirr_without_enough_cash_flows():
+    assert calculate_xirr([date(2025, 1, 6)], [-100.0]) == 0.0
+    assert calculate_xirr([date(2025, 1, 6), date(2026, 1, 6)], [-100.0, 1.0, 2.0]) == 0.0